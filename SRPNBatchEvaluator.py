@@ -0,0 +1,250 @@
+import numpy as np
+
+from SRPNCompiler import SRPNCompiler, PUSH, OPERATE, RAISE
+from SRPNRandom import SRPNRandom
+import saturatedArithmetic
+
+# | The kinds of error which are recorded per row, rather than printed.
+ERRORS = ("overflow", "underflow", "empty", "divideByZero", "negativePower")
+
+# | SRPNBatchResult
+# |----------------------------------------------------------------------
+# | The result of evaluating a program over a batch of rows. Holds the
+# | final stack of every row, everything each row would've printed,
+# | and a mask for each kind of error of the rows which hit it.
+# |---------------------------------------------------
+class SRPNBatchResult:
+
+    def __init__(self, stack, outputs, errors, failed, exited):
+        # | The final stack of each row, from the bottom up, as a (rows, depth) array.
+        self.stack = stack
+
+        # | An array for each '=' (of shape (rows, 1)) or 'd' (of shape (rows, depth)), in order.
+        self.outputs = outputs
+
+        # | A boolean mask over the rows for each kind of error in ERRORS.
+        self.errors = errors
+
+        # | Rows whose stack went a different way to the rest after a divide by 0 or negative
+        # | power. The values in these rows aren't what that row would've produced alone.
+        self.failed = failed
+
+        # | Whether the program ended with a '£'.
+        self.exited = exited
+
+# | SRPNBatchEvaluator
+# |------------------------------------------------------------------------
+# | Evaluates one program over many independent sets of operands at once,
+# | using numpy int64 saturating kernels. Each row of operands is the
+# | initial stack of a fresh session, which is then run through the
+# | same program as if by SRPNInputParser.execute().
+# |------------------------------------------
+class SRPNBatchEvaluator:
+
+    def __init__(self, saturation, stackLimit=23):
+        # | Products of two saturated values must fit in an int64 without overflowing.
+        if saturation > 2 ** 31 - 1:
+            raise ValueError("Saturation must fit in a 32 bit integer to be evaluated in batches.")
+
+        self.saturation = saturation
+        self.stackLimit = stackLimit
+
+        self.compiler = SRPNCompiler(saturation)
+
+        self.kernels = {"+": self.add, "-": self.subtract, "*": self.multiply, "/": self.divide,
+                        "^": self.exponentiate, "%": self.mod}
+
+    # | compile()
+    # |------------------------------------------------------------------
+    # | Compiles a script, which may be made up of many lines, into a
+    # | single program which can be evaluated over a batch.
+    # |---------------------------------------------
+    def compile(self, script):
+        program = []
+        isCommenting = False
+
+        for line in script.split("\n"):
+            lineProgram, isCommenting = self.compiler.compile(line, isCommenting)
+            program.extend(lineProgram)
+
+        return tuple(program)
+
+    # | evaluate()
+    # |---------------------------------------------------------------------
+    # | Evaluates the program over every row of operands, a 2-D array of
+    # | shape (rows, operands) whose rows are pushed bottom first.
+    # |------------------------------------------------------
+    def evaluate(self, program, operands):
+        operands = np.asarray(operands, dtype=np.int64)
+
+        if operands.ndim != 2:
+            raise ValueError("Operands must be a 2-D array.")
+
+        rows = operands.shape[0]
+
+        self.stack = np.zeros((rows, self.stackLimit), dtype=np.int64)
+        self.depth = 0
+        self.outputs = []
+        self.errors = {kind: np.zeros(rows, dtype=bool) for kind in ERRORS}
+        self.failed = np.zeros(rows, dtype=bool)
+
+        # | Every row is a fresh session, so they all draw the same random numbers from the start.
+        random = SRPNRandom()
+
+        for column in operands.T:
+            self.push(column)
+
+        exited = False
+
+        for opcode, operand in program:
+            if opcode == PUSH:
+                self.push(np.full(rows, saturatedArithmetic.saturate(operand, self.saturation), dtype=np.int64))
+
+            elif opcode == OPERATE:
+                if operand in self.kernels:
+                    self.binaryOperation(self.kernels[operand])
+                elif operand == "=":
+                    self.equals()
+                elif operand == "d":
+                    self.outputs.append(self.stack[:, :self.depth].copy())
+                elif operand == "r":
+                    self.push(np.full(rows, random.next(), dtype=np.int64))
+                elif operand == "£":
+                    exited = True
+                    break
+
+            elif opcode == RAISE:
+                raise operand.with_traceback(None)
+
+        return SRPNBatchResult(self.stack[:, :self.depth].copy(), self.outputs, self.errors, self.failed, exited)
+
+    # | saturate()
+    # |-----------------------------------------------------------
+    # | Clamps every value in the array to the saturated range.
+    # |------------------------------------------------------
+    def saturate(self, values):
+        return np.clip(values, -self.saturation - 1, self.saturation)
+
+    # | push()
+    # |-------------------------------------------------------------
+    # | Pushes a column of values onto every row's stack, flagging
+    # | an overflow for every row if the stack's full.
+    # |-----------------------------------------
+    def push(self, values):
+        if self.depth >= self.stackLimit:
+            self.errors["overflow"][:] = True
+            return
+
+        self.stack[:, self.depth] = self.saturate(values)
+        self.depth += 1
+
+    # | binaryOperation()
+    # |--------------------------------------------------------------------
+    # | Pops the top two values off every row's stack and pushes the
+    # | result of the kernel, or flags an underflow for every row.
+    # |-----------------------------------------------------
+    def binaryOperation(self, kernel):
+        if self.depth < 2:
+            self.errors["underflow"][:] = True
+            return
+
+        operand1 = self.stack[:, self.depth - 1]
+        operand2 = self.stack[:, self.depth - 2]
+
+        result = kernel(operand1, operand2)
+
+        self.depth -= 2
+        self.push(result)
+
+    # | equals()
+    # |---------------------------------------------------------
+    # | Records the top value of every row's stack as output.
+    # |----------------------------------------------------
+    def equals(self):
+        if self.depth == 0:
+            self.errors["empty"][:] = True
+        else:
+            self.outputs.append(self.stack[:, self.depth - 1:self.depth].copy())
+
+    # | fail()
+    # |---------------------------------------------------------------
+    # | Flags the error for the rows in the mask, which from now on
+    # | no longer follow the rest of the batch.
+    # |-----------------------------------
+    def fail(self, kind, mask):
+        self.errors[kind] |= mask
+        self.failed |= mask
+
+    # | add()
+    # |-------------------------------------------------------------------
+    # | Kernel for '+'. Each kernel is given the top value (operand1) and
+    # | the one below it (operand2) of every row. Saturated values are
+    # | at most 2^31 in magnitude, so sums and products of them
+    # | fit in an int64 without overflowing.
+    # |---------------------------------
+    def add(self, operand1, operand2):
+        return self.saturate(operand1 + operand2)
+
+    # | subtract()
+    # |------------------
+    # | Kernel for '-'.
+    # |--------------
+    def subtract(self, operand1, operand2):
+        return self.saturate(operand2 - operand1)
+
+    # | multiply()
+    # |------------------
+    # | Kernel for '*'.
+    # |--------------
+    def multiply(self, operand1, operand2):
+        return self.saturate(operand1 * operand2)
+
+    # | divide()
+    # |---------------------------------------------------------
+    # | Kernel for '/', which truncates towards 0 as in C. Rows
+    # | dividing by 0 are flagged.
+    # |----------------------
+    def divide(self, operand1, operand2):
+        zero = operand1 == 0
+        self.fail("divideByZero", zero)
+
+        divisor = np.where(zero, 1, operand1)
+
+        quotient = np.abs(operand2) // np.abs(divisor)
+        return self.saturate(np.where((operand2 < 0) != (divisor < 0), -quotient, quotient))
+
+    # | mod()
+    # |------------------------------------------------------
+    # | Kernel for '%'. Rows taking a mod by 0 are flagged.
+    # |-------------------------------------------------
+    def mod(self, operand1, operand2):
+        zero = operand1 == 0
+        self.fail("divideByZero", zero)
+
+        return np.remainder(operand2, np.where(zero, 1, operand1))
+
+    # | exponentiate()
+    # |-------------------------------------------------------------------
+    # | Kernel for '^', using exponentiation by squaring. Magnitudes are
+    # | clamped to just beyond the saturated range so they can't
+    # | overflow, and once clamped can only stay there. Rows
+    # | raising to a negative power are flagged.
+    # |-------------------------------------
+    def exponentiate(self, operand1, operand2):
+        negative = operand1 < 0
+        self.fail("negativePower", negative)
+
+        exponent = np.where(negative, 0, operand1)
+        isNegative = (operand2 < 0) & (exponent % 2 == 1)
+
+        limit = self.saturation + 1
+        result = np.ones_like(operand2)
+        square = np.abs(operand2)
+
+        while exponent.any():
+            odd = (exponent & 1) == 1
+            result = np.where(odd, np.minimum(result * square, limit), result)
+            square = np.minimum(square * square, limit)
+            exponent = exponent >> 1
+
+        return self.saturate(np.where(isNegative, -result, result))
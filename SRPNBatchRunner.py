@@ -0,0 +1,60 @@
+from SRPNInputParser import SRPNInputParser
+from SRPNEvents import ConsoleSink
+import io
+import multiprocessing
+
+# | The parser each worker process reuses for every script it's given.
+workerParser = None
+
+# | initialiseWorker()
+# |--------------------------------------------------------------
+# | Creates the parser for a worker process when it's started.
+# |---------------------------------------------------------
+def initialiseWorker(saturation):
+    global workerParser
+    output = io.StringIO()
+    workerParser = SRPNInputParser(saturation, output=output, sink=ConsoleSink(output, exitOnExit=False))
+
+# | runScript()
+# |----------------------------------------------------------------------
+# | Runs a script as a new session on the given parser, returning its
+# | output. The script's lines are parsed in turn until a '£'. The
+# | parser's sink mustn't exit the process on the '£'.
+# |-----------------------------------------------------
+def runScript(script, parser):
+    parser.reset()
+
+    output = parser.output
+    output.seek(0)
+    output.truncate()
+
+    lines = script.split("\n")
+
+    # | A newline at the end of the script doesn't start another line.
+    if lines[-1] == "":
+        lines.pop()
+
+    for line in lines:
+        parser.parse(line)
+
+        if parser.hasExited:
+            break
+
+    return output.getvalue()
+
+# | runWorkerScript()
+# |-----------------------------------------------------
+# | Runs a script on the worker process's own parser.
+# |------------------------------------------------
+def runWorkerScript(script):
+    return runScript(script, workerParser)
+
+# | runMany()
+# |--------------------------------------------------------------------------
+# | Generator which runs each script as an independent session across a
+# | pool of worker processes, yielding the output of each in the order
+# | they were given. Scripts are sent to workers chunksize at a time.
+# |------------------------------------------------------------
+def runMany(scripts, workers=None, chunksize=16, saturation=2147483647):
+    with multiprocessing.Pool(workers, initializer=initialiseWorker, initargs=(saturation,)) as pool:
+        yield from pool.imap(runWorkerScript, scripts, chunksize)
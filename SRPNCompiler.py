@@ -0,0 +1,152 @@
+from SRPNTokenizer import SRPNTokenizer, NUMBER, OPERATOR, UNRECOGNISED as UNRECOGNISED_TOKEN, OPERATIONS, BULK_OPERATIONS,\
+                          REPEAT as REPEAT_KEYWORD
+from exceptions import BudgetExceededException
+import SRPNEvents
+
+# | The opcodes which make up a compiled program. Each instruction in a
+# | program is a tuple of (opcode, operand), where the operand is:
+# |   PUSH         - the integer value to push onto the stack
+# |   OPERATE      - the symbol of the operation to perform
+# |   UNRECOGNISED - the erroneous input to warn about
+# |   RAISE        - the exception raised while compiling the input
+# |   DEFINE       - a tuple of (name, body, program) defining a word
+# |   REPEAT       - a tuple of (count, symbol) of an operation to repeat
+# |   REPORT       - the error event to report
+PUSH = 0
+OPERATE = 1
+UNRECOGNISED = 2
+RAISE = 3
+DEFINE = 4
+REPEAT = 5
+REPORT = 6
+
+# | The number of tokens compiled between checks of the deadline, when there is one.
+DEADLINE_TOKENS = 1024
+
+# | SRPNCompiler
+# |------------------------------------------------------------------------
+# | Compiles a line of input into a program of opcodes and operands which
+# | can be run by SRPNInputParser.execute(). Compiling a line does all of
+# | the work of splitting, classifying and converting its items up front,
+# | so that running the program does none of it.
+# |
+# | If it's given the user-defined words, an input of the form
+# | ": name body ;" compiles to the definition of a word, and
+# | "repeat N name" to N calls of the operation name.
+# |-----------------------------------------------------------------
+class SRPNCompiler:
+
+    def __init__(self, saturation, largeStack=False):
+        self.saturation = saturation
+
+        # | Whether the bulk operations of the large stack profile are compiled.
+        self.largeStack = largeStack
+
+    # | compile()
+    # |---------------------------------------------------------------------
+    # | Compiles the input string into a program, given whether or not the
+    # | input starts inside a comment, and the names of the user-defined
+    # | words if they're allowed. Returns the program as a tuple of
+    # | instructions, along with whether the input ends in a comment.
+    # | If checkDeadline's given, it's called every DEADLINE_TOKENS
+    # | tokens (and while evaluating long infix fragments), and may
+    # | stop compiling by raising BudgetExceededException.
+    # |----------------------------------------------
+    def compile(self, inputString, isCommenting=False, words=None, checkDeadline=None):
+        if words is not None and not isCommenting and inputString.lstrip(" ").startswith(": "):
+            return self.compileDefinition(inputString, words, checkDeadline), False
+
+        tokenizer = SRPNTokenizer(self.saturation, isCommenting, words, self.largeStack, checkDeadline)
+        tokens = tokenizer.tokenize(inputString)
+        program = []
+
+        if checkDeadline is not None:
+            tokens = checkedTokens(tokens, checkDeadline)
+
+        # | Should tokenizing the input raise an exception, the program is ended with an instruction to
+        # | raise it. This means anything before the failure still runs, as it would've if interpreted.
+        try:
+            for kind, value in tokens:
+                if kind == NUMBER:
+                    program.append((PUSH, value))
+
+                elif kind == OPERATOR:
+                    if value == REPEAT_KEYWORD and words is not None:
+                        program.append(self.compileRepeat(tokens))
+                    else:
+                        program.append((OPERATE, value))
+
+                elif kind == UNRECOGNISED_TOKEN:
+                    program.append((UNRECOGNISED, value))
+
+                # | Comments are resolved by the tokenizer, so never need to be run.
+
+        # | Running out of time stops the whole line, rather than being raised when it's run.
+        except BudgetExceededException:
+            raise
+
+        except Exception as e:
+            program.append((RAISE, e))
+
+        return tuple(program), tokenizer.isCommenting
+
+    # | compileDefinition()
+    # |-------------------------------------------------------------------
+    # | Compiles an input of the form ": name body ;" into the program
+    # | which defines the word, with its body compiled up front. An
+    # | input which isn't a valid definition reports an error.
+    # |----------------------------------------------------
+    def compileDefinition(self, inputString, words, checkDeadline=None):
+        items = inputString.split()
+
+        if len(items) < 3 or items[-1] != ";":
+            return ((REPORT, SRPNEvents.UNTERMINATED_DEFINITION),)
+
+        name = items[1]
+
+        if not isWordName(name):
+            return ((REPORT, SRPNEvents.invalidWordName(name)),)
+
+        # | The body's compiled with the words as they are now, but calls the words it names
+        # | by their name, so it uses whatever they're defined as when it's run.
+        body = " ".join(items[2:-1])
+        program, _ = self.compile(body, False, words, checkDeadline)
+
+        return ((DEFINE, (name, body, program)),)
+
+    # | compileRepeat()
+    # |---------------------------------------------------------------------
+    # | Compiles the count and operation following a repeat keyword, taking
+    # | them from the tokens, into the instruction which repeats it.
+    # |-----------------------------------------------------------
+    def compileRepeat(self, tokens):
+        count = next(tokens, None)
+        operation = next(tokens, None)
+
+        if (count is None or count[0] != NUMBER or operation is None or operation[0] != OPERATOR
+                or operation[1] == REPEAT_KEYWORD):
+            return (REPORT, SRPNEvents.INVALID_REPEAT)
+
+        return (REPEAT, (count[1], operation[1]))
+
+# | checkedTokens()
+# |---------------------------------------------------------------
+# | Generator which yields the tokens, calling checkDeadline every
+# | DEADLINE_TOKENS of them.
+# |------------------------
+def checkedTokens(tokens, checkDeadline):
+    for count, token in enumerate(tokens, 1):
+        if count % DEADLINE_TOKENS == 0:
+            checkDeadline()
+
+        yield token
+
+# | isWordName()
+# |--------------------------------------------------------------------
+# | Returns whether or not the string can be the name of a word, which
+# | must be letters and digits, starting with a letter, and mustn't
+# | be the name of a built-in operation or the repeat keyword.
+# |---------------------------------------------------
+def isWordName(string):
+    return (string[0].isalpha() and string.isalnum() and string not in OPERATIONS and string not in BULK_OPERATIONS
+            and string != REPEAT_KEYWORD)
@@ -0,0 +1,224 @@
+from SRPNInputParser import SRPNInputParser
+from SRPNFileEvaluator import SRPNFileEvaluator
+from SRPNEvents import ConsoleSink, CollectingSink
+from collections import deque, namedtuple
+import random
+import sys
+import time
+
+# | The number of lines before a divergence which are kept to report it with.
+CONTEXT_LINES = 5
+
+# | The first point at which the engine being checked gave a different result to the reference:
+# |   - lineNumber, line: the line, counted from 1, which the results differed after.
+# |   - context: the (lineNumber, line) of the lines before it, oldest first.
+# |   - field: what differed, one of "output", "stack", "random", "exited", "commenting" or
+# |     "exception", if only the engine being checked raised one.
+# |   - reference, candidate: the differing values from each engine.
+Divergence = namedtuple("Divergence", ["lineNumber", "line", "context", "field", "reference", "candidate"])
+
+# | parseEngine()
+# |--------------------------------------------------------------
+# | Returns the compiled engine for the parser, parse() itself.
+# |---------------------------------------------------------
+def parseEngine(parser):
+    return parser.parse
+
+# | bytesEngine()
+# |------------------------------------------------------------------
+# | Returns the engine which runs each line as an SRPNFileEvaluator
+# | runs a script file, compiling it straight from its bytes.
+# |------------------------------------------------------
+def bytesEngine(parser):
+    evaluator = SRPNFileEvaluator(parser)
+
+    return lambda line: evaluator.evaluateChunk(line.encode("utf-8", "surrogateescape") + b"\n")
+
+# | The engines which can be checked against the reference interpreter, by name, each being a function
+# | returning the function which runs a line on the given parser.
+ENGINES = {"parse" : parseEngine, "bytes" : bytesEngine}
+
+# | SRPNDifferentialParser
+# |-----------------------------------------------------------------------
+# | A parser which runs every line through both the reference interpreter
+# | (SRPNInputParser.interpret()) and a faster engine, each with its own
+# | session, comparing their output, stacks, random numbers and comment
+# | and exit state after each line. The reference's output is the one
+# | emitted, so the session behaves as it always has. The first
+# | divergence is kept in self.divergence and written to the log,
+# | after which only the reference is run. The time each engine
+# | takes is totalled, to compare their speeds.
+# |
+# | The reference shares SRPNTokenizer, SRPNInfixEvaluator and
+# | helpers.literalValue() with the parse engine, so only the
+# | compiler, program cache and execute() are checked by it.
+# | A bug in tokenizing, infix or octal literals is made by
+# | both alike, and isn't found. The bytes engine splits and
+# | classifies plain lines itself, so that's checked too,
+# | though its operands still go through literalValue().
+# |----------------------------------------------
+class SRPNDifferentialParser:
+
+    def __init__(self, saturation, engine="parse", cacheSize=256, output=None, sink=None, largeStack=False,
+                 log=None):
+        self.saturation = saturation
+
+        # | The stream which the default sink prints to, or None for sys.stdout.
+        self.output = output
+
+        # | The sink which the reference's events are emitted to.
+        self.sink = ConsoleSink(output) if sink is None else sink
+
+        # | The stream divergences are written to, or None for sys.stderr.
+        self.log = log
+
+        self.engine = engine
+        self.reference = SRPNInputParser(saturation, cacheSize, sink=CollectingSink(), largeStack=largeStack)
+        self.candidate = SRPNInputParser(saturation, cacheSize, sink=CollectingSink(), largeStack=largeStack)
+        self.runCandidate = ENGINES[engine](self.candidate)
+
+        # | The lines run so far, the most recent of which are kept to give a divergence context.
+        self.lines = 0
+        self.context = deque(maxlen=CONTEXT_LINES)
+
+        # | The first divergence between the engines, or None if they've agreed so far.
+        self.divergence = None
+
+        # | The seconds each engine has spent running lines, while they've both been run.
+        self.referenceSeconds = 0.0
+        self.candidateSeconds = 0.0
+
+    # | hasExited
+    # |------------------------------------------------
+    # | Whether the session has been ended by a '£'.
+    # |--------------------------------------------
+    @property
+    def hasExited(self):
+        return self.reference.hasExited
+
+    # | parse()
+    # |-------------------------------------------------------------------
+    # | Runs the line through the reference and, until they've diverged,
+    # | the engine being checked, then emits the reference's events.
+    # |-------------------------------------------------------
+    def parse(self, inputString):
+        if self.hasExited:
+            return
+
+        self.lines += 1
+
+        start = time.perf_counter()
+        self.reference.interpret(inputString)
+        middle = time.perf_counter()
+
+        if self.divergence is None:
+            try:
+                self.runCandidate(inputString)
+            except Exception as e:
+                self.diverge(inputString, "exception", None, e)
+            else:
+                end = time.perf_counter()
+
+                self.referenceSeconds += middle - start
+                self.candidateSeconds += end - middle
+
+                self.compare(inputString)
+
+        self.context.append((self.lines, inputString))
+
+        events = self.reference.sink.events
+        self.reference.sink.events = []
+
+        for event in events:
+            self.sink.emit(event)
+
+    # | compare()
+    # |-----------------------------------------------------------------
+    # | Compares the state of the engines after the line, recording a
+    # | divergence if they differ.
+    # |---------------------------
+    def compare(self, inputString):
+        reference = self.reference
+        candidate = self.candidate
+
+        referenceEvents = reference.sink.events
+        candidateEvents = candidate.sink.events
+        candidate.sink.events = []
+
+        if referenceEvents != candidateEvents:
+            self.diverge(inputString, "output", referenceEvents, candidateEvents)
+
+        elif reference.stack.top != candidate.stack.top or (reference.stack.stack[:reference.stack.top]
+                                                            != candidate.stack.stack[:candidate.stack.top]):
+            self.diverge(inputString, "stack", reference.stack.stack[:reference.stack.top].tolist(),
+                         candidate.stack.stack[:candidate.stack.top].tolist())
+
+        elif reference.random.state() != candidate.random.state():
+            self.diverge(inputString, "random", reference.random.state()[:2], candidate.random.state()[:2])
+
+        elif reference.hasExited != candidate.hasExited:
+            self.diverge(inputString, "exited", reference.hasExited, candidate.hasExited)
+
+        # | Once a '£' has ended the session, the comment flag's never used again, so the engines needn't agree
+        # | on it (the interpreter stops at the '£', where the compiler has already moved it to the line's end).
+        elif reference.isCommenting != candidate.isCommenting and not reference.hasExited:
+            self.diverge(inputString, "commenting", reference.isCommenting, candidate.isCommenting)
+
+    # | diverge()
+    # |----------------------------------------------------------------
+    # | Records the divergence and writes it to the log. The engines'
+    # | states now differ, so the candidate isn't run any more.
+    # |-------------------------------------------------
+    def diverge(self, inputString, field, reference, candidate):
+        self.divergence = Divergence(self.lines, inputString, tuple(self.context), field, reference, candidate)
+        print(describe(self.divergence, self.engine), file=self.log if self.log is not None else sys.stderr)
+
+    # | speedRatio()
+    # |---------------------------------------------------------------
+    # | Returns how many times faster the engine being checked is than
+    # | the reference, over the lines both have run.
+    # |----------------------------------------
+    def speedRatio(self):
+        return self.referenceSeconds / self.candidateSeconds if self.candidateSeconds else 0.0
+
+    # | reset()
+    # |-----------------------------------------------------------------
+    # | Puts both engines back to the state of a new session, and starts
+    # | checking them against each other again.
+    # |-----------------------------------
+    def reset(self):
+        self.reference.reset()
+        self.candidate.reset()
+        self.lines = 0
+        self.context.clear()
+        self.divergence = None
+
+# | describe()
+# |-------------------------------------------------------------
+# | Returns a description of the divergence for the log, with the
+# | lines leading up to it.
+# |-------------------------
+def describe(divergence, engine):
+    lines = ["Divergence between interpret and " + engine + " in " + divergence.field + " after line "
+             + str(divergence.lineNumber) + ":"]
+
+    for lineNumber, line in divergence.context + ((divergence.lineNumber, divergence.line),):
+        lines.append("  %6d | %s" % (lineNumber, line))
+
+    lines.append("  reference: " + repr(divergence.reference))
+    lines.append("  " + engine + ": " + repr(divergence.candidate))
+
+    return "\n".join(lines)
+
+# | newSessionParser()
+# |-------------------------------------------------------------------------
+# | Returns the parser for a new session, which is an SRPNDifferentialParser
+# | checking the engine for one in every checkOneIn sessions, chosen at
+# | random, or a plain SRPNInputParser for the rest (and for every
+# | session if checkOneIn is 0).
+# |---------------------------
+def newSessionParser(saturation, checkOneIn=0, engine="parse", cacheSize=256, output=None, sink=None, log=None):
+    if checkOneIn and random.randrange(checkOneIn) == 0:
+        return SRPNDifferentialParser(saturation, engine, cacheSize, output, sink, log=log)
+
+    return SRPNInputParser(saturation, cacheSize, output=output, sink=sink)
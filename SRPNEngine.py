@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+from SRPNBatchRunner import runScript
+from SRPNInputParser import SRPNInputParser
+from SRPNEvents import ConsoleSink
+import io
+import threading
+
+# | Thread safety
+# |-------------------------------------------------------------------------
+# | All of the mutable state of a session - its stack, comment flag, random
+# | number generator, compiled program cache and output - belongs to its
+# | SRPNInputParser, and nothing is shared between parsers other than
+# | immutable tables and the infix evaluator's lru_cache, which is
+# | itself thread safe. So:
+# |   - Any number of SRPNEngines can be used from different threads at
+# |     once, without affecting each other.
+# |   - Each SRPNEngine serialises calls to its methods with a lock, so
+# |     one engine can be shared between threads, with lines from
+# |     different threads interleaving in the one session.
+# |   - A bare SRPNInputParser isn't thread safe, and must only be used
+# |     by one thread at a time.
+# |   - SRPNEngineExecutor.submit() runs each script as a new session
+# |     on an engine belonging to the worker thread which runs it.
+# |-------------------------------------------------------
+
+# | SRPNEngine
+# |-----------------------------------------------------------------------
+# | A calculator session for embedding as a library. Rather than being
+# | printed, the output of each call is returned as a string, or
+# | as a list of events by parseEvents().
+# |-------------------------------------------------
+class SRPNEngine:
+
+    def __init__(self, saturation=2147483647, cacheSize=256):
+        self.lock = threading.Lock()
+
+        output = io.StringIO()
+        self.parser = SRPNInputParser(saturation, cacheSize, output=output, sink=ConsoleSink(output, exitOnExit=False))
+
+    # | hasExited
+    # |------------------------------------------------
+    # | Whether the session has been ended by a '£'.
+    # |--------------------------------------------
+    @property
+    def hasExited(self):
+        return self.parser.hasExited
+
+    # | parse()
+    # |------------------------------------------------------------------
+    # | Parses a line of input in the session, returning its output. Once
+    # | the session's been ended by a '£', further lines are ignored.
+    # |--------------------------------------------------------
+    def parse(self, inputString):
+        with self.lock:
+            output = self.parser.output
+            output.seek(0)
+            output.truncate()
+
+            self.parser.parse(inputString)
+
+            return output.getvalue()
+
+    # | parseEvents()
+    # |--------------------------------------------------------------
+    # | Parses a line of input in the session, returning the events
+    # | (see SRPNEvents) it produced, with no text in between.
+    # |----------------------------------------------------
+    def parseEvents(self, inputString):
+        with self.lock:
+            return self.parser.parseEvents(inputString)
+
+    # | run()
+    # |-------------------------------------------------------------
+    # | Runs a script as a new session, returning its output. The
+    # | engine is left in the state the script finished in.
+    # |-----------------------------------------------
+    def run(self, script):
+        with self.lock:
+            return runScript(script, self.parser)
+
+    # | reset()
+    # |-----------------------------------------------
+    # | Puts the engine back to a new session.
+    # |----------------------------------------
+    def reset(self):
+        with self.lock:
+            self.parser.reset()
+
+# | SRPNEngineExecutor
+# |--------------------------------------------------------------------
+# | Runs scripts as independent sessions on a pool of threads. Each
+# | thread has an engine of its own, which is reset between scripts.
+# |-------------------------------------------------------
+class SRPNEngineExecutor:
+
+    def __init__(self, workers=None, saturation=2147483647):
+        self.saturation = saturation
+        self.executor = ThreadPoolExecutor(workers)
+
+        # | The engine belonging to each worker thread.
+        self.engines = threading.local()
+
+    # | submit()
+    # |-------------------------------------------------------------
+    # | Submits a script to be run, returning a Future of its output.
+    # |---------------------------------------------------------
+    def submit(self, script):
+        return self.executor.submit(self.runScript, script)
+
+    # | runScript()
+    # |---------------------------------------------------------
+    # | Runs the script on the current worker thread's engine.
+    # |----------------------------------------------------
+    def runScript(self, script):
+        engine = getattr(self.engines, "engine", None)
+
+        if engine is None:
+            engine = self.engines.engine = SRPNEngine(self.saturation)
+
+        return engine.run(script)
+
+    # | shutdown()
+    # |----------------------------------------------------------
+    # | Shuts down the pool of threads once its scripts are run.
+    # |------------------------------------------------------
+    def shutdown(self, wait=True):
+        self.executor.shutdown(wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.shutdown()
@@ -0,0 +1,92 @@
+from collections import namedtuple
+import sys
+
+# | The events a parser emits to its sink, in place of printing its results and messages:
+# |   - Value(value): the value printed by '='.
+# |   - StackDump(values): the values printed by 'd', from the bottom of the stack up.
+# |   - Error(kind, message): an error, such as Error("overflow", "Stack overflow.").
+# |   - Exit(): the calculator's been exited by a '£'.
+Value = namedtuple("Value", ["value"])
+StackDump = namedtuple("StackDump", ["values"])
+Error = namedtuple("Error", ["kind", "message"])
+Exit = namedtuple("Exit", [])
+
+# | The events which never change, so needn't be created each time they're emitted.
+OVERFLOW = Error("overflow", "Stack overflow.")
+UNDERFLOW = Error("underflow", "Stack underflow.")
+EMPTY = Error("empty", "Stack empty.")
+DIVIDE_BY_ZERO = Error("divideByZero", "Divide by 0.")
+NEGATIVE_POWER = Error("negativePower", "Negative power.")
+UNTERMINATED_DEFINITION = Error("definition", "Unterminated definition.")
+INVALID_REPEAT = Error("repeat", "Repeat needs a count and an operation.")
+WORD_DEPTH = Error("wordDepth", "Words nested too deeply.")
+WORD_STEPS = Error("wordSteps", "Word step limit reached.")
+LINE_STEPS = Error("lineSteps", "Line step budget exceeded.")
+LINE_TIME = Error("lineTime", "Line time budget exceeded.")
+SESSION_STEPS = Error("sessionSteps", "Session step budget exceeded.")
+SESSION_TIME = Error("sessionTime", "Session time budget exceeded.")
+EXIT = Exit()
+
+# | unrecognised()
+# |------------------------------------------------------------
+# | Returns the error event for an unrecognised item of input.
+# |-------------------------------------------------------
+def unrecognised(string):
+    return Error("unrecognised", "Unrecognised operator or operand \"" + string + "\".")
+
+# | invalidWordName()
+# |--------------------------------------------------------------
+# | Returns the error event for a definition with an invalid name.
+# |----------------------------------------------------------
+def invalidWordName(name):
+    return Error("definition", "Invalid word name \"" + name + "\".")
+
+# | ConsoleSink
+# |-----------------------------------------------------------------------
+# | The default sink, which prints each event as the calculator always
+# | has, to the output stream (or sys.stdout if it's None), and exits
+# | on an Exit. If exitOnExit is False, the Exit is left for the
+# | parser to end the session with instead.
+# |-------------------------------------------
+class ConsoleSink:
+
+    def __init__(self, output=None, exitOnExit=True):
+        self.output = output
+        self.exitOnExit = exitOnExit
+
+    # | emit()
+    # |------------------------------------
+    # | Prints the event to the output.
+    # |-------------------------------
+    def emit(self, event):
+        eventType = type(event)
+
+        if eventType is Value:
+            print(event.value, file=self.output)
+
+        elif eventType is Error:
+            print(event.message, file=self.output)
+
+        elif eventType is StackDump:
+            # | An empty stack prints nothing, not even a blank line.
+            if event.values:
+                print("\n".join(map(str, event.values)), file=self.output)
+
+        elif self.exitOnExit:
+            sys.exit()
+
+# | CollectingSink
+# |-------------------------------------------------------
+# | A sink which keeps each event emitted to it, in order.
+# |-------------------------------------------------
+class CollectingSink:
+
+    def __init__(self):
+        self.events = []
+
+    # | emit()
+    # |-----------------------------
+    # | Adds the event to the list.
+    # |------------------------
+    def emit(self, event):
+        self.events.append(event)
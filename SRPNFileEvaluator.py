@@ -0,0 +1,216 @@
+from SRPNCompiler import PUSH, OPERATE, UNRECOGNISED
+from SRPNProgramCache import SRPNProgramCache
+import helpers
+import mmap
+import os
+import time
+
+# | The operations as they're encoded in a UTF-8 script, by their symbols. The '#' is missing, as
+# | lines with comments are left to the parser.
+BYTE_OPERATIONS = {symbol.encode("utf-8"): symbol for symbol in ["+", "-", "*", "/", "^", "%", "=", "d", "r", "£"]}
+
+# | The size of the pieces a script with carriage returns is split into lines in.
+CHUNK_SIZE = 1 << 24
+
+# | Stands in the cache for a line which can't be compiled from bytes, so has to be parsed.
+PARSE = ()
+
+# | SRPNFileEvaluator
+# |--------------------------------------------------------------------------
+# | Runs very large script files through a parser. The file's memory mapped
+# | and its lines are found in place, as views of the mapping which aren't
+# | copied. Lines made up only of operators and plain operands are compiled
+# | straight from the bytes, with the program cached against them, so a
+# | line that's been seen before is looked up without being copied,
+# | decoded or tokenized.
+# | Any other line (such as one with a comment, an unrecognised item or
+# | operands stuck to operators) is decoded and given to parse(), so
+# | the output is the same as parsing every line would be.
+# |----------------------------------------------------
+class SRPNFileEvaluator:
+
+    def __init__(self, parser, cacheSize=4096, encoding="utf-8", errors="replace"):
+        self.parser = parser
+
+        # | The programs compiled from recent lines, keyed by their bytes.
+        self.cache = SRPNProgramCache(cacheSize)
+
+        # | How lines which have to be parsed are decoded.
+        self.encoding = encoding
+        self.errors = errors
+
+        # | Counters of the lines and bytes run so far, and the seconds they took.
+        self.lines = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    # | evaluateFile()
+    # |-----------------------------------------------------------------
+    # | Runs the lines of the script file, memory mapping it so it's
+    # | never read into memory as a whole, until the end of the
+    # | file or a '£'.
+    # |-------------------------
+    def evaluateFile(self, path):
+        with open(path, "rb") as file:
+            # | An empty file can't be memory mapped, but has no lines to run anyway.
+            if os.fstat(file.fileno()).st_size == 0:
+                return
+
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                self.evaluateBytes(data)
+
+    # | evaluateBytes()
+    # |-------------------------------------------------------------------
+    # | Runs the lines of a script given as bytes or an mmap. Its lines
+    # | are run in place, unless it has carriage returns, in which case
+    # | a large chunk of it at a time is copied and normalised.
+    # |-----------------------------------------------------
+    def evaluateBytes(self, data):
+        start = time.perf_counter()
+
+        try:
+            if data.find(b"\r") == -1:
+                with memoryview(data) as view:
+                    self.evaluateLines(findLines(data, view))
+
+                self.bytes += len(data)
+            else:
+                self.evaluateChunks(data)
+
+        finally:
+            self.seconds += time.perf_counter() - start
+
+    # | evaluateChunks()
+    # |----------------------------------------------------------------
+    # | Runs the lines of the script a large chunk of it at a time.
+    # |-----------------------------------------------------------
+    def evaluateChunks(self, data):
+        length = len(data)
+        position = 0
+
+        while position < length and not self.parser.hasExited:
+            chunk = data[position:position + CHUNK_SIZE]
+
+            # | Unless it's the last, the chunk ends at its last newline, with the rest left for the next one.
+            if position + len(chunk) < length:
+                end = chunk.rfind(b"\n") + 1
+
+                # | A line longer than a chunk is taken up to its end.
+                if end == 0:
+                    end = data.find(b"\n", position) + 1 or length
+                    chunk = data[position:end]
+                else:
+                    chunk = chunk[:end]
+
+            position += len(chunk)
+            self.bytes += len(chunk)
+
+            self.evaluateChunk(chunk)
+
+    # | evaluateChunk()
+    # |--------------------------------------------------------------
+    # | Runs each of the lines in a chunk of the script, which ends
+    # | either at a newline or at the end of the script.
+    # |---------------------------------------------
+    def evaluateChunk(self, chunk):
+        # | Line endings are read universally, as they are when a script's read as text.
+        if b"\r" in chunk:
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        lines = chunk.split(b"\n")
+
+        # | A newline at the end of the chunk doesn't start another line.
+        if lines[-1] == b"":
+            lines.pop()
+
+        self.evaluateLines(lines)
+
+    # | evaluateLines()
+    # |------------------------------------------------------------------
+    # | Runs each of the lines, given as bytes or as views of them. A
+    # | line's only copied if its program isn't cached, to compile it
+    # | and key the cache with, or if it has to be decoded and parsed.
+    # |--------------------------------------------------------
+    def evaluateLines(self, lines):
+        parser = self.parser
+        cache = self.cache
+
+        # | The parser's metrics are recorded by parse(), so every line is parsed if it has any.
+        canCompile = parser.metrics is None
+
+        for line in lines:
+            if parser.hasExited:
+                return
+
+            self.lines += 1
+            program = None
+
+            if canCompile and not parser.isCommenting:
+                # | A view hashes and compares as the bytes it shows, so finds the program cached against them.
+                program = cache.get(line, False)
+
+                if program is None:
+                    line = bytes(line)
+                    program = self.compileLine(line)
+                    cache.put(line, False, program)
+
+            if program is None or program is PARSE:
+                parser.parse(str(line, self.encoding, self.errors))
+            else:
+                parser.executeLine(program)
+
+    # | compileLine()
+    # |-------------------------------------------------------------------
+    # | Compiles a line, as bytes, whose items are all operators, plain
+    # | operands or empty into a program, or returns PARSE if it has
+    # | any other item, so must be parsed instead.
+    # |----------------------------------------
+    def compileLine(self, line):
+        program = []
+
+        for item in line.split(b" "):
+            symbol = BYTE_OPERATIONS.get(item)
+
+            if symbol is not None:
+                program.append((OPERATE, symbol))
+
+            elif item.isdigit() or (item[:1] == b"-" and item[1:].isdigit()):
+                value = helpers.literalValue(item.decode("ascii"))
+
+                if value is not None:
+                    program.append((PUSH, value))
+
+            # | Just as when it's parsed, an empty item (from a doubled space or an empty line) is unrecognised.
+            elif item == b"":
+                program.append((UNRECOGNISED, ""))
+
+            else:
+                return PARSE
+
+        return tuple(program)
+
+    # | throughput()
+    # |----------------------------------------------------------
+    # | Returns the megabytes of script run per second so far.
+    # |----------------------------------------------------
+    def throughput(self):
+        return self.bytes / 1e6 / self.seconds if self.seconds else 0.0
+
+# | findLines()
+# |-------------------------------------------------------------------
+# | Yields each of the lines of the data as a view of it, without the
+# | newline, found with find() so that none of them is copied. A
+# | newline at the end of the data doesn't start another line.
+# |------------------------------------------------------
+def findLines(data, view):
+    length = len(data)
+    position = 0
+
+    while position < length:
+        end = data.find(b"\n", position)
+
+        if end == -1:
+            end = length
+
+        yield view[position:end]
+        position = end + 1
@@ -0,0 +1,139 @@
+from bisect import bisect_right
+
+# | SRPNIncrementalEvaluator
+# |-------------------------------------------------------------------------
+# | Evaluates a script again and again as it's edited, as an editor does,
+# | without running it all each time. The parser's full state (stack,
+# | comment flag, random numbers and words) is checkpointed as a
+# | snapshot every interval lines. When the script changes, it's
+# | resumed from the nearest checkpoint before the first changed
+# | line, and once past the last changed line, is stopped as soon
+# | as its state matches a checkpoint from the run before, the
+# | rest of that run's output being used as it was.
+# |----------------------------------------------
+class SRPNIncrementalEvaluator:
+
+    def __init__(self, parser, interval=64):
+        self.parser = parser
+        self.interval = interval
+
+        # | The lines of the script last evaluated, and the events each of them produced.
+        self.lines = []
+        self.outputs = []
+
+        # | The snapshots of the parser's state before the line at each index, and after the last line.
+        self.checkpoints = {0: parser.snapshot()}
+        self.finalState = self.checkpoints[0]
+
+        # | The lines run, and those whose output was reused from the run before, by the last evaluation.
+        self.linesRun = 0
+        self.linesReused = 0
+
+    # | evaluate()
+    # |-----------------------------------------------------------------
+    # | Evaluates the script, given as a list of lines, returning the
+    # | list of the events each line produced. The parser's left in
+    # | the state the script finished in.
+    # |----------------------------------
+    def evaluate(self, lines):
+        lines = list(lines)
+        oldLines = self.lines
+        oldOutputs = self.outputs
+        oldCheckpoints = self.checkpoints
+        parser = self.parser
+
+        # | The changed lines are those between the lines the old and new scripts start and end with.
+        prefix = commonPrefix(oldLines, lines)
+        suffix = commonSuffix(oldLines, lines, prefix)
+
+        self.linesRun = 0
+        self.linesReused = len(lines)
+
+        if prefix == len(oldLines) == len(lines):
+            parser.restore(self.finalState)
+            return self.outputs
+
+        # | After the changed lines, each line's index in the new script is shift more than in the old.
+        shift = len(lines) - len(oldLines)
+        changeEnd = len(lines) - suffix
+
+        indices = sorted(oldCheckpoints)
+        start = indices[bisect_right(indices, prefix) - 1]
+
+        checkpoints = {index: oldCheckpoints[index] for index in indices if index <= start}
+        outputs = oldOutputs[:start]
+
+        parser.restore(checkpoints[start])
+        self.linesRun = 0
+
+        for index in range(start, len(lines) + 1):
+            state = None
+
+            # | Past the changes, the rest of the old run holds if the state's the same as it was at this line.
+            if index >= changeEnd and index - shift in oldCheckpoints:
+                state = parser.snapshot()
+
+                if state == oldCheckpoints[index - shift]:
+                    self.converge(index, shift, outputs, checkpoints)
+                    break
+
+            if index == len(lines):
+                self.finalState = state or parser.snapshot()
+                break
+
+            if index % self.interval == 0 and index not in checkpoints:
+                checkpoints[index] = state or parser.snapshot()
+
+            outputs.append(parser.parseEvents(lines[index]))
+            self.linesRun += 1
+
+        self.linesReused = len(lines) - self.linesRun
+
+        self.lines = lines
+        self.outputs = outputs
+        self.checkpoints = checkpoints
+
+        return outputs
+
+    # | converge()
+    # |------------------------------------------------------------------
+    # | Takes the output and checkpoints of the old run from the line at
+    # | which its state was matched onwards, moving them on by shift
+    # | lines, and restores the parser to the state it ended in.
+    # |----------------------------------------------------
+    def converge(self, index, shift, outputs, checkpoints):
+        outputs += self.outputs[index - shift:]
+
+        for oldIndex, state in self.checkpoints.items():
+            if oldIndex >= index - shift:
+                checkpoints[oldIndex + shift] = state
+
+        # | The old run's final state is kept, as the parser's left in it.
+        self.parser.restore(self.finalState)
+
+# | commonPrefix()
+# |-------------------------------------------------------------
+# | Returns the number of lines the two lists start with alike.
+# |---------------------------------------------------------
+def commonPrefix(first, second):
+    length = min(len(first), len(second))
+
+    for index in range(length):
+        if first[index] != second[index]:
+            return index
+
+    return length
+
+# | commonSuffix()
+# |------------------------------------------------------------------
+# | Returns the number of lines the two lists end with alike, not
+# | counting the first skip lines of either.
+# |--------------------------------------
+def commonSuffix(first, second, skip):
+    length = min(len(first), len(second)) - skip
+
+    for count in range(length):
+        if first[-1 - count] != second[-1 - count]:
+            return count
+
+    return length
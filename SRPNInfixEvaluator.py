@@ -0,0 +1,158 @@
+from functools import lru_cache
+import saturatedArithmetic
+
+# | The precedence of each infix operator, higher binding more tightly.
+PRECEDENCE = {"+": 1, "-": 1, "*": 2, "/": 2, "%": 2, "^": 3}
+
+# | Fragments longer than this aren't memoized, so the cache can't grow to hold huge inputs.
+MEMOIZE_LIMIT = 256
+
+# | The number of operands read between checks of the deadline, when there is one.
+DEADLINE_OPERANDS = 1024
+
+# | evaluateInfix()
+# |--------------------------------------------------------------------
+# | Returns the integer value of a fragment of input as an infix
+# | expression, saturated to the given value, or None if the
+# | fragment isn't a valid expression. The results for
+# | short fragments are memoized, while long ones are
+# | given checkDeadline (see evaluate()).
+# |-----------------------------------
+def evaluateInfix(fragment, saturation, checkDeadline=None):
+    if len(fragment) > MEMOIZE_LIMIT:
+        return evaluate(fragment, saturation, checkDeadline)
+
+    return memoizedEvaluate(fragment, saturation)
+
+@lru_cache(maxsize=4096)
+def memoizedEvaluate(fragment, saturation):
+    return evaluate(fragment, saturation)
+
+# | evaluate()
+# |--------------------------------------------------------------------------
+# | Evaluates the fragment using the shunting-yard algorithm. The fragment
+# | must be operands separated by single operators, with the first
+# | operand optionally signed. Operands with a leading 0 are octal,
+# | as they are when typed on their own. If checkDeadline's given,
+# | it's called every DEADLINE_OPERANDS operands, and may stop
+# | the evaluation by raising.
+# |------------------------------
+def evaluate(fragment, saturation, checkDeadline=None):
+    values = []
+    operators = []
+
+    length = len(fragment)
+    position = 0
+    operands = 0
+
+    while True:
+        operands += 1
+
+        if checkDeadline is not None and operands % DEADLINE_OPERANDS == 0:
+            checkDeadline()
+
+        # | Read an operand, which may be signed if it's the first in the fragment.
+        start = position
+
+        if position == 0 and position < length and fragment[position] in "+-":
+            position += 1
+
+        digitsStart = position
+
+        while position < length and fragment[position].isdigit():
+            position += 1
+
+        if position == digitsStart:
+            return None
+
+        value = operandValue(fragment, start, digitsStart, position)
+
+        if value is None:
+            return None
+
+        values.append(saturatedArithmetic.saturate(value, saturation))
+
+        if position == length:
+            break
+
+        # | Read the operator, applying any waiting operators which bind at least as tightly.
+        operator = fragment[position]
+        position += 1
+
+        if operator not in PRECEDENCE:
+            return None
+
+        while operators and bindsBefore(operators[-1], operator):
+            if not applyOperator(operators.pop(), values, saturation):
+                return None
+
+        operators.append(operator)
+
+    while operators:
+        if not applyOperator(operators.pop(), values, saturation):
+            return None
+
+    return values[0]
+
+# | operandValue()
+# |-----------------------------------------------------------------
+# | Returns the value of the operand between start and end, whose
+# | digits begin at digitsStart, or None if it's invalid octal.
+# |-------------------------------------------------------
+def operandValue(fragment, start, digitsStart, end):
+    base = 10
+
+    # | If the number is prefixed with a 0, it's to be considered an octal number
+    if fragment[digitsStart] == "0":
+        base = 8
+
+    try:
+        return int(fragment[start:end], base)
+    except ValueError:
+        return None
+
+# | bindsBefore()
+# |--------------------------------------------------------------------
+# | Returns whether the operator waiting on the stack should be applied
+# | before the incoming one. Powers are right associative.
+# |-------------------------------------------------
+def bindsBefore(waiting, incoming):
+    if incoming == "^":
+        return PRECEDENCE[waiting] > PRECEDENCE[incoming]
+
+    return PRECEDENCE[waiting] >= PRECEDENCE[incoming]
+
+# | applyOperator()
+# |-------------------------------------------------------------------
+# | Applies the operator to the top two values, replacing them with
+# | the saturated result. Returns False if the operation can't be
+# | performed, i.e. divide by 0 or a negative power.
+# |------------------------------------------
+def applyOperator(operator, values, saturation):
+    operand1 = values.pop()
+    operand2 = values.pop()
+
+    if operator == "+":
+        result = saturatedArithmetic.add(operand2, operand1, saturation)
+    elif operator == "-":
+        result = saturatedArithmetic.subtract(operand2, operand1, saturation)
+    elif operator == "*":
+        result = saturatedArithmetic.multiply(operand2, operand1, saturation)
+    elif operator == "/":
+        if operand1 == 0:
+            return False
+
+        result = saturatedArithmetic.divide(operand2, operand1, saturation)
+    elif operator == "%":
+        if operand1 == 0:
+            return False
+
+        result = saturatedArithmetic.mod(operand2, operand1, saturation)
+    else:
+        if operand1 < 0:
+            return False
+
+        result = saturatedArithmetic.power(operand2, operand1, saturation)
+
+    values.append(result)
+    return True
@@ -1,20 +1,71 @@
-from SRPNStack import SRPNStack
-from exceptions import StackOverflowException, StackUnderflowException, StackEmptyException
+from SRPNStack import SRPNStack, LEGACY_STACK_LIMIT
+from exceptions import SessionExitException, WordLimitException, BudgetExceededException
+from SRPNCompiler import SRPNCompiler, PUSH, OPERATE, UNRECOGNISED, RAISE, DEFINE, REPEAT, REPORT
+from SRPNProgramCache import SRPNProgramCache
+from SRPNTokenizer import SRPNTokenizer, NUMBER, OPERATOR, COMMENT
+from SRPNRandom import SRPNRandom
+from SRPNEvents import ConsoleSink, CollectingSink, Value, StackDump, EXIT
+import SRPNEvents
+import SRPNSnapshot
 import helpers
-import randomNumbers
-import sys
+import saturatedArithmetic
+import time
+from operator import length_hint
+
+# | The stack limit of the large stack profile.
+LARGE_STACK_LIMIT = 1 << 24
+
+# | The deepest words may be nested inside each other when they're run, which stops runaway recursion.
+MAX_WORD_DEPTH = 64
+
+# | The most steps (instructions of words, and calls made by repeats) a line may run.
+MAX_WORD_STEPS = 1000000
+
+# | The number of a line's instructions run between checks of its budgets, when it has any.
+BUDGET_SLICE = 1024
 
 # | SRPNInputParser
 # |------------------------------------------------------------------------
 # | Essentially an interpreter for the inputs for the calculator. Input
 # | can be given using the parse() function, which will handle the
 # | data in the appropriate manner according to the calculator.
+# | Results and messages are emitted as events (see SRPNEvents)
+# | to a sink, which by default prints them to the output. If
+# | allowWords is set, parse() also accepts definitions of
+# | words and repeats (see SRPNCompiler). If largeStack is
+# | set, the stack limit is far higher than the legacy 23
+# | (unless stackLimit is given) and the bulk operations
+# | sum, prod, min, max, dupn and dropn are added. Each
+# | line, and the session as a whole, can be given a
+# | budget of steps and seconds (see setBudgets()).
 # |--------------------------------------------------------
 class SRPNInputParser:
 
-    def __init__(self, saturation):
-        # | Create the stack using the saturation specified
-        self.stack = SRPNStack(saturation)
+    def __init__(self, saturation, cacheSize=256, output=None, metrics=None, sink=None, allowWords=False,
+                 largeStack=False, stackLimit=None, lineSteps=None, lineSeconds=None, sessionSteps=None,
+                 sessionSeconds=None):
+        self.saturation = saturation
+
+        # | The stream which the default sink prints to, or None for sys.stdout.
+        self.output = output
+
+        # | The sink which the events of each input are emitted to.
+        self.sink = ConsoleSink(output) if sink is None else sink
+
+        # | Whether the session's been ended by a '£', after which further inputs are ignored.
+        self.hasExited = False
+
+        # | The SRPNMetrics to record calls, latencies and errors into, or None to record nothing.
+        self.metrics = metrics
+
+        # | Whether the parser has the large stack profile.
+        self.largeStack = largeStack
+
+        if stackLimit is None:
+            stackLimit = LARGE_STACK_LIMIT if largeStack else LEGACY_STACK_LIMIT
+
+        # | Create the stack using the saturation and limit specified
+        self.stack = SRPNStack(saturation, stackLimit)
 
         # | A dictionary that contains the set of all available operations
         # | and the corresponding methods to perform the operation.
@@ -22,131 +73,587 @@ class SRPNInputParser:
                            "^" : self.exponentiate, "%" : self.mod, "=" : self.equals, "d" : self.d, "r" : self.r,
                            "£" : self.poundSign, "#" : self.comment}
 
+        if largeStack:
+            self.operations.update({"sum" : self.sumAll, "prod" : self.productAll, "min" : self.minimum,
+                                    "max" : self.maximum, "dupn" : self.duplicateN, "dropn" : self.dropN})
+
+        # | The number of items each operation pops, so that underflows can be found before it's
+        # | performed rather than by catching the exception it raises.
+        self.operandCounts = dict.fromkeys(self.operations, 0)
+        self.operandCounts.update(dict.fromkeys("+-*/^%", 2))
+
+        if largeStack:
+            self.operandCounts.update(dict.fromkeys(["sum", "prod", "min", "max", "dupn", "dropn"], 1))
+
+        # | The body of each user-defined word by its name, in the order they were first defined, or None if
+        # | words aren't allowed.
+        self.words = {} if allowWords else None
+
+        # | The number of words, from the first defined, which each word's body could name when it was compiled.
+        self.wordScopes = {}
+
+        # | How deeply the words being run are nested, and the steps run by the current line.
+        self.wordDepth = 0
+        self.wordSteps = 0
+
         # | Flag which keeps track of whether or not the current input is a comment.
         self.isCommenting = False
 
+        # | The generator of the random numbers pushed by 'r', which is separate for each parser.
+        self.random = SRPNRandom()
+
+        # | The compiler which turns each input into a program to be executed.
+        self.compiler = SRPNCompiler(saturation, largeStack)
+
+        # | A cache of the programs compiled for recent inputs, so repeated inputs needn't be compiled again.
+        self.cache = SRPNProgramCache(cacheSize)
+
+        # | The steps the current line has run, and the steps and seconds the session's used, against the budgets.
+        self.lineStepsUsed = 0
+        self.sessionStepsUsed = 0
+        self.sessionSecondsUsed = 0.0
+
+        # | The time by which the current line must finish, and the error to report if it doesn't.
+        self.deadline = None
+        self.deadlineError = None
+
+        # | The number of lines which have been stopped for going beyond a budget.
+        self.budgetsExceeded = 0
+
+        self.setBudgets(lineSteps, lineSeconds, sessionSteps, sessionSeconds)
+
+    # | setBudgets()
+    # |---------------------------------------------------------------------
+    # | Sets the most steps (instructions, including those of words, and
+    # | calls made by repeats) and seconds each line may take, and the
+    # | most the session may take in all, or None for no budget. A
+    # | line which goes beyond a budget is stopped where it is,
+    # | with the instructions it's run left in place, the rest
+    # | of it dropped, and a distinct error reported.
+    # |------------------------------------------------
+    def setBudgets(self, lineSteps=None, lineSeconds=None, sessionSteps=None, sessionSeconds=None):
+        self.lineSteps = lineSteps
+        self.lineSeconds = lineSeconds
+        self.sessionSteps = sessionSteps
+        self.sessionSeconds = sessionSeconds
+
+        # | Lines are only run in budgeted slices if there's a budget to keep to.
+        self.isBudgeted = not (lineSteps is None and lineSeconds is None and sessionSteps is None
+                               and sessionSeconds is None)
+
     # | parse()
-    # |--------------------------------------------
-    # | Parses the input string as an RPN input.
-    # |--------------------------------------
+    # |--------------------------------------------------------------------
+    # | Parses the input string as an RPN input. The input's compiled to a
+    # | program (or fetched from the cache if it's been seen recently)
+    # | which is then executed, giving the same result as
+    # | interpreting it item by item.
+    # |----------------------------------------------
     def parse(self, inputString):
-        # | Create a list out of the string, splitting on the spaces. This allows
-        # | expressions like "3 3 + =" to be inputted without the need for
-        # | splitting the separate elements onto different lines.
-        inputList = inputString.split(" ")
+        if self.hasExited:
+            return
 
-        # | Iterate through the list
-        for item in inputList:
+        self.wordSteps = 0
 
-            # | If we're in the middle of a comment and the comment isn't ending, just skip this iteration.
-            if self.isCommenting and item != "#":
-                continue
+        try:
+            if self.isBudgeted:
+                self.parseBudgeted(inputString)
+            elif self.metrics is None:
+                self.execute(self.compileInput(inputString))
+            else:
+                self.parseInstrumented(inputString)
 
-            # | If the item is an operation.
-            if item in self.operations:
-                self.performOperation(item)
+        # | A '£' ends the session, and with it the rest of the input.
+        except SessionExitException:
+            pass
 
-            # | If the item is an operand (i.e. positive or negative number).
-            elif item.isdigit() or helpers.isNegativeNumber(item):
-                self.pushOperand(item)
+        # | A word going beyond the limits abandons the rest of the input.
+        except WordLimitException as e:
+            self.reportError(e.error)
 
-            # | If we have operands that are 'stuck' to operators.
-            elif len(item) > 1:
-                self.parseNoSpaces(item)
+        # | As does going beyond a budget, which is counted as well.
+        except BudgetExceededException as e:
+            self.budgetsExceeded += 1
+            self.reportError(e.error)
 
-            # | If the item is totally foreign.
+    # | executeLine()
+    # |------------------------------------------------------------------
+    # | Runs a program compiled elsewhere as a line of input, just as
+    # | parse() runs the program it compiles. The comment flag isn't
+    # | changed, so the program mustn't start or end a comment.
+    # |-----------------------------------------------------
+    def executeLine(self, program):
+        if self.hasExited:
+            return
+
+        self.wordSteps = 0
+
+        try:
+            if self.isBudgeted:
+                self.parseBudgeted(None, program)
             else:
-                self.unrecognisedInput(item)
+                self.execute(program)
+        except SessionExitException:
+            pass
+        except WordLimitException as e:
+            self.reportError(e.error)
+        except BudgetExceededException as e:
+            self.budgetsExceeded += 1
+            self.reportError(e.error)
+
+    # | parseEvents()
+    # |-----------------------------------------------------------------
+    # | Parses the input string as parse() does, returning the list of
+    # | events it produced rather than emitting them to the sink.
+    # |--------------------------------------------------------
+    def parseEvents(self, inputString):
+        sink = self.sink
+        self.sink = CollectingSink()
+
+        try:
+            self.parse(inputString)
+            return self.sink.events
+        finally:
+            self.sink = sink
+
+    # | compileInput()
+    # |-------------------------------------------------------------------
+    # | Returns the program for the input string, from the cache if it's
+    # | there, and moves the comment flag on to the end of the input.
+    # | checkDeadline's given to the compiler (see compile()).
+    # |-------------------------------------------------
+    def compileInput(self, inputString, checkDeadline=None):
+        compiled = self.cache.get(inputString, self.isCommenting)
+
+        if compiled is None:
+            compiled = self.compiler.compile(inputString, self.isCommenting, self.words, checkDeadline)
+            self.cache.put(inputString, self.isCommenting, compiled)
+
+        program, self.isCommenting = compiled
 
-    # | parseNoSpaces()
-    # |---------------------------------------------------------------------------
-    # | Function which will parse an input which isn't able to be separated by
-    # | its spaces, separating into each element which can be parsed again.
+        return program
+
+    # | parseInstrumented()
+    # |------------------------------------------------------------------
+    # | Parses the input string as parse() does, recording the latency
+    # | of the line and each of its instructions into the metrics.
+    # |------------------------------------------------------
+    def parseInstrumented(self, inputString):
+        start = time.perf_counter()
+
+        try:
+            for instruction in self.compileInput(inputString):
+                self.executeInstrumented(instruction)
+        finally:
+            self.metrics.observeLine(time.perf_counter() - start)
+
+    # | executeInstrumented()
     # |----------------------------------------------------------------
-    def parseNoSpaces(self, item):
-        validString = ''
-        splitItem = []
-
-        # | Loop through each item and split into expressions which are either valid (and maybe infix) or invalid.
-        for character in item:
-            # | If the character isn't technically valid, append the validString and the invalid item to the list.
-            if not character.isdigit() and character not in self.operations:
-                splitItem.append(validString)
-                validString = ''
-                splitItem.append(character)
-
-            # | If the last character in the valid string is an operation and the new character to add
-            # | is also an operation, append the validString and the next operation to the list.
-            elif (len(validString) > 0) and (validString[-1] in self.operations and character in self.operations):
-
-                splitItem.append(validString)
-                validString = ''
-                splitItem.append(character)
+    # | Executes a single instruction, recording its latency against
+    # | its operation, or "push" for operands.
+    # |-------------------------------------
+    def executeInstrumented(self, instruction):
+        opcode, operand = instruction
+
+        if opcode == PUSH:
+            operation = "push"
+        elif opcode == OPERATE:
+            operation = operand
+        elif opcode == UNRECOGNISED:
+            operation = "unrecognised"
+        elif opcode == DEFINE:
+            operation = "define"
+        elif opcode == REPEAT:
+            operation = "repeat"
+        elif opcode == REPORT:
+            operation = "report"
+        else:
+            operation = "raise"
 
-            else:
-                validString += character
+        start = time.perf_counter()
 
-        splitItem.append(validString)
+        try:
+            self.execute((instruction,))
+        finally:
+            self.metrics.observeOperation(operation, time.perf_counter() - start)
+
+    # | parseBudgeted()
+    # |-------------------------------------------------------------------
+    # | Parses the input string as parse() does (or runs the program, if
+    # | one's given, as executeLine() does), a slice of instructions at
+    # | a time, checking the budgets before each slice and each word
+    # | or repeat. Raises BudgetExceededException if one's passed.
+    # |------------------------------------------------------
+    def parseBudgeted(self, inputString, program=None):
+        start = time.perf_counter()
+        self.lineStepsUsed = 0
+        self.startDeadline(start)
+
+        try:
+            # | Compiling's stopped as well if it runs out of time, in which case none of the line's run,
+            # | and the comment flag's left as it was.
+            if program is None:
+                program = self.compileInput(inputString, None if self.deadline is None else self.checkDeadline)
 
-        # | Try to evaluate any valid expressions as infix, but if the expression isn't valid (i.e. an exception
-        # | is raised when trying to evaluate it) we can just skip it - the next parse will catch it.
-        for i in range(len(splitItem)):
-            try:
-                splitItem[i] = str(int(eval(splitItem[i])))
+            for first in range(0, len(program), BUDGET_SLICE):
+                piece = program[first:first + BUDGET_SLICE]
 
-            # | This is a major bodge I know, so sorry to the person marking
-            except ValueError:
-                pass
-            except SyntaxError:
-                pass
-            except NameError:
-                pass
+                # | Only as much of the slice as the steps left allow is run, so a step budget's kept exactly.
+                allowed = min(len(piece), self.stepsLeft())
+                self.spendSteps(allowed)
 
-        # | Make the list a string, so it can be re-split during the next parse
-        splitItem = " ".join(splitItem)
-        self.parse(splitItem)
+                instructions = iter(piece if allowed == len(piece) else piece[:allowed])
 
-    # | pushOperand()
+                try:
+                    # | With metrics, each instruction's recorded as parseInstrumented() records it.
+                    if self.metrics is None:
+                        self.execute(instructions)
+                    else:
+                        for instruction in instructions:
+                            self.executeInstrumented(instruction)
+                finally:
+                    self.refundSteps(instructions)
+
+                if first + allowed < len(program):
+                    self.spendSteps(1)
+
+        finally:
+            seconds = time.perf_counter() - start
+
+            self.sessionStepsUsed += self.lineStepsUsed
+            self.sessionSecondsUsed += seconds
+            self.deadline = None
+
+            if self.metrics is not None:
+                self.metrics.observeLine(seconds)
+
+    # | startDeadline()
+    # |--------------------------------------------------------------------
+    # | Sets the time by which the line starting now must finish, being
+    # | whichever is sooner of its own budget and what's left of the
+    # | session's, or None if neither has a time budget.
+    # |--------------------------------------------
+    def startDeadline(self, start):
+        self.deadline = None
+
+        if self.lineSeconds is not None:
+            self.deadline = start + self.lineSeconds
+            self.deadlineError = SRPNEvents.LINE_TIME
+
+        if self.sessionSeconds is not None:
+            sessionDeadline = start + self.sessionSeconds - self.sessionSecondsUsed
+
+            if self.deadline is None or sessionDeadline < self.deadline:
+                self.deadline = sessionDeadline
+                self.deadlineError = SRPNEvents.SESSION_TIME
+
+    # | stepsLeft()
+    # |-----------------------------------------------------------------
+    # | Returns the number of steps the line can still run within the
+    # | step budgets, or BUDGET_SLICE if that's fewer.
+    # |------------------------------------------
+    def stepsLeft(self):
+        left = BUDGET_SLICE
+
+        if self.lineSteps is not None:
+            left = min(left, self.lineSteps - self.lineStepsUsed)
+
+        if self.sessionSteps is not None:
+            left = min(left, self.sessionSteps - self.sessionStepsUsed - self.lineStepsUsed)
+
+        return max(left, 0)
+
+    # | spendSteps()
+    # |-------------------------------------------------------------------
+    # | Counts the steps about to be run against the line's budgets,
+    # | raising BudgetExceededException instead if they'd pass a step
+    # | budget or the line's already run out of time.
+    # |-----------------------------------------
+    def spendSteps(self, steps):
+        used = self.lineStepsUsed + steps
+
+        if self.lineSteps is not None and used > self.lineSteps:
+            raise BudgetExceededException(SRPNEvents.LINE_STEPS)
+
+        if self.sessionSteps is not None and self.sessionStepsUsed + used > self.sessionSteps:
+            raise BudgetExceededException(SRPNEvents.SESSION_STEPS)
+
+        if self.deadline is not None:
+            self.checkDeadline()
+
+        self.lineStepsUsed = used
+
+    # | checkDeadline()
+    # |--------------------------------------------------------------
+    # | Raises BudgetExceededException if the line's run out of time.
+    # |----------------------------------------------------------
+    def checkDeadline(self):
+        if time.perf_counter() > self.deadline:
+            raise BudgetExceededException(self.deadlineError)
+
+    # | refundSteps()
     # |------------------------------------------------------------------
-    # | Pushes item passed as a parameter onto the stack, catching the
-    # | exception that may be raised if the stack is already full
-    # | or that an octal number has invalid digits (ie 8 or 9).
+    # | Takes back the steps spent on the instructions (or repeats) left
+    # | in the iterator, which were never run as what was running them
+    # | was stopped early, so only the steps run are counted.
+    # |------------------------------------------------
+    def refundSteps(self, iterator):
+        if self.isBudgeted:
+            self.lineStepsUsed -= length_hint(iterator)
+
+    # | reset()
+    # |-------------------------------------------------------------------
+    # | Puts the parser back to the state of a new session, emptying the
+    # | stack, ending any comment or exit and restarting the random numbers
+    # | and budgets. Compiled programs are kept, as they don't depend
+    # | on state.
+    # |-------------------
+    def reset(self):
+        self.stack.clear()
+        self.isCommenting = False
+        self.hasExited = False
+        self.random.reset()
+        self.sessionStepsUsed = 0
+        self.sessionSecondsUsed = 0.0
+
+    # | snapshot()
+    # |---------------------------------------------------------------
+    # | Returns the state of the session as a compact binary snapshot
+    # | (see SRPNSnapshot), which restore() can resume it from.
     # |-----------------------------------------------------
-    def pushOperand(self, item):
-        item = str(item)
+    def snapshot(self):
+        return SRPNSnapshot.dumps(self)
 
-        # | The base in which the operand should be interpreted
-        base = 10
+    # | restore()
+    # |------------------------------------------------------------------
+    # | Resumes the session from a snapshot, which may be bytes or any
+    # | buffer, such as an mmap of a snapshot file.
+    # |-------------------------------------------
+    def restore(self, data):
+        SRPNSnapshot.restore(self, data)
+
+    # | execute()
+    # |------------------------------------------------------------
+    # | Runs a program produced by SRPNCompiler.compile() against
+    # | the stack, one instruction at a time. Overflows and
+    # | underflows are checked for before each instruction,
+    # | so no exception is raised for them.
+    # |-----------------------------------
+    def execute(self, program):
+        stack = self.stack
+        stackLimit = stack.stackLimit
+        operations = self.operations
+        operandCounts = self.operandCounts
+
+        for opcode, operand in program:
+            if opcode == PUSH:
+                if stack.top < stackLimit:
+                    stack.push(operand)
+                else:
+                    self.reportError(SRPNEvents.OVERFLOW)
+
+            elif opcode == OPERATE:
+                if stack.top >= operandCounts[operand]:
+                    operations[operand]()
+                else:
+                    self.reportError(SRPNEvents.UNDERFLOW)
+
+            elif opcode == UNRECOGNISED:
+                self.unrecognisedInput(operand)
+
+            elif opcode == REPEAT:
+                self.repeat(*operand)
+
+            elif opcode == DEFINE:
+                self.defineWord(*operand)
+
+            elif opcode == REPORT:
+                self.reportError(operand)
+
+            # | The exception may be raised again if the program's cached, so drop its old traceback.
+            elif opcode == RAISE:
+                raise operand.with_traceback(None)
+
+    # | interpret()
+    # |--------------------------------------------------------------------
+    # | Interprets the input string as an RPN input, item by item. This is
+    # | the reference behaviour which compiled programs must match.
+    # |---------------------------------------------------------
+    def interpret(self, inputString):
+        if self.hasExited:
+            return
 
-        # | If the number is prefixed with a 0, it's to be considered an octal number
-        if item[0] == '0':
-            base = 8
+        start = time.perf_counter()
 
         try:
-            self.stack.push(int(item, base))
+            tokenizer = SRPNTokenizer(self.saturation, self.isCommenting, largeStack=self.largeStack)
+            self.interpretTokens(tokenizer.tokenize(inputString))
+        except SessionExitException:
+            pass
 
-        except StackOverflowException as e:
-            print(e.message)
+        if self.metrics is not None:
+            self.metrics.observeLine(time.perf_counter() - start)
 
-        except ValueError as e:
-            # | If the operand is octal, but contains an invalid digit, push it if 2 digits long
-            if len(item) == 2:
-                self.pushOperand(item[1:])
-            # | Or simply discard the operand.
+    # | interpretTokens()
+    # |------------------------------------------------
+    # | Interprets the tokens of an input one by one.
+    # |--------------------------------------------
+    def interpretTokens(self, tokens):
+        for kind, value in tokens:
+            # | If the item is an operand (i.e. positive or negative number).
+            if kind == NUMBER:
+                if self.metrics is None:
+                    self.pushValue(value)
+                else:
+                    pushStart = time.perf_counter()
+                    self.pushValue(value)
+                    self.metrics.observeOperation("push", time.perf_counter() - pushStart)
+
+            # | If the item is an operation, including the '#' which toggles the comment.
+            elif kind == OPERATOR or kind == COMMENT:
+                self.performOperation(value)
+
+            # | If the item is totally foreign.
             else:
-                pass
+                self.unrecognisedInput(value)
 
+    # | pushOperand()
+    # |------------------------------------------------------------------
+    # | Pushes an operand, as typed by the user, onto the stack. An octal
+    # | number with invalid digits (ie 8 or 9) is discarded, unless
+    # | it's 2 digits long, when it's pushed as decimal.
+    # |-----------------------------------------------------
+    def pushOperand(self, item):
+        value = helpers.literalValue(item)
+
+        if value is not None:
+            self.pushValue(value)
+
+    # | pushValue()
+    # |-----------------------------------------------------------------
+    # | Pushes an integer value, such as the result of an operation,
+    # | onto the stack as it is, reporting an overflow if the stack
+    # | is already full.
+    # |----------------------------
+    def pushValue(self, value):
+        stack = self.stack
+
+        if stack.top < stack.stackLimit:
+            stack.push(value)
+        else:
+            self.reportError(SRPNEvents.OVERFLOW)
 
     # | performOperation()
     # |--------------------------------------------------------------
     # | Tries to perform the operation passed as a parameter, but
-    # | catches the exception of having no items on the stack.
+    # | reports an underflow instead if there aren't enough
+    # | items on the stack for it.
     # |---------------------------------------------------
     def performOperation(self, operation):
-        try:
+        if self.metrics is not None:
+            start = time.perf_counter()
+
+        if self.stack.top >= self.operandCounts[operation]:
             self.operations[operation]()
-        except StackUnderflowException as e:
-            print(e.message)
+        else:
+            self.reportError(SRPNEvents.UNDERFLOW)
+
+        if self.metrics is not None:
+            self.metrics.observeOperation(operation, time.perf_counter() - start)
+
+    # | defineWord()
+    # |-------------------------------------------------------------------
+    # | Defines (or redefines) a word, adding it to the operations so it
+    # | can be called like any other. As the words compiled programs
+    # | can name have changed, the compiled programs are dropped.
+    # |-----------------------------------------------------
+    def defineWord(self, name, body, program):
+        # | The body was compiled knowing every word so far, including this one if it's being redefined.
+        self.wordScopes[name] = len(self.words)
+        self.words[name] = body
+        self.operations[name] = lambda: self.runWord(program)
+        self.operandCounts[name] = 0
+        self.cache.clear()
+
+    # | clearWords()
+    # |-------------------------------------------------------
+    # | Removes every user-defined word from the operations.
+    # |--------------------------------------------------
+    def clearWords(self):
+        for name in self.words:
+            del self.operations[name]
+            del self.operandCounts[name]
+
+        self.words.clear()
+        self.wordScopes.clear()
+        self.cache.clear()
+
+    # | enterWord()
+    # |------------------------------------------------------------------
+    # | Counts the steps about to be run by a word or repeat against the
+    # | line's limit (and any budgets) and nests one deeper, raising
+    # | WordLimitException if either limit would be passed.
+    # |-----------------------------------------------
+    def enterWord(self, steps):
+        if self.wordDepth >= MAX_WORD_DEPTH:
+            raise WordLimitException(SRPNEvents.WORD_DEPTH)
+
+        self.wordSteps += steps
+
+        if self.wordSteps > MAX_WORD_STEPS:
+            raise WordLimitException(SRPNEvents.WORD_STEPS)
+
+        if self.isBudgeted:
+            self.spendSteps(steps)
+
+        self.wordDepth += 1
+
+    # | runWord()
+    # |----------------------------------------------
+    # | Runs the compiled program of a word's body.
+    # |------------------------------------------
+    def runWord(self, program):
+        self.enterWord(len(program))
+        instructions = iter(program)
+
+        try:
+            self.execute(instructions)
+        finally:
+            self.wordDepth -= 1
+            self.refundSteps(instructions)
+
+    # | repeat()
+    # |-----------------------------------------------------------------
+    # | Performs the operation the given number of times, in a single
+    # | loop rather than as separate instructions.
+    # |------------------------------------------
+    def repeat(self, count, operation):
+        stack = self.stack
+        perform = self.operations[operation]
+        operandCount = self.operandCounts[operation]
+
+        self.enterWord(max(count, 0))
+        repeats = iter(range(count))
+
+        try:
+            for _ in repeats:
+                if stack.top >= operandCount:
+                    perform()
+                else:
+                    self.reportError(SRPNEvents.UNDERFLOW)
+        finally:
+            self.wordDepth -= 1
+            self.refundSteps(repeats)
+
+    # | reportError()
+    # |-------------------------------------------------------------
+    # | Emits an error event to the sink, and counts it against its
+    # | kind if there are metrics.
+    # |------------------------------
+    def reportError(self, error):
+        self.sink.emit(error)
+
+        if self.metrics is not None:
+            self.metrics.countError(error.kind)
 
     # | popOperands()
     # |-----------------------------------------------------------------------
@@ -169,7 +676,7 @@ class SRPNInputParser:
     # |------------------------------------------
     def add(self):
         operand1, operand2 = self.popOperands()
-        self.pushOperand(operand1 + operand2)
+        self.pushValue(saturatedArithmetic.add(operand1, operand2, self.saturation))
 
     # | subtract()
     # |--------------------------------------------------------------------
@@ -178,7 +685,7 @@ class SRPNInputParser:
     # |----------------------------------------------------------
     def subtract(self):
         operand1, operand2 = self.popOperands()
-        self.pushOperand(operand2 - operand1)
+        self.pushValue(saturatedArithmetic.subtract(operand2, operand1, self.saturation))
 
     # | multiply()
     # |--------------------------------------------
@@ -187,7 +694,7 @@ class SRPNInputParser:
     # |--------------------------------
     def multiply(self):
         operand1, operand2 = self.popOperands()
-        self.pushOperand(operand1 * operand2)
+        self.pushValue(saturatedArithmetic.multiply(operand1, operand2, self.saturation))
 
     # | divide()
     # |----------------------------------------------------------------
@@ -198,10 +705,9 @@ class SRPNInputParser:
         operand1, operand2 = self.popOperands()
 
         if operand1 == 0:
-            print("Divide by 0.")
+            self.reportError(SRPNEvents.DIVIDE_BY_ZERO)
         else:
-            # | Convert to integer to allow it to be pushed correctly
-            self.pushOperand(int(operand2 / operand1))
+            self.pushValue(saturatedArithmetic.divide(operand2, operand1, self.saturation))
 
     # | exponentiate()
     # |-----------------------------------------------------------------------
@@ -212,9 +718,9 @@ class SRPNInputParser:
         operand1, operand2 = self.popOperands()
 
         if operand1 < 0:
-            print("Negative power.")
+            self.reportError(SRPNEvents.NEGATIVE_POWER)
         else:
-            self.pushOperand(operand2 ** operand1)
+            self.pushValue(saturatedArithmetic.power(operand2, operand1, self.saturation))
 
     # | mod()
     # |-----------------------------------------------------------------
@@ -223,32 +729,99 @@ class SRPNInputParser:
     # |-----------------------------------------------
     def mod(self):
         operand1, operand2 = self.popOperands()
-        self.pushOperand(operand2 % operand1)
+
+        if operand1 == 0:
+            self.reportError(SRPNEvents.DIVIDE_BY_ZERO)
+        else:
+            self.pushValue(saturatedArithmetic.mod(operand2, operand1, self.saturation))
 
     # | equals()
     # |-------------------------------------------------
-    # | Prints the value of the top item on the stack.
+    # | Emits the value of the top item on the stack.
     # |---------------------------------------------
     def equals(self):
-        # | Try to peek at the top item, but catch the exception if the stack is empty.
-        try:
-            print(self.stack.peek())
-        except StackEmptyException as e:
-            print(e.message)
+        # | Check that there's a top item to peek at, rather than catching the exception if not.
+        if self.stack.top:
+            self.sink.emit(Value(self.stack.peek()))
+        else:
+            self.reportError(SRPNEvents.EMPTY)
 
     # | d()
     # |-------------------------------------------------------
-    # | The 'd' function. Prints the contents of the stack.
+    # | The 'd' function. Emits the contents of the stack.
     # |-------------------------------------------------
     def d(self):
-        # | Get the number of items in the stack
-        items = self.stack.count()
+        stack = self.stack
+
+        # | The items in use, from the bottom of the stack up.
+        self.sink.emit(StackDump(tuple(stack.stack[:stack.top])))
+
+    # | sumAll()
+    # |----------------------------------------------------------------
+    # | Pops every item off the stack and pushes their sum, which is
+    # | only saturated once it's been totalled.
+    # |------------------------------------
+    def sumAll(self):
+        self.pushValue(sum(self.stack.popAll()))
+
+    # | productAll()
+    # |------------------------------------------------------------
+    # | Pops every item off the stack and pushes their product.
+    # |-----------------------------------------------------
+    def productAll(self):
+        self.pushValue(saturatedArithmetic.product(self.stack.popAll(), self.saturation))
 
-        # | We iterate from 1 to items + 1 (instead of 0 to items) as this
-        # | allows us to peek at the stack with the right index
-        for i in range(1, items + 1):
+    # | minimum()
+    # |----------------------------------------------------------
+    # | Pops every item off the stack and pushes the smallest.
+    # |-----------------------------------------------------
+    def minimum(self):
+        self.pushValue(min(self.stack.popAll()))
 
-            print(self.stack.peek(items - i))
+    # | maximum()
+    # |---------------------------------------------------------
+    # | Pops every item off the stack and pushes the largest.
+    # |----------------------------------------------------
+    def maximum(self):
+        self.pushValue(max(self.stack.popAll()))
+
+    # | duplicateN()
+    # |------------------------------------------------------------------
+    # | Pops the top item, n, off the stack and pushes copies of the n
+    # | items below it. If there aren't n items, or room for their
+    # | copies, the stack's left as it was.
+    # |---------------------------------------
+    def duplicateN(self):
+        stack = self.stack
+        count = stack.peek()
+
+        if count > stack.top - 1:
+            self.reportError(SRPNEvents.UNDERFLOW)
+        elif stack.top - 1 + count > stack.stackLimit:
+            self.reportError(SRPNEvents.OVERFLOW)
+        else:
+            stack.pop()
+
+            if count > 0:
+                stack.duplicate(count)
+
+    # | dropN()
+    # |---------------------------------------------------------------
+    # | Pops the top item, n, off the stack and removes the n items
+    # | below it. If there aren't n items, the stack's left as
+    # | it was.
+    # |-------------------
+    def dropN(self):
+        stack = self.stack
+        count = stack.peek()
+
+        if count > stack.top - 1:
+            self.reportError(SRPNEvents.UNDERFLOW)
+        else:
+            stack.pop()
+
+            if count > 0:
+                stack.drop(count)
 
     # | r()
     # |------------------------------------------------
@@ -256,19 +829,18 @@ class SRPNInputParser:
     # | GLIBC random number generator used by C.
     # |--------------------------------------
     def r(self):
-        # | Get the random number an put it on the stack
-        randomNumber = randomNumbers.numbers[randomNumbers.index]
-        self.pushOperand(randomNumber)
-
-        # | Increment the index to move on the next number
-        randomNumbers.index += 1
+        self.pushValue(self.random.next())
 
     # | poundSign()
     # |----------------------------------------------------
-    # | The '£' function. Causes the calculator to exit.
+    # | The '£' function. Ends the session, emitting an Exit
+    # | (which the default sink exits the calculator on).
     # |---------------------------------------------
     def poundSign(self):
-        sys.exit()
+        self.hasExited = True
+        self.sink.emit(EXIT)
+
+        raise SessionExitException
 
     # | comment()
     # |---------------------------------------------------------------
@@ -282,4 +854,4 @@ class SRPNInputParser:
     # | Outputs a warning message should an input be erroneous.
     # |-----------------------------------------------------
     def unrecognisedInput(self, string):
-        print("Unrecognised operator or operand \"" + string + "\".")
+        self.reportError(SRPNEvents.unrecognised(string))
@@ -0,0 +1,162 @@
+from bisect import bisect_left
+
+# | The upper bounds, in seconds, of the buckets of each latency histogram.
+LATENCY_BUCKETS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+# | Histogram
+# |-------------------------------------------------------------------
+# | A histogram of observed values, counted into buckets by their
+# | upper bounds, along with the count and sum of all values.
+# |-------------------------------------------------
+class Histogram:
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = bounds
+
+        # | The number of values in each bucket, with a final bucket for values beyond every bound.
+        self.buckets = [0] * (len(bounds) + 1)
+
+        self.count = 0
+        self.sum = 0.0
+
+    # | observe()
+    # |----------------------------------------
+    # | Adds a value to the histogram.
+    # |------------------------------
+    def observe(self, value):
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    # | cumulativeBuckets()
+    # |---------------------------------------------------------------
+    # | Returns a list of (bound, count) pairs, where each count is of
+    # | the values up to and including the bound, ending with inf.
+    # |-----------------------------------------------------
+    def cumulativeBuckets(self):
+        total = 0
+        cumulative = []
+
+        for bound, count in zip(self.bounds + (float("inf"),), self.buckets):
+            total += count
+            cumulative.append((bound, total))
+
+        return cumulative
+
+# | SRPNMetrics
+# |------------------------------------------------------------------------
+# | Counters and latency histograms for an SRPNInputParser, which records
+# | into them when given one. Counts calls and latency per operation
+# | (with operands pushed counted as "push"), latency per line and
+# | the number of each kind of error. Not thread safe, so each
+# | thread's parsers should have their own.
+# |---------------------------------------
+class SRPNMetrics:
+
+    def __init__(self):
+        self.operationCalls = {}
+        self.operationLatency = {}
+        self.lineLatency = Histogram()
+        self.errors = {}
+
+    # | observeOperation()
+    # |------------------------------------------------------------
+    # | Records a call of an operation and the seconds it took.
+    # |----------------------------------------------------
+    def observeOperation(self, operation, seconds):
+        try:
+            self.operationCalls[operation] += 1
+        except KeyError:
+            self.operationCalls[operation] = 1
+            self.operationLatency[operation] = Histogram()
+
+        self.operationLatency[operation].observe(seconds)
+
+    # | observeLine()
+    # |----------------------------------------------------
+    # | Records the seconds a line of input took to run.
+    # |----------------------------------------------
+    def observeLine(self, seconds):
+        self.lineLatency.observe(seconds)
+
+    # | countError()
+    # |---------------------------------------------------------------
+    # | Counts an error of the given kind, e.g. "overflow".
+    # |-----------------------------------------------
+    def countError(self, kind):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    # | snapshot()
+    # |------------------------------------------------------------------
+    # | Returns the metrics as plain dictionaries, with each histogram
+    # | given as its count, sum and cumulative buckets.
+    # |---------------------------------------------
+    def snapshot(self):
+        def histogram(h):
+            return {"count": h.count, "sum": h.sum, "buckets": h.cumulativeBuckets()}
+
+        return {"operationCalls": dict(self.operationCalls),
+                "operationLatency": {operation: histogram(h) for operation, h in self.operationLatency.items()},
+                "lineLatency": histogram(self.lineLatency),
+                "errors": dict(self.errors)}
+
+    # | prometheusText()
+    # |---------------------------------------------------------
+    # | Returns the metrics in the Prometheus text format.
+    # |----------------------------------------------------
+    def prometheusText(self):
+        lines = ["# HELP srpn_operations_total Operations performed, by operation.",
+                 "# TYPE srpn_operations_total counter"]
+
+        for operation, calls in sorted(self.operationCalls.items()):
+            lines.append("srpn_operations_total{operation=\"%s\"} %d" % (escapeLabel(operation), calls))
+
+        lines += ["# HELP srpn_operation_seconds Latency of each operation.",
+                  "# TYPE srpn_operation_seconds histogram"]
+
+        for operation, h in sorted(self.operationLatency.items()):
+            lines += histogramLines("srpn_operation_seconds", "operation=\"%s\"," % escapeLabel(operation), h)
+
+        lines += ["# HELP srpn_line_seconds Latency of each line of input.",
+                  "# TYPE srpn_line_seconds histogram"]
+        lines += histogramLines("srpn_line_seconds", "", self.lineLatency)
+
+        lines += ["# HELP srpn_errors_total Errors reported, by kind.",
+                  "# TYPE srpn_errors_total counter"]
+
+        for kind, count in sorted(self.errors.items()):
+            lines.append("srpn_errors_total{kind=\"%s\"} %d" % (escapeLabel(kind), count))
+
+        return "\n".join(lines) + "\n"
+
+    # | dump()
+    # |---------------------------------------------------------
+    # | Writes the metrics to a file in the Prometheus text format.
+    # |----------------------------------------------------
+    def dump(self, path):
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.prometheusText())
+
+# | escapeLabel()
+# |-----------------------------------------------------------
+# | Escapes a value for use as a Prometheus label value.
+# |---------------------------------------------------
+def escapeLabel(value):
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+# | histogramLines()
+# |----------------------------------------------------------------
+# | Returns the lines of the Prometheus text format for a histogram,
+# | with the given labels (each followed by a comma) on each line.
+# |-------------------------------------------------------
+def histogramLines(name, labels, h):
+    lines = []
+
+    for bound, count in h.cumulativeBuckets():
+        lines.append("%s_bucket{%sle=\"%s\"} %d" % (name, labels, "+Inf" if bound == float("inf") else repr(bound), count))
+
+    labels = "{" + labels.rstrip(",") + "}" if labels else ""
+    lines.append("%s_sum%s %r" % (name, labels, h.sum))
+    lines.append("%s_count%s %d" % (name, labels, h.count))
+
+    return lines
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+# | SRPNProgramCache
+# |-------------------------------------------------------------------------
+# | A bounded, least recently used cache of compiled programs. Each entry
+# | is keyed by the line of input and whether it started in a comment,
+# | as the same line compiles differently either side of a '#'.
+# |--------------------------------------------------------------
+class SRPNProgramCache:
+
+    def __init__(self, size=256):
+        # | The maximum number of programs to keep. A size of 0 disables caching.
+        self.size = size
+
+        self.programs = OrderedDict()
+
+        # | Counters of how many lookups were, and weren't, found in the cache.
+        self.hits = 0
+        self.misses = 0
+
+    # | get()
+    # |---------------------------------------------------------------
+    # | Returns the compiled program for the input, or None if it's
+    # | not in the cache, marking it as the most recently used.
+    # |----------------------------------------------------
+    def get(self, inputString, isCommenting):
+        key = (inputString, isCommenting)
+
+        try:
+            compiled = self.programs[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.programs.move_to_end(key)
+        self.hits += 1
+
+        return compiled
+
+    # | put()
+    # |-------------------------------------------------------------
+    # | Adds a compiled program to the cache, evicting the least
+    # | recently used program if the cache is full.
+    # |---------------------------------------
+    def put(self, inputString, isCommenting, compiled):
+        if self.size <= 0:
+            return
+
+        self.programs[(inputString, isCommenting)] = compiled
+        self.programs.move_to_end((inputString, isCommenting))
+
+        if len(self.programs) > self.size:
+            self.programs.popitem(last=False)
+
+    # | resize()
+    # |-------------------------------------------------------
+    # | Changes the size of the cache, evicting the least
+    # | recently used programs until they fit.
+    # |----------------------------------
+    def resize(self, size):
+        self.size = size
+
+        while len(self.programs) > max(size, 0):
+            self.programs.popitem(last=False)
+
+    # | clear()
+    # |-------------------------------------------------------
+    # | Invalidates every program in the cache. The hit and
+    # | miss counters are left as they are.
+    # |--------------------------------
+    def clear(self):
+        self.programs.clear()
+
+    # | count()
+    # |------------------------------------------------
+    # | Returns the number of programs in the cache.
+    # |--------------------------------------------
+    def count(self):
+        return len(self.programs)
@@ -0,0 +1,97 @@
+# | The number of random numbers given by the legacy system before its
+# | sequence starts again from the beginning.
+PREFIX_LENGTH = 22
+
+# | seededTable()
+# |----------------------------------------------------------------------
+# | Returns the table of 31 words which the GLIBC TYPE_3 generator holds
+# | once seeded, as random() leaves it ready for its first number.
+# |-------------------------------------------------------------
+def seededTable(seed):
+    words = [seed]
+
+    # | The table is first filled using a linear congruential generator
+    for i in range(1, 31):
+        words.append((16807 * words[-1]) % 2147483647)
+
+    for i in range(31, 34):
+        words.append(words[i - 31])
+
+    # | The first 310 outputs are then discarded
+    for i in range(34, 344):
+        words.append((words[i - 31] + words[i - 3]) & 0xffffffff)
+
+    # | Keep the last 31 words, positioned so that word i of the sequence sits at index i % 31.
+    return [words[i] for i in sorted(range(313, 344), key=lambda i: i % 31)]
+
+# | The seeded table for the seed of 1 which C uses by default, worked out once.
+SEEDED_TABLE = tuple(seededTable(1))
+
+# | SRPNRandom
+# |-----------------------------------------------------------------------
+# | A GLIBC random() generator, the TYPE_3 additive feedback generator
+# | used by C, seeded as it is by default. Just as the legacy system
+# | does, the sequence starts again after its first 22 numbers.
+# |--------------------------------------------------------
+class SRPNRandom:
+
+    def __init__(self):
+        self.reset()
+
+    # | reset()
+    # |-------------------------------------------------------------
+    # | Puts the generator back to the start of its sequence.
+    # |----------------------------------------------------
+    def reset(self):
+        # | The number of random numbers given so far
+        self.count = 0
+
+        self.seed()
+
+    # | seed()
+    # |------------------------------------------------------------
+    # | Seeds the table of words the numbers are generated from.
+    # |------------------------------------------------------
+    def seed(self):
+        self.table = list(SEEDED_TABLE)
+
+        # | The position in the sequence of the next word, modulo 31
+        self.index = 344 % 31
+
+    # | next()
+    # |----------------------------------------------------
+    # | Returns the next random number in the sequence.
+    # |-----------------------------------------------
+    def next(self):
+        if self.count == PREFIX_LENGTH:
+            self.seed()
+
+        self.count += 1
+
+        table = self.table
+        index = self.index
+
+        # | Each word is the sum of the words 31 and 3 before it, and
+        # | the random number is that word without its lowest bit.
+        word = (table[index] + table[(index - 3) % 31]) & 0xffffffff
+        table[index] = word
+
+        self.index = (index + 1) % 31
+
+        return word >> 1
+
+    # | state()
+    # |-----------------------------------------------------------------
+    # | Returns the state of the generator, which can be passed back
+    # | to restore() to carry on the sequence from this point.
+    # |---------------------------------------------------
+    def state(self):
+        return (self.count, self.index, tuple(self.table))
+
+    # | restore()
+    # |----------------------------------------------------------
+    # | Restores the generator to a state returned by state().
+    # |-----------------------------------------------------
+    def restore(self, state):
+        self.count, self.index, table = state
+        self.table = list(table)
@@ -0,0 +1,272 @@
+from SRPNInputParser import SRPNInputParser
+from SRPNEvents import ConsoleSink
+from SRPNDifferential import newSessionParser
+from srpnClient import defaultSocketPath
+import argparse
+import asyncio
+import io
+import os
+import signal
+import socket
+import stat
+
+# | SRPNServer
+# |----------------------------------------------------------------------------
+# | A TCP (or, given a path, Unix domain socket) server hosting many
+# | calculator sessions in one warm process. Each
+# | connection gets its own SRPNInputParser, and so its own stack, comment
+# | state and random numbers. Input is framed by lines, and the output of
+# | each line is sent back before the next is read, so a client which
+# | doesn't read its output is held up rather than buffered for.
+# |----------------------------------------------------------
+class SRPNServer:
+
+    def __init__(self, saturation, host="127.0.0.1", port=0, maxSessions=10000, idleTimeout=300,
+                 maxLineLength=65536, cacheSize=16, backlog=1024, path=None, lineSteps=None, lineSeconds=None,
+                 sessionSteps=None, sessionSeconds=None, checkOneIn=0):
+        self.saturation = saturation
+        self.host = host
+        self.port = port
+
+        # | The path of the Unix domain socket to listen on instead of the host and port, if any.
+        self.path = path
+
+        # | The most sessions there can be at once. Connections beyond this are turned away.
+        self.maxSessions = maxSessions
+
+        # | The number of seconds a session can go without sending a line before it's closed.
+        self.idleTimeout = idleTimeout
+
+        # | The longest line, in bytes, which a session can send.
+        self.maxLineLength = maxLineLength
+
+        # | Sessions are many and short lived, so each keeps only a small cache of compiled programs.
+        self.cacheSize = cacheSize
+
+        # | The number of connections which can be waiting to be accepted, for bursts of new sessions.
+        self.backlog = backlog
+
+        # | The step and time budgets of each line and session (see SRPNInputParser.setBudgets()), so that
+        # | no one session can hold up the others for long.
+        self.lineSteps = lineSteps
+        self.lineSeconds = lineSeconds
+        self.sessionSteps = sessionSteps
+        self.sessionSeconds = sessionSeconds
+
+        # | One in how many sessions are checked against the reference interpreter (see SRPNDifferential),
+        # | or 0 for none. The reference doesn't keep to budgets, so a session being checked couldn't be held
+        # | to them, and checking can't be used with them.
+        if checkOneIn and not (lineSteps is None and lineSeconds is None and sessionSteps is None
+                               and sessionSeconds is None):
+            raise ValueError("Sessions can't be checked against the reference interpreter when there are budgets.")
+
+        self.checkOneIn = checkOneIn
+
+        self.sessions = 0
+        self.server = None
+
+        # | Whether the server created the socket file at the path, so is the one to remove it.
+        self.ownsSocket = False
+
+    # | start()
+    # |-----------------------------------------------------------------
+    # | Starts listening for connections. If the port was 0, the port
+    # | which was picked is available from self.port afterwards.
+    # |----------------------------------------------------
+    async def start(self):
+        if self.path is not None:
+            removeStaleSocket(self.path)
+            self.server = await asyncio.start_unix_server(self.handleSession, self.path,
+                                                          limit=self.maxLineLength, backlog=self.backlog)
+            self.ownsSocket = True
+            return self.server
+
+        self.server = await asyncio.start_server(self.handleSession, self.host, self.port,
+                                                 limit=self.maxLineLength, backlog=self.backlog)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+        return self.server
+
+    # | serveForever()
+    # |-------------------------------------------------------
+    # | Starts the server if needed and serves until cancelled.
+    # |---------------------------------------------------
+    async def serveForever(self):
+        if self.server is None:
+            await self.start()
+
+        async with self.server:
+            await self.server.serve_forever()
+
+    # | close()
+    # |---------------------------------------------------
+    # | Stops listening and waits for the server to close.
+    # |----------------------------------------------
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+        self.removeSocket()
+
+    # | removeSocket()
+    # |---------------------------------------------------------------
+    # | Removes the socket file the server created, if it created one,
+    # | leaving anything else at the path alone.
+    # |------------------------------------
+    def removeSocket(self):
+        if self.ownsSocket:
+            self.ownsSocket = False
+
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+
+    # | handleSession()
+    # |------------------------------------------------------------------
+    # | Runs a session for a connection, parsing each line it sends and
+    # | sending back the output, until the connection's closed, it
+    # | goes idle or sends a '£'.
+    # |----------------------
+    async def handleSession(self, reader, writer):
+        if self.sessions >= self.maxSessions:
+            writer.write(b"Too many sessions.\n")
+            await self.closeConnection(writer)
+            return
+
+        self.sessions += 1
+
+        output = io.StringIO()
+        # | A '£' ends this session only, rather than exiting the whole server.
+        parser = newSessionParser(self.saturation, self.checkOneIn, cacheSize=self.cacheSize, output=output,
+                                  sink=ConsoleSink(output, exitOnExit=False))
+
+        # | Only a session which isn't being checked can have budgets (see the constructor).
+        if isinstance(parser, SRPNInputParser):
+            parser.setBudgets(self.lineSteps, self.lineSeconds, self.sessionSteps, self.sessionSeconds)
+
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idleTimeout)
+                except asyncio.TimeoutError:
+                    break
+                # | The line's longer than the limit.
+                except ValueError:
+                    writer.write(b"Line too long.\n")
+                    break
+
+                if not line:
+                    break
+
+                try:
+                    parser.parse(line.decode("utf-8", "replace").rstrip("\r\n"))
+                finally:
+                    self.flushOutput(output, writer)
+
+                if parser.hasExited:
+                    break
+
+                # | Wait for the client to take the output before reading any more.
+                await writer.drain()
+
+        except ConnectionError:
+            pass
+
+        finally:
+            self.sessions -= 1
+            await self.closeConnection(writer)
+
+    # | flushOutput()
+    # |------------------------------------------------------------
+    # | Writes everything the parser has output to the connection,
+    # | and empties the buffer ready for the next line.
+    # |------------------------------------------
+    def flushOutput(self, output, writer):
+        text = output.getvalue()
+
+        if text:
+            writer.write(text.encode("utf-8"))
+            output.seek(0)
+            output.truncate()
+
+    # | closeConnection()
+    # |------------------------------------------------------
+    # | Closes the connection, ignoring it if it's already gone.
+    # |--------------------------------------------------
+    async def closeConnection(self, writer):
+        try:
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+# | removeStaleSocket()
+# |--------------------------------------------------------------------
+# | Removes the socket file at the path if it's left over from a server
+# | which has gone, raising OSError if a server's still listening on it,
+# | or if the path's something other than a socket, which is left alone.
+# |--------------------------------------------------------------
+def removeStaleSocket(path):
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+
+    if not stat.S_ISSOCK(mode):
+        raise OSError(path + " exists and isn't a socket")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)
+            return
+
+    raise OSError("A server is already listening on " + path)
+
+# | serve()
+# |--------------------------------------------------------------
+# | Serves until interrupted or terminated, removing its Unix socket
+# | on the way out.
+# |----------------
+async def serve(server):
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+
+    try:
+        await server.serveForever()
+    finally:
+        server.removeSocket()
+
+if __name__ == "__main__":
+    argumentParser = argparse.ArgumentParser(description="Serves SRPN calculator sessions over TCP or a Unix socket.")
+    argumentParser.add_argument("--host", default="127.0.0.1")
+    argumentParser.add_argument("--port", type=int, default=2147)
+    argumentParser.add_argument("--unix", nargs="?", const=defaultSocketPath(), metavar="PATH",
+                                help="listen on a Unix domain socket (by default the one srpnClient.py uses) instead")
+    argumentParser.add_argument("--max-sessions", type=int, default=10000)
+    argumentParser.add_argument("--idle-timeout", type=float, default=300)
+    argumentParser.add_argument("--line-steps", type=int, help="the most steps each line may run")
+    argumentParser.add_argument("--line-seconds", type=float, help="the most seconds each line may run for")
+    argumentParser.add_argument("--session-steps", type=int, help="the most steps each session may run")
+    argumentParser.add_argument("--session-seconds", type=float, help="the most seconds each session may run for")
+    argumentParser.add_argument("--check-one-in", type=int, default=0, metavar="N",
+                                help="check one in N sessions against the reference interpreter, logging any "
+                                     "divergence to stderr (not with budgets, which the reference can't keep to)")
+    arguments = argumentParser.parse_args()
+
+    if arguments.check_one_in and not (arguments.line_steps is None and arguments.line_seconds is None
+                                       and arguments.session_steps is None and arguments.session_seconds is None):
+        argumentParser.error("--check-one-in can't be used with --line-steps, --line-seconds, --session-steps "
+                             "or --session-seconds")
+
+    server = SRPNServer(2147483647, arguments.host, arguments.port, arguments.max_sessions, arguments.idle_timeout,
+                        path=arguments.unix, lineSteps=arguments.line_steps, lineSeconds=arguments.line_seconds,
+                        sessionSteps=arguments.session_steps, sessionSeconds=arguments.session_seconds,
+                        checkOneIn=arguments.check_one_in)
+
+    try:
+        asyncio.run(serve(server))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
@@ -0,0 +1,214 @@
+from array import array
+import mmap
+import struct
+import sys
+
+# | The layout of a snapshot of a parser's session, all little endian:
+# |   header  - magic, version, flags, saturation, stack limit, number of items on the stack,
+# |             and the random number generator's count, index and table of 31 words
+# |   stack   - the values on the stack from the bottom up, as 64 bit integers
+# |   words   - the number of user-defined words, then the name and body of each, as
+# |             lengths followed by UTF-8, in the order they were first defined. Each
+# |             word's lengths are followed by the number of words its body could name
+# |             when it was compiled (from version 2, before which it's taken as all)
+MAGIC = b"SRPN"
+VERSION = 2
+
+HEADER = struct.Struct("<4sHBxqQQQI31I")
+WORD_COUNT = struct.Struct("<I")
+
+# | The layout of each word's lengths (and scope), by the version of the snapshot.
+WORD_LENGTHS = {1: struct.Struct("<HI"), 2: struct.Struct("<HII")}
+
+# | The bits of the header's flags.
+COMMENTING = 1
+EXITED = 2
+LARGE_STACK = 4
+WORDS = 8
+
+# | dumps()
+# |-----------------------------------------------------------------
+# | Returns a snapshot of the parser's session as bytes, which can
+# | be given to restore() to carry on the session from this point.
+# |------------------------------------------------------
+def dumps(parser):
+    stack = parser.stack
+    count, index, table = parser.random.state()
+
+    flags = ((COMMENTING if parser.isCommenting else 0) | (EXITED if parser.hasExited else 0)
+             | (LARGE_STACK if parser.largeStack else 0) | (WORDS if parser.words is not None else 0))
+
+    values = stack.stack[:stack.top]
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    parts = [HEADER.pack(MAGIC, VERSION, flags, parser.saturation, stack.stackLimit, stack.top, count, index, *table),
+             values.tobytes()]
+
+    if parser.words is not None:
+        parts.append(WORD_COUNT.pack(len(parser.words)))
+
+        for name, body in parser.words.items():
+            scope = parser.wordScopes[name]
+            name = name.encode("utf-8")
+            body = body.encode("utf-8")
+            parts += [WORD_LENGTHS[VERSION].pack(len(name), len(body), scope), name, body]
+
+    return b"".join(parts)
+
+# | settings()
+# |--------------------------------------------------------------------
+# | Returns the saturation, stack limit, and whether the large stack
+# | profile and words are used, of the session in the snapshot, so
+# | a parser can be created to restore it into.
+# |------------------------------------------
+def settings(data):
+    magic, version, flags, saturation, stackLimit = readHeader(data)[:5]
+
+    return saturation, stackLimit, bool(flags & LARGE_STACK), bool(flags & WORDS)
+
+# | restore()
+# |-----------------------------------------------------------------------
+# | Restores the parser to the session in the snapshot, which may be any
+# | bytes-like object, such as an mmap. The parser must have the same
+# | saturation and profile as the one the snapshot was taken of,
+# | raising ValueError if not, or if the snapshot's invalid, in which
+# | case the parser's left as it was.
+# |---------------------------------------------------
+def restore(parser, data):
+    header = readHeader(data)
+    magic, version, flags, saturation, stackLimit, top, count, index = header[:8]
+
+    if (saturation != parser.saturation or bool(flags & LARGE_STACK) != parser.largeStack
+            or bool(flags & WORDS) != (parser.words is not None)):
+        raise ValueError("Snapshot is of a parser with a different saturation or profile.")
+
+    end = HEADER.size + 8 * top
+
+    if top > stackLimit or len(data) < end:
+        raise ValueError("Snapshot is truncated.")
+
+    if flags & WORDS:
+        definitions = readWords(data, end, version)
+
+    stack = parser.stack
+    stack.stackLimit = stackLimit
+
+    values = array("q")
+
+    with memoryview(data) as view:
+        values.frombytes(view[HEADER.size:end])
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    # | The array's given at least the room the stack had, beyond which it grows as needed.
+    capacity = min(stackLimit, stack.capacity)
+
+    if len(values) < capacity:
+        values.frombytes(bytes(8 * (capacity - len(values))))
+
+    stack.stack = values
+    stack.capacity = len(values)
+    stack.top = top
+
+    parser.random.restore((count, index, header[8:]))
+    parser.isCommenting = bool(flags & COMMENTING)
+    parser.hasExited = bool(flags & EXITED)
+
+    if flags & WORDS:
+        restoreWords(parser, definitions)
+
+# | readHeader()
+# |------------------------------------------------------------------
+# | Returns the fields of the snapshot's header, raising ValueError
+# | if it's not a snapshot this can read.
+# |-----------------------------------
+def readHeader(data):
+    try:
+        header = HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Snapshot is truncated.")
+
+    magic, version = header[:2]
+
+    if magic != MAGIC:
+        raise ValueError("Not an SRPN snapshot.")
+
+    if version not in WORD_LENGTHS:
+        raise ValueError("Unsupported snapshot version " + str(version) + ".")
+
+    return header
+
+# | readWords()
+# |------------------------------------------------------------------
+# | Returns the (name, body, scope) of each word in the snapshot's
+# | trailer, which starts at the given position.
+# |-------------------------------------------
+def readWords(data, position, version):
+    definitions = []
+    wordLengths = WORD_LENGTHS[version]
+
+    try:
+        (wordCount,) = WORD_COUNT.unpack_from(data, position)
+        position += WORD_COUNT.size
+
+        for _ in range(wordCount):
+            nameLength, bodyLength, *scope = wordLengths.unpack_from(data, position)
+            position += wordLengths.size
+
+            # | A version 1 snapshot doesn't say, so each body's taken to have been able to name every word.
+            scope = scope[0] if scope else wordCount
+
+            if scope > wordCount:
+                raise struct.error
+
+            if position + nameLength + bodyLength > len(data):
+                raise struct.error
+
+            name = bytes(data[position:position + nameLength]).decode("utf-8")
+            position += nameLength
+            body = bytes(data[position:position + bodyLength]).decode("utf-8")
+            position += bodyLength
+
+            definitions.append((name, body, scope))
+
+    except (struct.error, UnicodeDecodeError):
+        raise ValueError("Snapshot's words are truncated or corrupt.")
+
+    return definitions
+
+# | restoreWords()
+# |-------------------------------------------------------------------
+# | Redefines the parser's words as those read from the snapshot, in
+# | the order they were first defined. Each body's compiled knowing
+# | only the words it knew when it was defined, so it names the
+# | same words, and reports the same errors, as it did then.
+# |---------------------------------------------------
+def restoreWords(parser, definitions):
+    parser.clearWords()
+
+    names = [name for name, body, scope in definitions]
+
+    for name, body, scope in definitions:
+        program, _ = parser.compiler.compile(body, False, dict.fromkeys(names[:scope]))
+        parser.defineWord(name, body, program)
+        parser.wordScopes[name] = scope
+
+# | dump()
+# |-----------------------------------------------------
+# | Writes a snapshot of the parser's session to a file.
+# |------------------------------------------------
+def dump(parser, path):
+    with open(path, "wb") as file:
+        file.write(dumps(parser))
+
+# | load()
+# |-------------------------------------------------------------------
+# | Restores the parser from a snapshot file, which is memory mapped
+# | rather than read, so only the parts needed are paged in.
+# |------------------------------------------------------
+def load(parser, path):
+    with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        restore(parser, data)
@@ -1,36 +1,57 @@
-from SaturatedNumber import SaturatedNumber
+from array import array
 from exceptions import StackOverflowException, StackUnderflowException, StackEmptyException
 
+# | The stack limit of the legacy system.
+LEGACY_STACK_LIMIT = 23
+
+# | The most items a stack with a larger limit has room for to begin with.
+INITIAL_CAPACITY = 4096
+
 # | SRPNStack()
-# |---------------------------------------------------------
-# | A stack created which holds a set of SaturatedNumbers.
-# |----------------------------------------------------
+# |-------------------------------------------------------------------
+# | A stack of saturated numbers, held in a preallocated array of
+# | 64 bit integers. Values are clamped to the saturated range
+# | as they're pushed, so no object is needed for each one.
+# | The array's grown as needed for large stack limits.
+# |-----------------------------------------------
 class SRPNStack:
 
-    def __init__(self, saturation):
+    def __init__(self, saturation, stackLimit=LEGACY_STACK_LIMIT):
+
+        # | Values are stored as 64 bit integers, so the saturated range must fit in one.
+        if saturation > 2 ** 63 - 1:
+            raise ValueError("Saturation must fit in a 64 bit integer.")
 
         self.saturation = saturation
-        self.stack = []
 
-        # | As defined by legacy system, there is a stack limit of 23
-        self.stackLimit = 23
+        # | As defined by legacy system, there is a stack limit of 23, unless another's given.
+        self.stackLimit = stackLimit
+
+        # | The values on the stack, from the bottom up. Only the first self.top are in use. A large
+        # | stack starts off smaller than its limit and grows, so it doesn't hold memory it's not using.
+        self.stack = array('q', bytes(8 * min(stackLimit, INITIAL_CAPACITY)))
+        self.capacity = len(self.stack)
+        self.top = 0
 
     # | push()
     # |-------------------------------------------------------------
     # | Checks that there is still space on the stack, raising
-    # | StackOverflowException if not, creates a new
-    # | SaturatedNumber() based on the value
-    # | parameter, and pushes this
-    # | onto the stack.
-    # |----------
+    # | StackOverflowException if not, and pushes the value
+    # | onto the stack, saturating it if it's out of range.
+    # |---------------------------------------------
     def push(self, value):
-        # | If we've reached the stack limit, raise a StackOverflowException
-        if len(self.stack) >= self.stackLimit:
-            raise StackOverflowException
-        # | Otherwise just push onto the stack
-        else:
-            number = SaturatedNumber(self.saturation, value)
-            self.stack.append(number)
+        # | If the array's full, grow it or, if we've reached the stack limit, raise a StackOverflowException
+        if self.top >= self.capacity:
+            self.reserve(self.top + 1)
+
+        # | Saturate the value if it's larger or smaller than the saturated range
+        if value > self.saturation:
+            value = self.saturation
+        elif value < -self.saturation - 1:
+            value = -self.saturation - 1
+
+        self.stack[self.top] = value
+        self.top += 1
 
     # | pop()
     # |---------------------------------------------------------------
@@ -42,11 +63,19 @@ class SRPNStack:
     # |-----------------------------
     def pop(self, index=0):
         # | If there are no items in the stack when trying to pop, raise a StackUnderflowException.
-        if len(self.stack) - index <= 0:
+        if self.top - index <= 0:
             raise StackUnderflowException()
-        # | Otherwise, pop the top item off the stack.
-        else:
-            return self.stack.pop(-1 - index).getValue()
+
+        position = self.top - 1 - index
+        value = self.stack[position]
+
+        # | If the item isn't the top one, move the items above it down to fill the gap.
+        if index > 0:
+            self.stack[position:self.top - 1] = self.stack[position + 1:self.top]
+
+        self.top -= 1
+
+        return value
 
     # | peek()
     # |----------------------------------------------------
@@ -55,19 +84,78 @@ class SRPNStack:
     # |-----------------------------------------
     def peek(self, index=0):
         # | If trying to peek at an empty stack, raise a StackEmptyException
-        if len(self.stack) == 0:
+        if self.top == 0:
             raise StackEmptyException
 
-        if index > len(self.stack):
+        if index >= self.top:
             raise IndexError
 
-        # | We do [-1 - index] as this let's an index of, say, 4 to be
+        # | We do top - 1 - index as this let's an index of, say, 4 to be
         # | passed, getting the 4th item from the top of the stack.
-        return self.stack[-1 - index].getValue()
+        return self.stack[self.top - 1 - index]
+
+    # | reserve()
+    # |-----------------------------------------------------------------
+    # | Grows the array, at least doubling it, so that it has room for
+    # | the given number of items, raising StackOverflowException if
+    # | that's more than the stack limit.
+    # |------------------------------------
+    def reserve(self, size):
+        if size > self.stackLimit:
+            raise StackOverflowException
+
+        if size > self.capacity:
+            capacity = min(max(size, 2 * self.capacity), self.stackLimit)
+            self.stack.frombytes(bytes(8 * (capacity - self.capacity)))
+            self.capacity = capacity
+
+    # | popAll()
+    # |-----------------------------------------------------------
+    # | Removes every item from the stack, returning their values
+    # | from the bottom up as an array.
+    # |---------------------------
+    def popAll(self):
+        values = self.stack[:self.top]
+        self.top = 0
+
+        return values
+
+    # | duplicate()
+    # |---------------------------------------------------------------
+    # | Pushes copies of the top count items, in the same order, in
+    # | one go, raising StackUnderflowException if there aren't
+    # | that many or StackOverflowException if there's no room.
+    # |----------------------------------------------
+    def duplicate(self, count):
+        if count > self.top:
+            raise StackUnderflowException()
+
+        self.reserve(self.top + count)
+
+        self.stack[self.top:self.top + count] = self.stack[self.top - count:self.top]
+        self.top += count
+
+    # | drop()
+    # |-----------------------------------------------------------
+    # | Removes the top count items in one go, raising a
+    # | StackUnderflowException if there aren't that many.
+    # |-------------------------------------------
+    def drop(self, count):
+        if count > self.top:
+            raise StackUnderflowException()
+
+        self.top -= count
+
+    # | clear()
+    # |------------------------------------
+    # | Removes every item from the stack.
+    # |-------------------------------
+    def clear(self):
+        self.top = 0
 
     # | count()
     # |--------------------------------------------
     # | Returns the number of items on the stack.
     # |----------------------------------------
     def count(self):
-        return len(self.stack)
+        return self.top
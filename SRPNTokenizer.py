@@ -0,0 +1,211 @@
+from SRPNInfixEvaluator import evaluateInfix, DEADLINE_OPERANDS
+import helpers
+
+# | The kinds of token produced by the tokenizer. Each token is a tuple
+# | of (kind, value), where the value is:
+# |   NUMBER       - the integer value of the operand
+# |   OPERATOR     - the symbol of the operation
+# |   COMMENT      - the '#' which toggles the comment
+# |   UNRECOGNISED - the erroneous input
+NUMBER = 0
+OPERATOR = 1
+COMMENT = 2
+UNRECOGNISED = 3
+
+# | The symbols of all the operations understood by the calculator.
+OPERATIONS = frozenset(["+", "-", "*", "/", "^", "%", "=", "d", "r", "£", "#"])
+
+# | The bulk operations, over the whole stack, of the large stack profile.
+BULK_OPERATIONS = frozenset(["sum", "prod", "min", "max", "dupn", "dropn"])
+
+# | The keyword which repeats an operation, when user-defined words are allowed.
+REPEAT = "repeat"
+
+# | SRPNTokenizer
+# |--------------------------------------------------------------------------
+# | Splits lines of input into tokens in a single pass, yielding each one
+# | as soon as it's found. Items which have operands 'stuck' to operators
+# | are split into fragments as they're scanned, with each fragment
+# | evaluated as infix or, failing that, split into its elements.
+# | Keeps track of whether or not the input is in a comment. If it's
+# | given the user-defined words, items naming one of them (or the
+# | repeat keyword) are tokenized as operators, as are the bulk
+# | operations for the large stack profile.
+# |---------------------------------------------------
+class SRPNTokenizer:
+
+    def __init__(self, saturation, isCommenting=False, words=None, largeStack=False, checkDeadline=None):
+        # | The value which infix fragments are saturated to as they're evaluated.
+        self.saturation = saturation
+
+        self.isCommenting = isCommenting
+
+        # | The names of the user-defined words, or None if they're not allowed.
+        self.words = words
+
+        # | Whether the bulk operations are understood.
+        self.largeStack = largeStack
+
+        # | Called now and then while evaluating long infix fragments, to stop them if they run out of time.
+        self.checkDeadline = checkDeadline
+
+    # | tokenize()
+    # |---------------------------------------------------------------
+    # | Generator which yields the tokens in the input string, which
+    # | is split on its spaces into items.
+    # |--------------------------------
+    def tokenize(self, inputString):
+        length = len(inputString)
+        position = 0
+
+        while position <= length:
+            # | If we're in the middle of a comment, skip straight to the item which ends it.
+            if self.isCommenting:
+                position = self.findCommentEnd(inputString, position)
+
+                if position < 0:
+                    return
+
+            end = inputString.find(" ", position)
+
+            if end < 0:
+                end = length
+
+            item = inputString[position:end]
+            position = end + 1
+
+            # | The common items are handled here rather than in tokenizeItem(), saving a generator for each.
+            if item in OPERATIONS and item != "#":
+                yield (OPERATOR, item)
+
+            elif item.isdigit():
+                value = helpers.literalValue(item)
+
+                if value is not None:
+                    yield (NUMBER, value)
+
+            else:
+                yield from self.tokenizeItem(item, self.tokenizeNoSpaces)
+
+    # | findCommentEnd()
+    # |----------------------------------------------------------------------
+    # | Returns the position of the next item in the input which is a '#'
+    # | on its own, starting from the given position, or -1 if there's
+    # | no such item so the comment continues onto the next input.
+    # |------------------------------------------------------
+    def findCommentEnd(self, inputString, position):
+        index = inputString.find("#", position)
+
+        while index >= 0:
+            startsItem = index == position or inputString[index - 1] == " "
+            endsItem = index + 1 == len(inputString) or inputString[index + 1] == " "
+
+            if startsItem and endsItem:
+                return index
+
+            index = inputString.find("#", index + 1)
+
+        return -1
+
+    # | tokenizeItem()
+    # |-------------------------------------------------------------------
+    # | Generator which yields the tokens for a single item, using the
+    # | given splitter for items which are neither an operation nor
+    # | an operand, but are made up of more than one character.
+    # |------------------------------------------------
+    def tokenizeItem(self, item, splitter):
+        # | If we're in the middle of a comment and the comment isn't ending, the item's skipped.
+        if self.isCommenting and item != "#":
+            return
+
+        if item == "#":
+            self.isCommenting = not self.isCommenting
+            yield (COMMENT, item)
+
+        elif item in OPERATIONS:
+            yield (OPERATOR, item)
+
+        elif self.largeStack and item in BULK_OPERATIONS:
+            yield (OPERATOR, item)
+
+        elif self.words is not None and (item in self.words or item == REPEAT):
+            yield (OPERATOR, item)
+
+        elif item.isdigit() or helpers.isNegativeNumber(item):
+            value = helpers.literalValue(item)
+
+            if value is not None:
+                yield (NUMBER, value)
+
+        elif len(item) > 1:
+            yield from splitter(item)
+
+        else:
+            yield (UNRECOGNISED, item)
+
+    # | tokenizeNoSpaces()
+    # |-----------------------------------------------------------------------
+    # | Generator which splits an item that isn't able to be separated by
+    # | its spaces into fragments which are either valid (and maybe
+    # | infix) or invalid, yielding the tokens of each in turn.
+    # |------------------------------------------------
+    def tokenizeNoSpaces(self, item):
+        start = 0
+
+        # | Only long items are checked for running out of time as they're scanned.
+        checkDeadline = self.checkDeadline if len(item) > DEADLINE_OPERANDS else None
+
+        for index, character in enumerate(item):
+            if checkDeadline is not None and index % DEADLINE_OPERANDS == 0:
+                checkDeadline()
+
+            # | If the character isn't technically valid, the fragment so far and the character are each tokenized.
+            if not character.isdigit() and character not in OPERATIONS:
+                yield from self.tokenizeFragment(item[start:index])
+                yield from self.tokenizeItem(character, self.tokenizeElements)
+                start = index + 1
+
+            # | If the fragment so far ends with an operation and this character is also an
+            # | operation, the fragment so far and the operation are each tokenized.
+            elif index > start and item[index - 1] in OPERATIONS and character in OPERATIONS:
+                yield from self.tokenizeFragment(item[start:index])
+                yield from self.tokenizeItem(character, self.tokenizeElements)
+                start = index + 1
+
+        yield from self.tokenizeFragment(item[start:])
+
+    # | tokenizeFragment()
+    # |-----------------------------------------------------------------
+    # | Generator which yields the tokens of a fragment, which is the
+    # | value of the fragment should it be valid infix, otherwise
+    # | the tokens of each of the fragment's elements.
+    # |--------------------------------------------
+    def tokenizeFragment(self, fragment):
+        if self.isCommenting and fragment != "#":
+            return
+
+        value = evaluateInfix(fragment, self.saturation, self.checkDeadline)
+
+        if value is not None:
+            yield (NUMBER, value)
+        else:
+            yield from self.tokenizeItem(fragment, self.tokenizeElements)
+
+    # | tokenizeElements()
+    # |--------------------------------------------------------------------
+    # | Generator which splits a fragment that isn't valid infix into its
+    # | operands and operations, yielding the tokens of each in turn.
+    # |----------------------------------------------------------
+    def tokenizeElements(self, fragment):
+        start = 0
+
+        for index, character in enumerate(fragment):
+            if not character.isdigit():
+                if index > start:
+                    yield from self.tokenizeItem(fragment[start:index], self.tokenizeElements)
+
+                yield from self.tokenizeItem(character, self.tokenizeElements)
+                start = index + 1
+
+        if start < len(fragment):
+            yield from self.tokenizeItem(fragment[start:], self.tokenizeElements)
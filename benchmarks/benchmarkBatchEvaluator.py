@@ -0,0 +1,45 @@
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import numpy as np
+
+from SRPNBatchEvaluator import SRPNBatchEvaluator
+from SRPNInputParser import SRPNInputParser
+
+# | Benchmark of evaluating one program over many rows of operands with SRPNBatchEvaluator,
+# | against looping SRPNInputParser.parse() over each row.
+# | Run with: python benchmarks/benchmarkBatchEvaluator.py [rows]
+
+saturation = 2147483647
+script = "* + 3 ^ 1000 % 7 - ="
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    operands = np.random.default_rng(0).integers(-1000, 1000, size=(rows, 3))
+
+    evaluator = SRPNBatchEvaluator(saturation)
+    program = evaluator.compile(script)
+
+    start = time.perf_counter()
+    evaluator.evaluate(program, operands)
+    batchSeconds = time.perf_counter() - start
+
+    # | Only a sample of rows is looped over, as doing them all would take too long.
+    sample = min(rows, 20000)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for row in operands[:sample]:
+            parser = SRPNInputParser(saturation)
+            parser.parse(" ".join(str(value) for value in row))
+            parser.parse(script)
+    loopSeconds = (time.perf_counter() - start) * rows / sample
+
+    print("batch:  %10.0f rows/s" % (rows / batchSeconds))
+    print("parse:  %10.0f rows/s" % (rows / loopSeconds))
+    print("speedup: %.0fx" % (loopSeconds / batchSeconds))
@@ -0,0 +1,39 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SRPNBatchRunner import runMany
+
+# | Benchmark of how runMany() scales from 1 worker up to one per core.
+# | Run with: python benchmarks/benchmarkBatchRunner.py [scripts] [maxWorkers]
+
+# | makeScripts()
+# |--------------------------------------------------
+# | Returns a list of randomly generated scripts.
+# |---------------------------------------------
+def makeScripts(count):
+    generator = random.Random(0)
+    lines = ["3 3 + =", "d", "1 2 * 3 -", "10 -", "r +", "12*3-1 =", "2 ^ 5 %"]
+
+    return ["\n".join(generator.choice(lines) for _ in range(50)) for _ in range(count)]
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    maxWorkers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+    scripts = makeScripts(count)
+
+    baseline = None
+
+    for workers in range(1, maxWorkers + 1):
+        start = time.perf_counter()
+
+        for output in runMany(scripts, workers=workers, chunksize=64):
+            pass
+
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+
+        print("%2d workers: %8.0f scripts/s  %5.2fx" % (workers, count / seconds, baseline / seconds))
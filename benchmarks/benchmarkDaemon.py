@@ -0,0 +1,77 @@
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# | Benchmark of running a short script cold, by starting main.py for it, against running it warm,
+# | through srpnClient.py on a server which has already started and imported the calculator.
+# | Run with: python benchmarks/benchmarkDaemon.py [runs]
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+script = b"10 20 +\n3 *\n=\nr r +\nd\n"
+
+# | timeRuns()
+# |-------------------------------------------------------------------
+# | Returns the seconds each of the runs of the command takes to run
+# | the script, checking each gives the expected output.
+# |-----------------------------------------------
+def timeRuns(command, runs, environment, expected):
+    times = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run(command, input=script, stdout=subprocess.PIPE, env=environment, check=True)
+        times.append(time.perf_counter() - start)
+
+        if result.stdout != expected:
+            raise AssertionError("Unexpected output: " + repr(result.stdout))
+
+    return times
+
+# | waitForSocket()
+# |------------------------------------------------------------
+# | Waits until the server's created its socket, or has exited.
+# |-------------------------------------------------------
+def waitForSocket(server, path):
+    while not os.path.exists(path):
+        if server.poll() is not None:
+            raise RuntimeError("The server exited before it started listening.")
+
+        time.sleep(0.01)
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "srpn.sock")
+    environment = dict(os.environ, SRPN_SOCKET=path)
+
+    server = subprocess.Popen([sys.executable, os.path.join(root, "SRPNServer.py"), "--unix", path])
+
+    try:
+        waitForSocket(server, path)
+
+        cold = [sys.executable, os.path.join(root, "main.py")]
+        warm = [sys.executable, os.path.join(root, "srpnClient.py")]
+
+        expected = subprocess.run(cold, input=script, stdout=subprocess.PIPE, check=True).stdout
+
+        print("%-34s %10s %10s" % ("", "median", "mean"))
+
+        for name, command in (("cold, python main.py", cold), ("warm, python srpnClient.py", warm)):
+            times = timeRuns(command, runs, environment, expected)
+
+            print("%-34s %8.1fms %8.1fms" % (name, statistics.median(times) * 1e3, statistics.mean(times) * 1e3))
+
+    finally:
+        server.terminate()
+        server.wait()
+
+        if os.path.exists(path):
+            os.unlink(path)
+
+        os.rmdir(directory)
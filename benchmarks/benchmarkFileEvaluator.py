@@ -0,0 +1,69 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SRPNFileEvaluator import SRPNFileEvaluator
+from SRPNInputParser import SRPNInputParser
+from main import readLines
+
+# | Benchmark of running a large generated script file through SRPNFileEvaluator, memory mapped and
+# | compiled from bytes, against reading it as text and parsing it line by line as main.py does.
+# | Run with: python benchmarks/benchmarkFileEvaluator.py [megabytes]
+
+saturation = 2147483647
+
+# | writeScript()
+# |----------------------------------------------------------------------
+# | Writes a script of around the given size to the file, made up of
+# | lines repeated from a smaller set, as generated scripts are. Each
+# | line leaves the stack as deep as it found it.
+# |------------------------------------------
+def writeScript(file, size):
+    rng = random.Random(1)
+    lines = []
+
+    for _ in range(1000):
+        a, b, c, d, e = (str(rng.randint(1, 99999)) for _ in range(5))
+        lines.append((a + " " + b + " + " + c + " * " + d + " - " + e + " / +\n").encode("utf-8"))
+
+    lines.append(b"=\n")
+
+    written = 0
+
+    while written < size:
+        line = rng.choice(lines)
+        file.write(line)
+        written += len(line)
+
+    return written
+
+if __name__ == "__main__":
+    megabytes = float(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.NamedTemporaryFile(suffix=".srpn", delete=False) as file:
+        size = writeScript(file, int(megabytes * 1e6))
+
+    output = open(os.devnull, "w")
+
+    try:
+        parser = SRPNInputParser(saturation, output=output)
+        start = time.perf_counter()
+
+        with open(file.name, encoding="utf-8") as script:
+            for line in readLines(script):
+                parser.parse(line)
+
+        seconds = time.perf_counter() - start
+        print("%-28s %8.2fs  %7.1f MB/s" % ("text, parse() per line", seconds, size / 1e6 / seconds))
+
+        evaluator = SRPNFileEvaluator(SRPNInputParser(saturation, output=output))
+        evaluator.evaluateFile(file.name)
+
+        print("%-28s %8.2fs  %7.1f MB/s" % ("mmap, bytes", evaluator.seconds, evaluator.throughput()))
+
+    finally:
+        os.unlink(file.name)
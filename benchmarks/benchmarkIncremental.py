@@ -0,0 +1,88 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SRPNIncrementalEvaluator import SRPNIncrementalEvaluator
+from SRPNInputParser import SRPNInputParser
+
+# | Benchmark of evaluating a script again after editing one of its lines, with SRPNIncrementalEvaluator
+# | resuming from a checkpoint, against evaluating the whole script again as an editor used to.
+# | Run with: python benchmarks/benchmarkIncremental.py [lines]
+
+saturation = 2147483647
+
+# | makeScript()
+# |-------------------------------------------------------------------
+# | Returns a script of the given number of lines, each of which adds
+# | its result to a running total, the total being printed as it goes.
+# |--------------------------------------------------------------
+def makeScript(length):
+    rng = random.Random(1)
+    lines = ["0"]
+
+    for _ in range(length - 1):
+        a, b, c = (str(rng.randint(1, 9999)) for _ in range(3))
+        lines.append(a + " " + b + " + " + c + " * 1000 % + =")
+
+    return lines
+
+# | makeOutputScript()
+# |------------------------------------------------------------------
+# | Returns a script of the given number of lines, each of which
+# | prints a result but leaves the stack as it found it, so an edit
+# | to any of them changes only that line's output.
+# |------------------------------------------
+def makeOutputScript(length):
+    rng = random.Random(1)
+    lines = ["0"]
+
+    for _ in range(length - 1):
+        a, b, c = (str(rng.randint(1, 9999)) for _ in range(3))
+        lines.append(a + " " + b + " + " + c + " * = 0 * +")
+
+    return lines
+
+# | timeEdit()
+# |-------------------------------------------------------------------
+# | Evaluates the script, then times evaluating it again with the line
+# | at the given index replaced, both from scratch and incrementally.
+# | Returns the seconds each took and the lines run incrementally.
+# |-------------------------------------------------------
+def timeEdit(lines, index, replacement):
+    edited = list(lines)
+    edited[index] = replacement
+
+    parser = SRPNInputParser(saturation)
+
+    start = time.perf_counter()
+    expected = [parser.parseEvents(line) for line in edited]
+    full = time.perf_counter() - start
+
+    evaluator = SRPNIncrementalEvaluator(SRPNInputParser(saturation))
+    evaluator.evaluate(lines)
+
+    start = time.perf_counter()
+    outputs = evaluator.evaluate(edited)
+    incremental = time.perf_counter() - start
+
+    if outputs != expected:
+        raise AssertionError("Incremental output differs from a full run.")
+
+    return full, incremental, evaluator.linesRun
+
+if __name__ == "__main__":
+    length = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    middle = length // 2
+
+    print("%-36s %10s %12s %10s" % ("edit", "full", "incremental", "lines run"))
+
+    for name, lines, replacement in (("output only, middle line", makeOutputScript(length), "1 2 + 3 * = 0 * +"),
+                                     ("changes the total, middle line", makeScript(length), "1 2 + 3 * 1000 % + ="),
+                                     ("changes the total, last line", makeScript(length), "5 +")):
+        index = length - 1 if "last" in name else middle
+        full, incremental, linesRun = timeEdit(lines, index, replacement)
+
+        print("%-36s %8.1fms %10.1fms %10d" % (name, full * 1e3, incremental * 1e3, linesRun))
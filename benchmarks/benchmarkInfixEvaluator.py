@@ -0,0 +1,52 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SRPNInfixEvaluator import evaluate, evaluateInfix
+
+# | Benchmark of the native infix evaluator against the eval() path it replaced.
+# | Run with: python benchmarks/benchmarkInfixEvaluator.py
+
+saturation = 2147483647
+
+# | Fragments typical of no-space input, all valid for both evaluators.
+fragments = ["3+4", "12*3-1", "7/2", "100-5*6", "5%3", "1+2+3+4+5+6+7+8+9", "-20+6*7"]
+
+repeats = 20000
+
+# | evalPath()
+# |------------------------------------------------
+# | The previous behaviour of evaluating fragments.
+# |--------------------------------------------
+def evalPath(fragment):
+    try:
+        return int(eval(fragment))
+    except (ValueError, SyntaxError, NameError):
+        return None
+
+# | timePerFragment()
+# |-------------------------------------------------------------
+# | Returns the mean time, in microseconds, taken to evaluate
+# | each of the fragments using the given function.
+# |-----------------------------------------
+def timePerFragment(function):
+    timer = timeit.Timer(lambda: [function(fragment) for fragment in fragments])
+    seconds = min(timer.repeat(repeat=3, number=repeats // len(fragments)))
+
+    return seconds / (repeats // len(fragments) * len(fragments)) * 1e6
+
+if __name__ == "__main__":
+    results = [("eval()", timePerFragment(evalPath)),
+               ("native", timePerFragment(lambda fragment: evaluate(fragment, saturation))),
+               ("native, memoized", timePerFragment(lambda fragment: evaluateInfix(fragment, saturation)))]
+
+    baseline = results[0][1]
+
+    for name, microseconds in results:
+        print("%-18s %8.2f us/fragment  %6.1fx" % (name, microseconds, baseline / microseconds))
+
+    # | A fragment which used to hang eval() as 9**9**9 does, now saturated straight away.
+    seconds = timeit.timeit(lambda: evaluate("9^9^9", saturation), number=1000) / 1000
+    print("%-18s %8.2f us/fragment" % ("9^9^9 (native)", seconds * 1e6))
@@ -0,0 +1,57 @@
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SRPNCompiler import PUSH, OPERATE
+from SRPNInputParser import SRPNInputParser
+
+# | Benchmark of each operation pushing its result straight onto the stack with pushValue(), against
+# | sending it back through the literal path as text, as every operation did before.
+# | Run with: python benchmarks/benchmarkPushPaths.py
+
+saturation = 2147483647
+
+# | RoundTripParser
+# |---------------------------------------------------------------
+# | A parser whose operations push their results as pushOperand()
+# | used to, formatting each one as text and parsing it back.
+# |--------------------------------------------
+class RoundTripParser(SRPNInputParser):
+
+    def pushValue(self, value):
+        item = str(value)
+        SRPNInputParser.pushValue(self, int(item, 8 if item[0] == "0" else 10))
+
+# | timeOperations()
+# |----------------------------------------------------------------------
+# | Returns the time, in nanoseconds, each parser takes to push two
+# | operands and perform the operation on them. The parsers are timed
+# | in turn, several times over, so that they see the same noise.
+# |----------------------------------------------------
+def timeOperations(parsers, symbol):
+    program = ((PUSH, 1234567), (PUSH, 3), (OPERATE, symbol))
+    number = 20000
+    best = [float("inf")] * len(parsers)
+
+    for _ in range(15):
+        for index, parser in enumerate(parsers):
+            def run():
+                parser.execute(program)
+                parser.stack.clear()
+
+            best[index] = min(best[index], timeit.timeit(run, number=number) / number * 1e9)
+
+    return best
+
+if __name__ == "__main__":
+    output = open(os.devnull, "w")
+    parsers = (RoundTripParser(saturation, output=output), SRPNInputParser(saturation, output=output))
+
+    print("%-10s %14s %14s %10s" % ("operation", "round trip", "pushValue", "saving"))
+
+    for symbol in ("+", "-", "*", "/", "%", "^", "r"):
+        before, after = timeOperations(parsers, symbol)
+
+        print("%-10s %11.0f ns %11.0f ns %7.0f ns" % (symbol, before, after, before - after))
@@ -0,0 +1,92 @@
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SRPNStack import SRPNStack
+from SaturatedNumber import SaturatedNumber
+from exceptions import StackOverflowException, StackUnderflowException
+
+# | Benchmark of the array backed SRPNStack against the list of SaturatedNumbers it replaced.
+# | Run with: python benchmarks/benchmarkStack.py
+
+saturation = 2147483647
+
+# | LegacyStack
+# |-------------------------------------------------------------
+# | The previous SRPNStack, which allocated a SaturatedNumber
+# | for every value pushed.
+# |--------------------
+class LegacyStack:
+
+    def __init__(self, saturation):
+        self.saturation = saturation
+        self.stack = []
+        self.stackLimit = 23
+
+    def push(self, value):
+        if len(self.stack) >= self.stackLimit:
+            raise StackOverflowException
+        self.stack.append(SaturatedNumber(self.saturation, value))
+
+    def pop(self, index=0):
+        if len(self.stack) - index <= 0:
+            raise StackUnderflowException()
+        return self.stack.pop(-1 - index).getValue()
+
+    def peek(self, index=0):
+        return self.stack[-1 - index].getValue()
+
+    def count(self):
+        return len(self.stack)
+
+# | workload()
+# |----------------------------------------------------------------
+# | Fills the stack, peeks through it as 'd' does, then pops the
+# | operands off in pairs as the operators do.
+# |-------------------------------------
+def workload(stack):
+    for value in range(-10, 13):
+        stack.push(value * 300000000)
+
+    for index in range(stack.count()):
+        stack.peek(index)
+
+    while stack.count() >= 2:
+        stack.pop(1)
+        stack.pop()
+
+    stack.pop()
+
+# | allocations()
+# |--------------------------------------------------------------
+# | Returns the number of memory blocks, and bytes, allocated
+# | and still held while the stack's full.
+# |---------------------------------
+def allocations(stackClass):
+    stack = stackClass(saturation)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    for value in range(23):
+        stack.push(value * 300000000)
+
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    statistics = after.compare_to(before, "filename")
+    return sum(stat.count_diff for stat in statistics), sum(stat.size_diff for stat in statistics)
+
+if __name__ == "__main__":
+    number = 20000
+
+    for name, stackClass in (("list of SaturatedNumber", LegacyStack), ("array('q')", SRPNStack)):
+        stack = stackClass(saturation)
+        seconds = min(timeit.repeat(lambda: workload(stack), repeat=3, number=number))
+        blocks, size = allocations(stackClass)
+
+        print("%-24s %8.2f us/workload  %6d blocks  %7d bytes held by a full stack"
+              % (name, seconds / number * 1e6, blocks, size))
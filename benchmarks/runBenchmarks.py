@@ -0,0 +1,301 @@
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from SRPNCompiler import PUSH, OPERATE
+from SRPNInputParser import SRPNInputParser
+
+# | Microbenchmark suite covering the hot paths of the parser and stack. Each benchmark is timed
+# | separately, and the results written as JSON and compared against a stored baseline, failing
+# | with status 1 if any benchmark has got slower than the baseline by more than the threshold.
+# | Run with: python benchmarks/runBenchmarks.py [--output results.json] [--save-baseline]
+
+saturation = 2147483647
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# | newParser()
+# |---------------------------------------------------------------
+# | Returns a parser whose output is discarded, optionally with
+# | its program cache disabled so that every parse compiles.
+# |----------------------------------------------------
+def newParser(cacheSize=256, allowWords=False, largeStack=False):
+    return SRPNInputParser(saturation, cacheSize, output=open(os.devnull, "w"), allowWords=allowWords,
+                           largeStack=largeStack)
+
+# | Each benchmark returns a function to time, and the number of operations each call performs.
+
+def benchmarkSpacedTokens():
+    parser = newParser()
+    line = "3 3 + 4 * 10 - 2 / 7 % ="
+
+    def run():
+        parser.parse(line)
+        parser.stack.clear()
+
+    return run, 1
+
+def benchmarkSpacedTokensUncached():
+    parser = newParser(cacheSize=0)
+    line = "3 3 + 4 * 10 - 2 / 7 % ="
+
+    def run():
+        parser.parse(line)
+        parser.stack.clear()
+
+    return run, 1
+
+def benchmarkNoSpacesBlob():
+    parser = newParser(cacheSize=0)
+    line = "+".join(str(value) for value in range(1, 2001)) + "*3-7/2"
+
+    def run():
+        parser.parse(line)
+        parser.stack.clear()
+
+    return run, 1
+
+def benchmarkOperator(symbol):
+    def benchmark():
+        parser = newParser()
+        program = ((PUSH, 1234567), (PUSH, 3), (OPERATE, symbol))
+
+        def run():
+            parser.execute(program)
+            parser.stack.clear()
+
+        return run, 1
+
+    return benchmark
+
+def benchmarkDFullStack():
+    parser = newParser()
+
+    for value in range(parser.stack.stackLimit):
+        parser.stack.push(value * 1000003)
+
+    return parser.d, 1
+
+def benchmarkRBurst():
+    parser = newParser()
+    program = ((OPERATE, "r"),) * 20
+
+    def run():
+        parser.execute(program)
+        parser.stack.clear()
+
+    return run, 20
+
+def benchmarkOctalLiterals():
+    parser = newParser(cacheSize=0)
+    line = "017 0777 01234567 08 0 0123 0644 077777"
+
+    def run():
+        parser.parse(line)
+        parser.stack.clear()
+
+    return run, 8
+
+def benchmarkOverflow():
+    parser = newParser()
+
+    for value in range(parser.stack.stackLimit):
+        parser.stack.push(value)
+
+    program = ((PUSH, 1),) * 20
+    return (lambda: parser.execute(program)), 20
+
+def benchmarkUnderflow():
+    parser = newParser()
+    program = ((OPERATE, "+"),) * 20
+
+    return (lambda: parser.execute(program)), 20
+
+def benchmarkInvalidOctal():
+    parser = newParser(cacheSize=0)
+    line = "0999 0189 0777779 08 09 01238"
+
+    def run():
+        parser.parse(line)
+        parser.stack.clear()
+
+    return run, 6
+
+def benchmarkEmpty():
+    parser = newParser()
+    program = ((OPERATE, "="),) * 20
+
+    return (lambda: parser.execute(program)), 20
+
+# | The number of items the large stack benchmarks fill the stack with.
+LARGE_STACK_ITEMS = 100000
+
+def largeStackParser():
+    parser = newParser(largeStack=True)
+
+    for value in range(LARGE_STACK_ITEMS):
+        parser.stack.push(value * 1000003)
+
+    return parser
+
+def benchmarkLargeStackDump():
+    return largeStackParser().d, LARGE_STACK_ITEMS
+
+def benchmarkLargeStackSum():
+    parser = largeStackParser()
+
+    # | The sum replaces the bottom item, but the stack's otherwise restored by putting its top back.
+    def run():
+        parser.sumAll()
+        parser.stack.top = LARGE_STACK_ITEMS
+
+    return run, LARGE_STACK_ITEMS
+
+def benchmarkWordCall():
+    parser = newParser(allowWords=True)
+    parser.parse(": step 3 * 7 + 1000 % ;")
+    line = "1 step step step step step step step step step step"
+
+    def run():
+        parser.parse(line)
+        parser.stack.clear()
+
+    return run, 10
+
+def benchmarkWordRepeat():
+    parser = newParser(allowWords=True)
+    parser.parse(": step 3 * 7 + 1000 % ;")
+    line = "1 repeat 1000 step"
+
+    def run():
+        parser.parse(line)
+        parser.stack.clear()
+
+    return run, 1000
+
+# | A line which overflows the stack, then adds until it underflows, as parsed and as interpreted.
+ERROR_HEAVY_LINE = "1 " * 30 + "+ " * 35
+
+def benchmarkErrorHeavyLine():
+    parser = newParser()
+
+    def run():
+        parser.parse(ERROR_HEAVY_LINE)
+        parser.stack.clear()
+
+    return run, 65
+
+def benchmarkErrorHeavyLineInterpreted():
+    parser = newParser()
+
+    def run():
+        parser.interpret(ERROR_HEAVY_LINE)
+        parser.stack.clear()
+
+    return run, 65
+
+BENCHMARKS = {
+    "parse.spacedTokens": benchmarkSpacedTokens,
+    "parse.spacedTokensUncached": benchmarkSpacedTokensUncached,
+    "parse.noSpacesBlob": benchmarkNoSpacesBlob,
+    "operator.add": benchmarkOperator("+"),
+    "operator.subtract": benchmarkOperator("-"),
+    "operator.multiply": benchmarkOperator("*"),
+    "operator.divide": benchmarkOperator("/"),
+    "operator.mod": benchmarkOperator("%"),
+    "operator.exponentiate": benchmarkOperator("^"),
+    "operator.d.fullStack": benchmarkDFullStack,
+    "operator.r.burst": benchmarkRBurst,
+    "literal.octal": benchmarkOctalLiterals,
+    "error.overflow": benchmarkOverflow,
+    "error.underflow": benchmarkUnderflow,
+    "largeStack.d": benchmarkLargeStackDump,
+    "largeStack.sum": benchmarkLargeStackSum,
+    "word.call": benchmarkWordCall,
+    "word.repeat": benchmarkWordRepeat,
+    "error.empty": benchmarkEmpty,
+    "error.invalidOctal": benchmarkInvalidOctal,
+    "error.heavyLine": benchmarkErrorHeavyLine,
+    "error.heavyLineInterpreted": benchmarkErrorHeavyLineInterpreted,
+}
+
+# | timeBenchmark()
+# |---------------------------------------------------------------------
+# | Returns the time, in nanoseconds, per operation of the benchmark,
+# | taking the best of several repeats of around 0.2s each.
+# |-------------------------------------------------
+def timeBenchmark(benchmark, repeat):
+    run, operations = benchmark()
+
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    number = max(1, number)
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number / operations * 1e9
+
+# | compare()
+# |-------------------------------------------------------------------
+# | Prints each result against the baseline, returning the names of
+# | those which are slower than it by more than the threshold.
+# |-------------------------------------------------
+def compare(results, baseline, threshold):
+    regressions = []
+
+    for name, nanoseconds in results.items():
+        if name in baseline:
+            change = nanoseconds / baseline[name] - 1
+            regressed = change > threshold
+
+            if regressed:
+                regressions.append(name)
+
+            print("%-30s %12.0f ns  %+7.1f%%%s" % (name, nanoseconds, change * 100, "  REGRESSED" if regressed else ""))
+        else:
+            print("%-30s %12.0f ns  (no baseline)" % (name, nanoseconds))
+
+    return regressions
+
+if __name__ == "__main__":
+    argumentParser = argparse.ArgumentParser(description="Runs the SRPN microbenchmarks.")
+    argumentParser.add_argument("--output", help="file to write the results to as JSON, rather than stdout")
+    argumentParser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file to compare against")
+    argumentParser.add_argument("--save-baseline", action="store_true", help="save the results as the baseline")
+    argumentParser.add_argument("--threshold", type=float, default=0.25,
+                                help="fraction slower than the baseline that counts as a regression")
+    argumentParser.add_argument("--repeat", type=int, default=5)
+    argumentParser.add_argument("--filter", default="", help="only run benchmarks whose names contain this")
+    arguments = argumentParser.parse_args()
+
+    results = {name: timeBenchmark(benchmark, arguments.repeat)
+               for name, benchmark in BENCHMARKS.items() if arguments.filter in name}
+
+    document = json.dumps({"unit": "ns/op", "results": results}, indent=2, sort_keys=True)
+
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(document + "\n")
+    else:
+        print(document)
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, "w") as file:
+            file.write(document + "\n")
+        sys.exit(0)
+
+    if not os.path.exists(arguments.baseline):
+        print("No baseline at " + arguments.baseline + ", run with --save-baseline to create one.", file=sys.stderr)
+        sys.exit(0)
+
+    with open(arguments.baseline) as file:
+        baseline = json.load(file)["results"]
+
+    regressions = compare(results, baseline, arguments.threshold)
+
+    if regressions:
+        print("%d benchmark(s) regressed by more than %.0f%%: %s"
+              % (len(regressions), arguments.threshold * 100, ", ".join(regressions)), file=sys.stderr)
+        sys.exit(1)
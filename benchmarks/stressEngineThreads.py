@@ -0,0 +1,77 @@
+import os
+import random
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# | Make threads switch as often as possible, to shake out any shared state.
+sys.setswitchinterval(1e-6)
+
+from SRPNEngine import SRPNEngine, SRPNEngineExecutor
+
+# | Stress test of the engine's thread safety. Runs many scripts on many threads at once, both
+# | through SRPNEngineExecutor and on an SRPNEngine per thread, checking every result against
+# | the same script run serially. Exits with status 1 on any mismatch.
+# | Run with: python benchmarks/stressEngineThreads.py [threads] [scripts]
+
+# | makeScripts()
+# |--------------------------------------------------
+# | Returns a list of randomly generated scripts.
+# |---------------------------------------------
+def makeScripts(count):
+    generator = random.Random(1)
+    items = ["1", "2", "07", "100", "-5", "2147483647", "+", "-", "*", "/", "%", "^", "=", "d", "r", "r", "#",
+             "3+4*2", "a", "£"]
+
+    return ["\n".join(" ".join(generator.choice(items) for _ in range(generator.randint(1, 12)))
+                      for _ in range(generator.randint(1, 10)))
+            for _ in range(count)]
+
+# | outcome()
+# |---------------------------------------------------------------
+# | Returns the result of calling the function, or the name of the
+# | exception it raised (e.g. for a mod by 0), so both compare.
+# |---------------------------------------------------
+def outcome(function, *arguments):
+    try:
+        return function(*arguments)
+    except Exception as e:
+        return type(e).__name__
+
+if __name__ == "__main__":
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    scripts = makeScripts(count)
+    expected = [outcome(SRPNEngine().run, script) for script in scripts]
+
+    # | Through the executor.
+    with SRPNEngineExecutor(threads) as executor:
+        futures = [executor.submit(script) for script in scripts]
+        executorMismatches = sum(outcome(future.result) != result for future, result in zip(futures, expected))
+
+    # | On an engine per thread, each thread running every script line by line.
+    threadMismatches = []
+
+    def runAll():
+        engine = SRPNEngine()
+        mismatches = 0
+
+        for script, result in zip(scripts, expected):
+            engine.reset()
+            mismatches += outcome(lambda: "".join(engine.parse(line) for line in script.split("\n"))) != result
+
+        threadMismatches.append(mismatches)
+
+    workers = [threading.Thread(target=runAll) for _ in range(threads)]
+
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    print("executor: %d/%d mismatches" % (executorMismatches, count))
+    print("threads:  %d/%d mismatches" % (sum(threadMismatches), count * threads))
+
+    sys.exit(1 if executorMismatches or sum(threadMismatches) else 0)
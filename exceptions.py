@@ -6,8 +6,8 @@
 # |-----------------------
 class StackOverflowException(Exception):
 
-    def __init__(self):
-        self.message = "Stack overflow."
+    # | The message's shared by every instance, rather than built for each one.
+    message = "Stack overflow."
 
 # | StackUnderflow()
 # |-------------------------------------
@@ -16,8 +16,7 @@ class StackOverflowException(Exception):
 # |-----------------------
 class StackUnderflowException(Exception):
 
-    def __init__(self):
-        self.message = "Stack underflow."
+    message = "Stack underflow."
 
 # | StackEmptyException()
 # |--------------------------------------------
@@ -26,5 +25,36 @@ class StackUnderflowException(Exception):
 # |--------------------------------------
 class StackEmptyException(Exception):
 
-    def __init__(self):
-        self.message = "Stack empty."
+    message = "Stack empty."
+
+# | SessionExitException()
+# |----------------------------------------------
+# | The exception raised to stop a parser once
+# | a '£' has ended its session, when its sink
+# | hasn't exited the calculator itself.
+# |---------------------------------
+class SessionExitException(Exception):
+    pass
+
+# | WordLimitException()
+# |-------------------------------------------
+# | The exception raised when running a word
+# | goes beyond the nesting or step limits,
+# | carrying the error event to report.
+# |-------------------------------
+class WordLimitException(Exception):
+
+    def __init__(self, error):
+        self.error = error
+
+# | BudgetExceededException()
+# |--------------------------------------------
+# | The exception raised when a line goes
+# | beyond the step or time budget of the
+# | line or session, carrying the error
+# | event to report.
+# |---------------------------
+class BudgetExceededException(Exception):
+
+    def __init__(self, error):
+        self.error = error
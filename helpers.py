@@ -9,4 +9,32 @@ def isNegativeNumber(string):
 
     # | If the string happens to be empty, catch the index exception
     except IndexError as e:
-        return False
\ No newline at end of file
+        return False
+
+# | literalValue()
+# |-----------------------------------------------------------------
+# | Returns the integer value of an operand as typed by the user,
+# | treating a leading 0 as octal. If an octal operand has an
+# | invalid digit it's read as decimal when 2 digits long,
+# | otherwise None is returned as it's to be discarded.
+# |----------------------------------------------
+def literalValue(item):
+    # | The base in which the operand should be interpreted
+    base = 10
+
+    # | If the number is prefixed with a 0, it's to be considered an octal number
+    if item[0] == '0':
+        # | Check for invalid digits up front, rather than having int() raise on them.
+        if "8" in item or "9" in item:
+            return int(item[1:]) if len(item) == 2 else None
+
+        base = 8
+
+    try:
+        return int(item, base)
+
+    except ValueError:
+        if len(item) == 2:
+            return literalValue(item[1:])
+        else:
+            return None
@@ -1,15 +1,167 @@
 from SRPNInputParser import SRPNInputParser
+from SRPNMetrics import SRPNMetrics
+from SRPNFileEvaluator import SRPNFileEvaluator
+from SRPNDifferential import SRPNDifferentialParser, ENGINES
+import argparse
+import sys
+import time
 
 saturation = 2147483647
 
-# | Create the parser object
-parser = SRPNInputParser(saturation)
+# | The size of the chunks input is read in, and output's written out in, when running in batch mode.
+BUFFER_SIZE = 1 << 20
 
-# | Opening message
-print("Use the calculator\n")
+# | runInteractive()
+# |--------------------------------------------------------------
+# | Runs the calculator interactively, parsing each line as it's
+# | typed until the input ends.
+# |-----------------------
+def runInteractive(allowWords=False, largeStack=False):
+    # | Create the parser object
+    parser = SRPNInputParser(saturation, allowWords=allowWords, largeStack=largeStack)
 
-# | Main loop
-while True:
-    userInput = input()
+    # | Opening message
+    print("Use the calculator\n")
 
-    parser.parse(userInput)
+    # | Main loop
+    while True:
+        try:
+            userInput = input()
+        except EOFError:
+            return 0
+
+        parser.parse(userInput)
+
+# | readLines()
+# |-------------------------------------------------------------------
+# | Generator which reads the file in large chunks, yielding each of
+# | its lines without the newline, as input() would return them.
+# |--------------------------------------------------------
+def readLines(file):
+    remainder = ""
+
+    for chunk in iter(lambda: file.read(BUFFER_SIZE), ""):
+        lines = (remainder + chunk).split("\n")
+        remainder = lines.pop()
+
+        yield from lines
+
+    if remainder:
+        yield remainder
+
+# | runBatch()
+# |------------------------------------------------------------------------
+# | Runs the calculator over each of the files, or stdin if there are none,
+# | as one session. Output is collected in a large buffer and written in
+# | bulk. Returns the exit code, optionally reporting the throughput
+# | and writing the session's metrics to the file at metricsPath.
+# | If useMmap is set, files are memory mapped and run as bytes
+# | by an SRPNFileEvaluator rather than read as text. If an
+# | engine's given to check, every line's run through both it
+# | and the reference interpreter, and they're compared.
+# |------------------------------------------------
+def runBatch(paths, reportStatistics, metricsPath=None, allowWords=False, largeStack=False, useMmap=False,
+             checkEngine=None):
+    output = open(sys.stdout.fileno(), "w", buffering=BUFFER_SIZE, encoding=sys.stdout.encoding,
+                  errors=sys.stdout.errors, closefd=False)
+
+    metrics = SRPNMetrics() if metricsPath else None
+
+    if checkEngine is not None:
+        parser = SRPNDifferentialParser(saturation, checkEngine, output=output, largeStack=largeStack)
+    else:
+        parser = SRPNInputParser(saturation, output=output, metrics=metrics, allowWords=allowWords,
+                                 largeStack=largeStack)
+
+    evaluator = SRPNFileEvaluator(parser, encoding=sys.stdin.encoding, errors=sys.stdin.errors)
+
+    lines = 0
+    start = time.perf_counter()
+
+    try:
+        for path in paths or [None]:
+            if useMmap and path is not None:
+                evaluator.evaluateFile(path)
+                continue
+
+            if path is None:
+                file = open(sys.stdin.fileno(), encoding=sys.stdin.encoding, errors=sys.stdin.errors, closefd=False)
+            else:
+                file = open(path, encoding=sys.stdin.encoding, errors=sys.stdin.errors)
+
+            with file:
+                for line in readLines(file):
+                    parser.parse(line)
+                    lines += 1
+
+    # | A '£' exits the calculator, ending the session there.
+    except SystemExit:
+        pass
+
+    except OSError as e:
+        output.flush()
+        print("main.py: " + str(e), file=sys.stderr)
+        return 1
+
+    finally:
+        output.flush()
+
+    if reportStatistics:
+        seconds = time.perf_counter() - start
+        lines += evaluator.lines
+        print("%d lines in %.3fs (%.0f lines/sec)" % (lines, seconds, lines / seconds if seconds else 0),
+              file=sys.stderr)
+
+        if evaluator.bytes:
+            print("%d bytes memory mapped in %.3fs (%.1f MB/s)" % (evaluator.bytes, evaluator.seconds,
+                                                                   evaluator.throughput()), file=sys.stderr)
+
+        if checkEngine is not None:
+            print("%s ran %.2fx the speed of interpret (%.3fs against %.3fs)"
+                  % (checkEngine, parser.speedRatio(), parser.candidateSeconds, parser.referenceSeconds),
+                  file=sys.stderr)
+
+    if metrics is not None:
+        try:
+            metrics.dump(metricsPath)
+        except OSError as e:
+            print("main.py: " + str(e), file=sys.stderr)
+            return 1
+
+    return 0
+
+# | main()
+# |-------------------------------------------------------------------------
+# | Runs the calculator interactively if stdin is a terminal and no files
+# | are given, otherwise runs it in batch mode. Returns the exit code.
+# |------------------------------------------------------------
+def main(arguments):
+    argumentParser = argparse.ArgumentParser(description="The SRPN calculator.")
+    argumentParser.add_argument("files", nargs="*", help="script files to run in batch mode, in order")
+    argumentParser.add_argument("--stats", action="store_true", help="report lines/sec to stderr in batch mode")
+    argumentParser.add_argument("--metrics", metavar="PATH",
+                                help="write per-operation metrics to PATH in the Prometheus text format in batch mode")
+    argumentParser.add_argument("--words", action="store_true",
+                                help="allow words to be defined with \": name body ;\" and repeated with \"repeat N name\"")
+    argumentParser.add_argument("--large-stack", action="store_true",
+                                help="lift the stack limit of 23 and add the sum, prod, min, max, dupn and dropn operators")
+    argumentParser.add_argument("--mmap", action="store_true",
+                                help="memory map script files and run them as bytes, for very large scripts")
+    argumentParser.add_argument("--differential", choices=sorted(ENGINES), metavar="ENGINE",
+                                help="check the ENGINE (parse or bytes) against the reference interpreter on every "
+                                     "line in batch mode, reporting the first divergence to stderr. The reference "
+                                     "shares the tokenizer, infix and literal code, so only compiling and running "
+                                     "programs is checked")
+    arguments = argumentParser.parse_args(arguments)
+
+    if arguments.differential and (arguments.words or arguments.metrics or arguments.mmap):
+        argumentParser.error("--differential can't be used with --words, --metrics or --mmap")
+
+    if not arguments.files and sys.stdin.isatty():
+        return runInteractive(arguments.words, arguments.large_stack)
+
+    return runBatch(arguments.files, arguments.stats, arguments.metrics, arguments.words, arguments.large_stack,
+                    arguments.mmap, arguments.differential)
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
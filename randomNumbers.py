@@ -1,630 +0,0 @@
-# | The current random number we are on
-index = 0
-
-# | A list containing 5000 numbers generated using the C algorithm
-numbers = [1804289383, 846930886, 1681692777, 1714636915, 1957747793, 424238335, 719885386, 1649760492, 596516649,
-           1189641421, 1025202362, 1350490027, 783368690, 1102520059, 2044897763, 1967513926, 1365180540,
-           1540383426, 304089172, 1303455736, 35005211, 521595368, 1804289383, 846930886, 1681692777, 1714636915,
-           1957747793, 424238335, 719885386, 1649760492,
-           596516649, 1189641421, 1025202362, 1350490027, 783368690, 1102520059, 2044897763, 1967513926,
-           1365180540, 1540383426, 304089172, 1303455736, 35005211, 521595368, 294702567, 1726956429,
-           336465782, 861021530, 278722862, 233665123, 2145174067, 468703135, 1101513929, 1801979802,
-           1315634022, 635723058, 1369133069, 1125898167, 1059961393, 2089018456, 628175011, 1656478042,
-           1131176229, 1653377373, 859484421, 1914544919, 608413784, 756898537, 1734575198, 1973594324,
-           149798315, 2038664370, 1129566413, 184803526, 412776091, 1424268980, 1911759956, 749241873,
-           137806862, 42999170, 982906996, 135497281, 511702305, 2084420925, 1937477084, 1827336327,
-           572660336, 1159126505, 805750846, 1632621729, 1100661313, 1433925857, 1141616124, 84353895,
-           939819582, 2001100545, 1998898814, 1548233367, 610515434, 1585990364, 1374344043, 760313750,
-           1477171087, 356426808, 945117276, 1889947178, 1780695788, 709393584, 491705403, 1918502651,
-           752392754, 1474612399, 2053999932, 1264095060, 1411549676, 1843993368, 943947739, 1984210012,
-           855636226, 1749698586, 1469348094, 1956297539, 1036140795, 463480570, 2040651434, 1975960378,
-           317097467, 1892066601, 1376710097, 927612902, 1330573317, 603570492, 1687926652, 660260756,
-           959997301, 485560280, 402724286, 593209441, 1194953865, 894429689, 364228444, 1947346619,
-           221558440, 270744729, 1063958031, 1633108117, 2114738097, 2007905771, 1469834481, 822890675,
-           1610120709, 791698927, 631704567, 498777856, 1255179497, 524872353, 327254586, 1572276965,
-           269455306, 1703964683, 352406219, 1600028624, 160051528, 2040332871, 112805732, 1120048829,
-           378409503, 515530019, 1713258270, 1573363368, 1409959708, 2077486715, 1373226340, 1631518149,
-           200747796, 289700723, 1117142618, 168002245, 150122846, 439493451, 990892921, 1760243555,
-           1231192379, 1622597488, 111537764, 338888228, 2147469841, 438792350, 1911165193, 269441500,
-           2142757034, 116087764, 1869470124, 155324914, 8936987, 1982275856, 1275373743, 387346491,
-           350322227, 841148365, 1960709859, 1760281936, 771151432, 1186452551, 1244316437, 971899228,
-           1476153275, 213975407, 1139901474, 1626276121, 653468858, 2130794395, 1239036029, 1884661237,
-           1605908235, 1350573793, 76065818, 1605894428, 1789366143, 1987231011, 1875335928, 1784639529,
-           2103318776, 1597322404, 1939964443, 2112255763, 1432114613, 1067854538, 352118606, 1782436840,
-           1909002904, 165344818, 1395235128, 532670688, 1351797369, 492067917, 1504569917, 680466996,
-           706043324, 496987743, 159259470, 1359512183, 480298490, 1398295499, 1096689772, 2086206725,
-           601385644, 1172755590, 1544617505, 243268139, 1012502954, 1272469786, 2027907669, 968338082,
-           722308542, 1820388464, 933110197, 6939507, 740759355, 1285228804, 1789376348, 502278611,
-           1450573622, 1037127828, 1034949299, 654887343, 1529195746, 392035568, 1335354340, 87755422,
-           889023311, 1494613810, 1447267605, 1369321801, 745425661, 396473730, 1308044878, 1346811305,
-           1569229320, 705178736, 1590079444, 434248626, 1977648522, 1470503465, 1402586708, 552473416,
-           1143408282, 188213258, 559412924, 1884167637, 1473442062, 201305624, 238962600, 776532036,
-           1238433452, 1273911899, 1431419379, 620145550, 1665947468, 619290071, 707900973, 407487131,
-           2113903881, 7684930, 1776808933, 711845894, 404158660, 937370163, 2058657199, 1973387981,
-           1642548899, 1501252996, 260152959, 1472713773, 824272813, 1662739668, 2025187190, 1967681095,
-           1850952926, 437116466, 1704365084, 1176911340, 638422090, 1943327684, 1953443376, 1876855542,
-           1069755936, 1237379107, 349517445, 588219756, 1856669179, 1057418418, 995706887, 1823089412,
-           1065103348, 625032172, 387451659, 1469262009, 1562402336, 298625210, 1295166342, 1057467587,
-           1799878206, 1555319301, 382697713, 476667372, 1070575321, 260401255, 296864819, 774044599,
-           697517721, 2001229904, 1950955939, 1335939811, 1797073940, 1756915667, 1065311705, 719346228,
-           846811127, 1414829150, 1307565984, 555996658, 324763920, 155789224, 231602422, 1389867269,
-           780821396, 619054081, 711645630, 195740084, 917679292, 2006811972, 1253207672, 570073850,
-           1414647625, 1635905385, 1046741222, 337739299, 1896306640, 1343606042, 1111783898, 446340713,
-           1197352298, 915256190, 1782280524, 846942590, 524688209, 700108581, 1566288819, 1371499336,
-           2114937732, 726371155, 1927495994, 292218004, 882160379, 11614769, 1682085273, 1662981776,
-           630668850, 246247255, 1858721860, 1548348142, 105575579, 964445884, 2118421993, 1520223205,
-           452867621, 1017679567, 1857962504, 201690613, 213801961, 822262754, 648031326, 1411154259,
-           1737518944, 282828202, 110613202, 114723506, 982936784, 1676902021, 1486222842, 950390868,
-           255789528, 1266235189, 1242608872, 1137949908, 1277849958, 777210498, 653448036, 1908518808,
-           1023457753, 364686248, 1309383303, 1129033333, 1329132133, 1280321648, 501772890, 1781999754,
-           150517567, 212251746, 1983690368, 364319529, 1034514500, 484238046, 1775473788, 624549797,
-           767066249, 1886086990, 739273303, 1750003033, 1415505363, 78012497, 552910253, 1671294892,
-           1344247686, 1795519125, 661761152, 474613996, 425245975, 1315209188, 235649157, 1448703729,
-           1679895436, 1545032460, 430253414, 861543921, 677870460, 932026304, 496060028, 828388027,
-           1144278050, 332266748, 1192707556, 31308902, 816504794, 820697697, 655858699, 1583571043,
-           559301039, 1395132002, 1186090428, 1974806403, 1473144500, 1739000681, 1498617647, 669908538,
-           1387036159, 12895151, 1144522535, 1812282134, 1328104339, 1380171692, 1113502215, 860516127,
-           777720504, 1543755629, 1722060049, 1455590964, 328298285, 70636429, 136495343, 1472576335,
-           402903177, 1329202900, 1503885238, 1219407971, 2416949, 12260289, 655495367, 561717988,
-           1407392292, 1841585795, 389040743, 733053144, 1433102829, 1887658390, 1402961682, 672655340,
-           1900553541, 400000569, 337453826, 1081174232, 1780172261, 1450956042, 1941690360, 410409117,
-           847228023, 1516266761, 1866000081, 1175526309, 1586903190, 2002495425, 500618996, 1989806367,
-           1184214677, 2004504234, 1061730690, 1186631626, 2016764524, 1717226057, 1748349614, 1276673168,
-           1411328205, 2137390358, 2009726312, 696947386, 1877565100, 1265204346, 1369602726, 1630634994,
-           1665204916, 1707056552, 564325578, 1297893529, 1010528946, 358532290, 1708302647, 1857756970,
-           1874799051, 1426819080, 885799631, 1314218593, 1281830857, 1386418627, 1156541312, 318561886,
-           1243439214, 70788355, 1505193512, 1112720090, 1788014412, 1106059479, 241909610, 1051858969,
-           1095966189, 104152274, 1748806355, 826047641, 1369356620, 970925433, 309198987, 887077888,
-           530498338, 873524566, 37487770, 1541027284, 1232056856, 1745790417, 1251300606, 959372260,
-           1025125849, 2137100237, 126107205, 159473059, 1376035217, 1282648518, 478034945, 471990783,
-           1353436873, 1983228458, 1584710873, 993967637, 941804289, 1826620483, 2045826607, 2037770478,
-           1930772757, 1647149314, 716334471, 1152645729, 470591100, 1025533459, 2039723618, 1001089438,
-           1899058025, 2077211388, 394633074, 983631233, 1675518157, 1645933681, 1943003493, 553160358,
-           1635550270, 2069110699, 712633417, 864101839, 1204275569, 1190668363, 1336092622, 410228794,
-           1026413173, 773319847, 1404196431, 1968217462, 452456682, 1302539390, 1858504292, 235745791,
-           802205057, 427355115, 1388391521, 1272796157, 1452888574, 1280631491, 126401947, 1204462951,
-           1210359231, 521035021, 40610537, 738393740, 19485054, 1983614030, 1291554098, 1655035325,
-           1905241081, 2004187516, 371653516, 962033002, 1047372231, 1707746139, 1372261796, 2073785404,
-           333582338, 628974580, 1894519218, 786039021, 1931513970, 1605539862, 1021784812, 586235379,
-           2032894977, 262692685, 1859031536, 1338299904, 1543324176, 1985433483, 395279207, 606199759,
-           358984857, 435889744, 1344593499, 378469911, 272020127, 488663950, 2033505236, 29777560,
-           345367818, 257675105, 991810563, 1392740049, 1965421244, 216588711, 1319041805, 151519934,
-           845563291, 1066077375, 937558955, 629593614, 524133589, 1959343768, 1215828993, 409544918,
-           74552805, 927376882, 1747844822, 1617876982, 765326717, 2143124030, 76593093, 1124311574,
-           431530126, 1421186593, 1502781486, 703550253, 1909850543, 1388803074, 733327814, 107734713,
-           1646478179, 1725138377, 1500474762, 1464415775, 1941727088, 672032919, 1615935710, 639806732,
-           1738110294, 406011017, 1269400346, 114760235, 217871137, 337745691, 524305153, 292423943,
-           1265122573, 124666328, 1910300925, 2030449291, 120306710, 1986894018, 1007277217, 551836836,
-           1260596963, 362575055, 1255387090, 1022963858, 1751378130, 1988714904, 1130698571, 1250372661,
-           1566369633, 483689685, 567304789, 1360613073, 1155722604, 35756851, 2000419805, 746349250,
-           441767868, 1122336503, 861109485, 659639006, 1460082195, 1385414639, 952062949, 577721120,
-           1510080967, 714880226, 460686763, 1630387677, 554290596, 1467963981, 34740865, 1814887560,
-           1830539036, 1290127955, 690367770, 1434433518, 1131359211, 1821066342, 537322532, 550245196,
-           157272379, 1104627321, 1910858270, 1312994984, 1140384172, 1763794427, 2059344234, 1582152040,
-           738647283, 772970072, 94307398, 51245830, 10901063, 1046370347, 628966950, 1520982030,
-           1761250573, 1089653714, 1003886059, 168057522, 410134047, 1038626924, 1982945082, 93189435,
-           181271232, 525829204, 1527622954, 1312630443, 199411898, 2064945486, 1862875640, 356684278,
-           1022089159, 1626250262, 1669679262, 14989683, 1242561041, 1581539848, 1597141723, 1981208324,
-           207026272, 1691449122, 2032454154, 217927335, 590335821, 513937457, 1738909365, 204102747,
-           1603591171, 595311776, 372160269, 2013725218, 1633938701, 207621703, 2106914653, 1815209933,
-           733450907, 1487053959, 980356728, 932862806, 1404515797, 695748720, 1289547084, 279121308,
-           174515334, 811742698, 294110991, 1417076376, 245798898, 1891252715, 1250801052, 452825171,
-           1435218189, 1135771559, 670752506, 2025554010, 1649709016, 262178224, 82173109, 1105816539,
-           857490000, 454333378, 972058109, 343945053, 661955081, 931489114, 11671338, 1395405989,
-           271059426, 992028067, 180785147, 1675575223, 1687776787, 1470332231, 1954696532, 1862292122,
-           134591281, 101323875, 1131884850, 380390179, 1992576590, 235202254, 833215350, 1280311131,
-           1370973813, 1503967857, 1158381494, 873199181, 1766146081, 1240554603, 1979015720, 476152433,
-           1694887982, 803590181, 820097487, 209359415, 1735079296, 831768825, 1604765404, 2006138722,
-           1823796892, 1785550551, 1534230297, 1364090032, 1108399134, 1341443181, 1078898506, 1242990415,
-           1442767057, 63299708, 1623380595, 1287859999, 298501962, 309112297, 420687483, 1669475776,
-           1813080154, 1579068977, 395191309, 1431742587, 672139932, 226723382, 1907895021, 219544266,
-           1030313563, 580508860, 428903682, 617909211, 1412277685, 2033669086, 476564285, 1088590930,
-           1671735990, 2010794583, 305197314, 632651476, 1204754116, 1384095820, 1875641892, 500037525,
-           1447395528, 1351538839, 1787897525, 1745897490, 1660651136, 61101360, 1267889618, 1326247643,
-           1640170337, 1663080928, 610506582, 164826621, 1889804310, 370917955, 384370888, 772634225,
-           951426815, 813274570, 1390543437, 216220853, 699460008, 1867107722, 1304811783, 223712350,
-           1730418657, 1610009097, 856363827, 787689126, 846621269, 584522071, 1287726651, 146533149,
-           1936060910, 928140528, 1892430639, 1449228398, 989241888, 1012836610, 627992393, 481928577,
-           528433890, 1238498976, 646755199, 270754552, 1609416931, 1031126087, 1043388777, 413360099,
-           1844400657, 286448566, 629580952, 396377017, 6072641, 1934392735, 620089368, 1736491298,
-           1396918184, 1476453195, 376696776, 96055805, 2060975266, 1664423428, 242588954, 1849552528,
-           445080308, 2135019593, 1151297278, 1434322197, 1000372555, 1779289672, 1916250774, 1528806445,
-           870305000, 415522325, 1799560997, 332238283, 1446648412, 695466127, 745598382, 1143565421,
-           981914693, 1375179334, 1539942439, 987987334, 1162088421, 12548159, 576994985, 411522957,
-           1489001354, 953691761, 507578762, 1402492972, 470631541, 750167716, 1104561852, 915711850,
-           737703662, 108375482, 202550399, 1738076217, 1887665154, 2118801173, 1119399015, 610486506,
-           386839851, 771476364, 942724790, 1833488263, 1466942491, 1688323172, 829570037, 301373537,
-           916018859, 222028828, 1289360871, 2078107280, 234576987, 1866355856, 342146590, 1723578341,
-           672563970, 849725352, 978587665, 1143195511, 1599893069, 2083149517, 2058907361, 190113083,
-           44041351, 113974112, 1928189300, 1931706506, 85291638, 900104667, 394709364, 472131489,
-           1671581032, 1337434154, 158136104, 991039875, 878273679, 987706141, 1292413412, 1794292538,
-           1209734969, 434290636, 1724916170, 1444311956, 153162844, 2067062760, 1020406649, 825726814,
-           769304465, 1998994314, 1968922326, 221713886, 1934660183, 1880346039, 411826969, 1978701535,
-           1994320152, 192532621, 1762924393, 2079611790, 1092637289, 10150109, 404259631, 616734673,
-           1347584264, 562395735, 1607774548, 78374295, 1550101877, 752704313, 1872666833, 612353198,
-           1186994949, 1450099355, 2056665155, 1340157793, 1369678468, 929588156, 18400960, 2138982933,
-           781098823, 1987323286, 213213171, 568275358, 1720185677, 625040140, 399493245, 1567022181,
-           817572761, 14933990, 1499150323, 1910210050, 25084100, 1903409954, 379461075, 1372668364,
-           318322042, 1987235624, 1451042659, 1868423919, 592456289, 1176225844, 333293469, 1779451238,
-           478841551, 242474976, 972125383, 1848520019, 1172063133, 990526343, 1840019304, 1953161956,
-           830365981, 2053232475, 373953666, 403068011, 530788967, 773446912, 1970090192, 1348361729,
-           788380902, 1321756868, 1111088131, 813465002, 1077683174, 1490549207, 38649718, 1396005216,
-           1330301183, 1489692377, 1116945487, 1922757472, 518434573, 1450238957, 1554725062, 997276125,
-           1692713933, 379366797, 698312496, 717293418, 1369893141, 390848153, 522971726, 52775474,
-           296596980, 896925393, 455843485, 827385948, 1670372305, 278450030, 28264029, 311269559,
-           1600206898, 1139352160, 1124734562, 530406424, 482417719, 1163384280, 1926411641, 1812718902,
-           505593010, 895873480, 1587992726, 1024027583, 198628789, 995234140, 2021303708, 1891342723,
-           1374600938, 572132557, 461152493, 597010431, 962980710, 984124220, 649785905, 1259577690,
-           1881049613, 1105629391, 2086963638, 1403938270, 1384079421, 2115227667, 1715207829, 836802671,
-           1107096180, 692458743, 1367209095, 1589513899, 1855843024, 1146137088, 1254749154, 213952386,
-           2042010569, 695258232, 1237979969, 93155710, 1690492373, 1111800030, 1984498433, 917609663,
-           1683932587, 298167279, 1514620094, 499429649, 1282291499, 16922351, 1759007339, 1015857464,
-           1122551742, 1698487330, 272312086, 359147515, 1666231349, 1987519915, 1195950186, 625843881,
-           532495011, 415675634, 67874133, 240854387, 1561812722, 1322623287, 454806773, 1456339643,
-           2017881519, 1692786742, 1549495354, 1560890244, 657103124, 1386510139, 331016259, 193552063,
-           1684677418, 1845636353, 692981712, 819485269, 1862558705, 304505404, 1835342733, 837626799,
-           2002992734, 2107654819, 1196774315, 1521740435, 1947691087, 245240853, 100669, 332702450,
-           660916487, 67974802, 573556837, 75245562, 1390598089, 1028363610, 1531585205, 1260995960,
-           573666704, 933596911, 674402557, 1230769829, 172623403, 1005418816, 1424321892, 1857300821,
-           703571522, 2117303605, 529302443, 418646579, 274325361, 217161528, 1256273378, 129834447,
-           177332700, 305564045, 1651574882, 2125023787, 550804899, 1651675551, 310242589, 1211721386,
-           1719650353, 883799426, 1286966948, 962764794, 1912163036, 671068506, 76277107, 338346092,
-           1604665417, 750679664, 1569115921, 1777288820, 1756098480, 845954166, 1487105994, 312186354,
-           815774123, 2016408437, 730832933, 1090099484, 86086317, 1987106312, 1219933931, 263419017,
-           145186709, 724025165, 240959156, 695991608, 228217069, 551201745, 1907712995, 1947867422,
-           1435001171, 1047196295, 763148569, 1199680559, 1718264801, 839425676, 1538026652, 1175446571,
-           1590105340, 959658925, 805251743, 1198720172, 1805613091, 144874089, 1510906527, 473903566,
-           13798878, 94255812, 1564003050, 99885196, 2081362124, 636453333, 363304213, 79065186,
-           1360478499, 604263370, 775056794, 1588695568, 1155465115, 535286141, 1389079342, 442982639,
-           1582482437, 4744263, 1642663198, 1153263590, 844169939, 1033206202, 181226513, 286791631,
-           1992865128, 986478257, 1485511804, 1650994571, 1131352346, 848934683, 2124898138, 1145151225,
-           943190495, 1541417540, 1245036421, 877068972, 30387226, 1608340634, 956134158, 1390865725,
-           65120356, 1731190952, 832077645, 1220585472, 118993446, 73673339, 1663568111, 1701475883,
-           78417603, 1158747661, 707255825, 922587542, 44470216, 888482339, 1209379174, 2037335344,
-           1874960596, 547407330, 1540846267, 858829294, 1396342013, 1518260757, 2003980519, 192048860,
-           912194650, 1101533292, 1069117832, 942581876, 562390279, 2025251990, 185963953, 627510635,
-           1608959295, 1018041598, 1848096107, 1727952741, 1091714937, 1364180570, 1281944976, 1170132540,
-           375444584, 1989200801, 2092720083, 419914800, 730199492, 1154615609, 309766496, 457676440,
-           1702022939, 1850612763, 1316505735, 950881304, 1221389873, 1173002606, 1142930164, 2133584523,
-           127052251, 64564349, 928682751, 689442530, 2089816339, 1114646704, 1316953165, 1551291986,
-           2132688302, 1017565625, 1131761079, 1076919591, 234262547, 266222407, 99568484, 609707131,
-           107939561, 44804919, 1029621931, 838139053, 1199420528, 1339388427, 1295815494, 753959819,
-           1042517543, 464837581, 1704841123, 116423768, 1637840187, 700287639, 102524643, 1764892438,
-           764851988, 1031207394, 306851320, 707184680, 2145854098, 1623804486, 110993018, 2131058752,
-           493886463, 1242754098, 1060494695, 728149010, 1508976505, 1160063179, 1337856142, 1616916066,
-           1204868098, 219994425, 307571472, 256804978, 1559382853, 1603386966, 1010764797, 454416748,
-           2068224547, 568122272, 570840516, 1558581086, 1268409912, 673365159, 1175989877, 2033261900,
-           1704572553, 1482841197, 592962932, 1702943003, 959162035, 703955951, 1686518107, 1453048498,
-           1946710049, 599529154, 33713861, 1308202906, 1759592334, 1371570003, 777635325, 816976784,
-           1591564428, 1085206797, 1073781763, 1003463633, 541110115, 2084546560, 1457880381, 461851014,
-           505185185, 2028720897, 2020432100, 1773595097, 554602408, 1048938329, 1659373349, 111691313,
-           384295879, 104852634, 1814634316, 1343457914, 808808585, 1353668775, 649022765, 608034986,
-           1953197930, 682736626, 1916237892, 1565306616, 2054306629, 546389569, 234799752, 1498387409,
-           1631596366, 1308581515, 354367395, 25222833, 1245644428, 1812247776, 487073847, 1750829613,
-           1693485026, 360022300, 1376941062, 100603786, 1408960629, 888830763, 212295100, 1793256508,
-           993683397, 2026929416, 989230775, 1802491982, 1233114544, 1638253540, 263043320, 1038828826,
-           173506518, 31797565, 456651794, 80329499, 578187134, 691451546, 1578716908, 62299853,
-           2000033062, 1933084303, 87522686, 1098193842, 1597848432, 574596534, 701539807, 1143849810,
-           934618834, 2078480869, 1244453596, 196095815, 819827984, 1456748696, 1989352324, 1813511382,
-           1336194465, 831099451, 1468519716, 421825361, 321869343, 1731563037, 1460654187, 495375861,
-           1763360602, 1917305981, 575705360, 194064088, 461273879, 6938620, 256363941, 313823293,
-           1940022924, 343886628, 1412017135, 1390387708, 918483162, 2113556942, 386753870, 1853101996,
-           2044554163, 1631207466, 2049197811, 716898500, 940472515, 1891066487, 382926234, 129183332,
-           574682290, 1851445950, 551008693, 896551633, 1435525339, 2011662880, 1391927494, 1051402293,
-           1781485213, 1967632854, 1245466382, 95275444, 1974571475, 1501830323, 409098738, 1767110751,
-           1845716951, 1821115873, 1010014811, 616716465, 1787189168, 1396768681, 322334813, 1684259683,
-           880492499, 224048977, 253674535, 1820965014, 2115115464, 636600769, 1950148346, 542314107,
-           340563072, 353673391, 1438865740, 1776088411, 217852623, 683309587, 680007057, 1999337836,
-           503458793, 1925473439, 2094613281, 330546620, 1279820114, 356228371, 2097657371, 978053418,
-           29860596, 960188534, 1594769883, 1817049764, 209473567, 1917104697, 1353825800, 1089966067,
-           2141153674, 1607500335, 763447433, 2108785490, 96617457, 566112132, 503615949, 437180529,
-           919785523, 1942481690, 65785292, 1137638147, 478307629, 745792349, 989492335, 981766422,
-           523782140, 936621968, 1312313043, 1803602255, 1292850339, 1262486766, 634172025, 1322710936,
-           75191653, 81458260, 992277052, 284665220, 1998562957, 198619204, 1374631287, 1992232983,
-           1806119540, 2138078721, 1953534826, 1902736997, 556707205, 309667127, 192433878, 1476492728,
-           104665169, 258219170, 466647227, 582972798, 1004011520, 1456139563, 1564739221, 1527793660,
-           245277883, 729568616, 1183912267, 1538128223, 1992055382, 1818084292, 713355511, 2067247035,
-           1899542553, 1705632563, 204428608, 1750621862, 1904251768, 1579059895, 1595371198, 1562887660,
-           1569654968, 1401422376, 1318141009, 2126362173, 1711089503, 1510574887, 1455371254, 1815754673,
-           1768794057, 1922018481, 251243823, 625321929, 1230674396, 1815983044, 5631942, 1475952280,
-           398068012, 1189544209, 866596855, 242639747, 860144854, 1579952366, 162403134, 612203759,
-           1138101281, 366831742, 215341973, 894869401, 1945891638, 1810713171, 310273413, 1368062958,
-           1064651899, 1628414422, 1346941484, 628257755, 991505661, 654829090, 296528780, 612816071,
-           429363923, 547772603, 1238138000, 1660038320, 216272000, 1243769942, 988506952, 614340012,
-           285830504, 1855103807, 856979759, 1145975358, 1287572525, 1019382894, 1758179117, 278190158,
-           1386214636, 1973521090, 1173059560, 1184622626, 1636750614, 1483332973, 405201937, 553918865,
-           964263748, 1752143421, 1182176620, 1955769409, 259488863, 1478705400, 421101832, 688852786,
-           2026478004, 1659239833, 201407458, 95266356, 755526127, 1189914410, 709606368, 1041356631,
-           897534569, 1566586128, 39848341, 37623446, 438485374, 1798027458, 315813605, 1824700010,
-           1624064901, 1488873165, 861838989, 1113331867, 824722490, 1267040926, 1667250732, 1788986238,
-           871700699, 701943705, 1597272000, 1131189562, 33165457, 2018373832, 1820042348, 2059643461,
-           1530130017, 2021449807, 7426169, 138172497, 1063880569, 717032538, 1179529128, 1961415139,
-           136135018, 1219377470, 1999038585, 574620392, 869921280, 167368542, 251836754, 346502533,
-           1656241707, 1113675743, 1459834400, 333480550, 233233021, 979601485, 2122466788, 1104933720,
-           1681545190, 1572255140, 88639634, 1714710647, 1443145325, 1908681983, 1626870461, 825791694,
-           1782648142, 1634296630, 963964191, 699045063, 203845520, 2143493320, 512976554, 339980538,
-           1215387142, 364531492, 914600930, 2085308422, 531900034, 1166437685, 284327308, 40658094,
-           132629780, 1744161708, 374138644, 365862802, 576279545, 349121784, 1470796522, 110341087,
-           1921376925, 1559436157, 1825051735, 1217038602, 1320634492, 1304438548, 2042830296, 955798986,
-           791251530, 859310840, 1654844049, 995097051, 855320512, 20336956, 1335077589, 2070707654,
-           384868448, 102194872, 2008532428, 916768482, 1268632557, 145376088, 957426576, 1401262337,
-           1889537797, 1331565220, 1767125139, 318333694, 1680687005, 1090438014, 428674782, 1454580282,
-           502390523, 106242869, 524135236, 1823025015, 1410681417, 419481884, 631340353, 54449299,
-           1278792724, 138700754, 1049546350, 2134113236, 159037710, 237140292, 2057337242, 543906158,
-           339335164, 1918386023, 1460674641, 1607967721, 2063762111, 270617569, 861746410, 1805816260,
-           1602182790, 481387902, 2124149955, 1135386147, 1571825916, 405341089, 442482781, 2074216439,
-           511583958, 966618017, 1749757806, 1922265375, 1386099901, 233614511, 1976714674, 517408978,
-           372315265, 878777377, 504038566, 531352976, 1115917669, 413892161, 1075259134, 1455252833,
-           184794536, 388450127, 915736906, 101072999, 659067697, 1777483316, 1906889260, 113766839,
-           111387570, 1883555567, 1249152986, 1683213486, 141413008, 1691635767, 1609946277, 652996966,
-           510770136, 1212220435, 427778693, 1896870037, 1445834946, 257009719, 266795367, 1818150212,
-           1135787096, 770833934, 202019540, 104221117, 1184726095, 1277278674, 1559473950, 1369520631,
-           1665728802, 327727208, 1470593630, 177312851, 2105210525, 1229999242, 291079690, 69114447,
-           966071161, 1540232676, 1752327934, 1107484169, 1084384795, 1214790563, 1760481135, 1595154931,
-           279527351, 40776180, 1344541320, 1725362297, 297785900, 1611336688, 1396028861, 1433572996,
-           234686974, 1598048401, 1537794114, 1419413069, 727843428, 949784416, 641450052, 246088582,
-           1277511625, 2112043682, 423401433, 1235238502, 1194559277, 714481123, 1304352949, 13146790,
-           107230151, 909197235, 1120630960, 1191614946, 2123987799, 733628447, 639286229, 256031502,
-           774404628, 1983827549, 1981393799, 1072190528, 1447680589, 1229939013, 358279876, 1682367563,
-           680503766, 1896073990, 954296984, 1408347194, 698374759, 1595747036, 1654435776, 1975886384,
-           1560307071, 2077837209, 1063641238, 607382700, 644834684, 220510539, 620529490, 752064835,
-           1129707775, 1741160450, 1943679781, 1106211926, 327305250, 435482362, 1362243428, 1101709878,
-           271826264, 1196153579, 26416758, 1719506853, 278608944, 384696634, 1254390769, 959112711,
-           133286977, 61204105, 219976257, 831661736, 1656951142, 1874412034, 660064472, 1069774565,
-           1804765595, 1723705710, 1677157265, 302116632, 1944216249, 150203107, 1054181467, 926440376,
-           1891363558, 850377601, 2032652302, 71185160, 1285859963, 1247412082, 1172895038, 1557686227,
-           296082014, 1199311796, 1129709433, 574690958, 1584008430, 236616554, 1533803669, 1717295407,
-           297820659, 1753779927, 401473495, 1954771801, 1480708313, 1061537967, 877062718, 1137990260,
-           637760029, 406736335, 1440106892, 434492631, 556939443, 346804712, 1360933007, 300819353,
-           1197182313, 1246101662, 372004513, 335558628, 346030096, 1544899551, 1893244856, 642112110,
-           596727699, 875470641, 1216803069, 33252481, 1112087195, 603123090, 1750547889, 1409907854,
-           209419369, 4537736, 1217196008, 1690127682, 1066075704, 2094258726, 680634295, 1703835733,
-           353511414, 2120741187, 2138328364, 910450857, 320062251, 1351777724, 1211270210, 1517244564,
-           450395738, 1583274723, 1852803193, 796425834, 980690626, 1598564401, 1438537945, 1577418325,
-           326551394, 507857366, 1610670806, 1438638589, 1110980456, 1213735047, 701062795, 1320399826,
-           1218272784, 1918258803, 863043860, 136864840, 1865033882, 1543678155, 1840700573, 71061648,
-           1516935695, 1831545290, 981512505, 1836997946, 1035839366, 45299067, 1206758863, 1486235104,
-           1628573790, 912078408, 135177290, 461780768, 363159161, 1573715235, 2039199093, 689710555,
-           2081572601, 1502386251, 2128349144, 1045069410, 568637651, 681928291, 217985588, 1786910435,
-           452703447, 1081029448, 1923775275, 170253681, 477223956, 1616992200, 241315329, 1994159651,
-           1301053842, 1222827834, 1683673949, 189409560, 1268126901, 742949164, 1675644664, 749217043,
-           1655027572, 1810821955, 1210997811, 2018186733, 1237053542, 1102713256, 560413640, 1171142496,
-           457615859, 541279136, 68728258, 1026253510, 1223207428, 286713846, 665680297, 1675910875,
-           1367743294, 441971924, 1846164556, 1844967250, 2058964125, 2087479885, 1691643253, 1212534319,
-           1162824071, 1227833555, 1401943880, 283467324, 1970782719, 930104896, 1032684367, 1478326644,
-           593443203, 96198530, 1349029729, 1830496746, 1198911786, 1909443370, 854155594, 1656527645,
-           303238858, 922883852, 535297508, 1526446286, 1209597698, 1200977805, 1054873513, 429857344,
-           1642949730, 753554421, 127340947, 1554430207, 693550658, 1818984200, 619480878, 1856374729,
-           899334107, 2021424758, 2139842053, 722633179, 804046007, 1025042772, 53476175, 1397489210,
-           1121241302, 1402505904, 1080502308, 172669440, 1164465626, 1934657902, 1829197086, 1467704485,
-           710058106, 217010946, 846667123, 1919655804, 1417988751, 1901540637, 202029501, 913454833,
-           507611410, 329370448, 320401392, 1201162069, 871000, 939882271, 910053150, 900205108,
-           813823381, 902411556, 1622838287, 1617869388, 1927454328, 1676314462, 867874951, 901211983,
-           931336718, 1948377259, 1073881423, 2095802345, 1735551514, 755594861, 1416023182, 298125972,
-           972605807, 115206657, 70298129, 243110911, 2016747294, 272327630, 1156565744, 376875057,
-           601698078, 1476967137, 1578037126, 602569078, 269365760, 340606628, 1502774186, 1083189141,
-           1243018184, 978128825, 553574882, 1022988865, 506959639, 1421449833, 1924200848, 1438296358,
-           1222343444, 850598623, 1386615055, 810411310, 1606193485, 655154589, 1108537283, 431315644,
-           770361246, 1178835412, 674426555, 639624893, 1451163042, 1830992300, 1016499950, 2052861120,
-           1160475789, 447053428, 507946550, 1429841549, 787660056, 2010720737, 365547042, 2030678241,
-           841365914, 919121924, 906183458, 1348325554, 193088109, 682900658, 639138264, 1415431554,
-           1533499281, 2025753319, 78359216, 992209118, 533424260, 1186896499, 1423524763, 1303785506,
-           218248263, 2097951318, 1943410399, 1669411305, 1781459970, 812426701, 1574788777, 794452111,
-           1259480129, 2082735328, 76810012, 2047140186, 1945972417, 442357055, 1930334779, 639854683,
-           1361478979, 689034589, 1988180237, 1554567089, 1371935247, 479834853, 822514995, 757950880,
-           358104524, 900874211, 1750159999, 891528784, 2087770711, 1026201114, 47830643, 158535326,
-           976668784, 1991241042, 1827946632, 610645107, 656184096, 1255251761, 1405097218, 1915664225,
-           1190503441, 1481907231, 1815320763, 988992210, 1924264286, 1598171894, 1628846894, 1138259617,
-           139722835, 1469543483, 545343058, 1511658082, 1949378337, 1367858053, 122125315, 159999213,
-           121248617, 1872285314, 1051527998, 61535680, 751002780, 1099358641, 220071006, 1727671564,
-           943116035, 2048017638, 190833023, 1599300131, 1155785752, 1595930242, 1367480709, 198805545,
-           930353825, 1035317824, 1187797756, 707134463, 486006071, 669161002, 1845394080, 625728906,
-           2138704485, 243253491, 2137386989, 1940599174, 1611111544, 112028656, 2100598388, 1732360161,
-           1984313970, 1004642738, 1793895841, 587833102, 2104001379, 2013966848, 168021018, 899633766,
-           1914500838, 358854042, 351450250, 922802942, 1954784284, 1718930959, 1121608488, 737654461,
-           606765135, 161922596, 1444788924, 1092771206, 831083598, 1142699356, 1718500113, 822304435,
-           1385952847, 1708403454, 615419962, 849580744, 1820432110, 568534702, 434457257, 1657262432,
-           1573177440, 80869451, 97611886, 1529695171, 2094836299, 265632904, 281845289, 1861853489,
-           624486946, 633295539, 637172784, 431787582, 204742850, 1758781272, 1169442043, 811507986,
-           1920703868, 466747319, 1904279192, 604303818, 1609446676, 1475295657, 1426608253, 847915875,
-           1036215463, 2042028215, 1697496619, 709163925, 463079269, 2131953877, 218942709, 2036256709,
-           65339680, 316554595, 1418468232, 12692331, 582187500, 1700313522, 1874545820, 1206674446,
-           186125413, 364234956, 1638462029, 390868264, 2123016228, 660420424, 1202376250, 1896236448,
-           1127167744, 959171794, 353056618, 589130772, 286983804, 1779664872, 1437046647, 1323199267,
-           1674209439, 987059619, 2032363193, 2137288709, 971529848, 103822254, 2026061770, 1036869528,
-           420376850, 1297046355, 1049561859, 1002564350, 849876229, 776624031, 61755148, 1036001642,
-           1140858988, 1700217177, 1426869906, 1116391568, 213153954, 481762508, 865144369, 1340321698,
-           1440934303, 1218200987, 1929452470, 1727918107, 850382211, 1219015469, 903633726, 377108003,
-           58591440, 788513271, 366913064, 1030121288, 892335526, 245491186, 2066990816, 1312712376,
-           1542537541, 969069027, 167793078, 244930122, 1745693059, 229548226, 1280931765, 739068399,
-           1929765404, 560318023, 1855459967, 2142919358, 1042080532, 573120688, 1335757408, 335531187,
-           1791321676, 1117726230, 2063449294, 494220239, 189258051, 819599372, 871328242, 247849492,
-           1608112644, 1238241306, 1277970780, 352964522, 1483732493, 1197477949, 1665676898, 878786386,
-           19063328, 1833469976, 1123716509, 1764756387, 2063018202, 257164626, 356341138, 1845299958,
-           817482649, 64317458, 1840735668, 1859563181, 637438146, 1029009428, 47610720, 281276174,
-           2146735658, 2111060014, 775496414, 188510062, 783175739, 1646824656, 436359554, 243804735,
-           737582315, 1714330334, 596769257, 73831160, 764324635, 114962507, 952617546, 783387964,
-           1948432483, 2076334055, 400660703, 1863967037, 186015033, 757001842, 1561783348, 1003497683,
-           821319300, 1255035368, 715577216, 1458757446, 136561149, 763187937, 1740033621, 135813159,
-           726764303, 368046387, 324323221, 1509940042, 2014871043, 760682775, 1753744777, 604969710,
-           327529462, 203030386, 678800870, 1091854097, 317992893, 1631418417, 1875242061, 118941728,
-           1560268824, 128419117, 1982908766, 1746283858, 885420959, 1397208466, 602297893, 1706740259,
-           504760186, 1317875109, 1018014057, 641321335, 2081063046, 610564030, 777134495, 660343702,
-           978610417, 1101457716, 22800096, 845997813, 1862140492, 1776544874, 1450967523, 42186306,
-           1979575260, 2129768394, 1134040403, 150084506, 1613703163, 861798817, 269026234, 1026488339,
-           990217934, 104451352, 625288549, 1875638893, 1501659818, 1227586442, 1434895504, 2006420005,
-           397977904, 305425913, 500257692, 331557302, 915989944, 1277392187, 991901004, 1894600361,
-           231366256, 1014701101, 593114526, 2093506748, 643762327, 2044082050, 2135693054, 475853939,
-           2026366796, 1122249809, 625938445, 1492586311, 1984048626, 894964680, 371591002, 826782912,
-           999416032, 996879552, 554938157, 353592203, 76982346, 1989833661, 212528560, 474960250,
-           147775927, 712786252, 806517553, 1063765871, 1990178440, 1798418557, 810882584, 74061048,
-           665636010, 1403997111, 20084148, 1309398337, 1300595513, 8293554, 1785252277, 1179478661,
-           1130543363, 263707074, 524581324, 967108342, 1158671754, 896172326, 1793891254, 10604139,
-           1893051878, 201345764, 364196342, 1970034225, 43695777, 576724902, 297510827, 191471704,
-           1289511154, 1104028380, 1255237575, 1132205946, 754963290, 2066120160, 1206266994, 1420599300,
-           1322633623, 1226351142, 582513990, 475745488, 1234644696, 220282619, 1655224149, 217704412,
-           483989693, 32321825, 1184812754, 1642661448, 928494151, 831220360, 1653265587, 674062382,
-           1032566124, 2017461929, 496612959, 1076261902, 446703183, 794123786, 1267733606, 1736214337,
-           1898152167, 375487534, 720936636, 505631809, 294124046, 1927203630, 1926231109, 1616757669,
-           1006071125, 361261451, 2092503157, 93232173, 581544070, 1600243658, 310936585, 1065533764,
-           1632565483, 1495749339, 560711564, 413575986, 179486052, 66493503, 1087638368, 1212052176,
-           2083955432, 1584251327, 140830430, 383174967, 230891466, 1408564037, 2119389304, 2129043633,
-           1784051571, 692842292, 487191794, 2078175617, 472562275, 265939255, 1547449638, 1478633400,
-           627200707, 1492469147, 1571865573, 1208744777, 945229157, 1882802159, 126794893, 430310992,
-           1231067850, 687506457, 843886978, 1410553902, 753999960, 1931525347, 475122431, 690471744,
-           1368293026, 615952861, 1073646711, 1599184492, 2024516898, 1045552368, 1580744477, 1661084821,
-           1738394660, 2067936271, 1591776790, 63473287, 186391879, 991742780, 1542106687, 813592586,
-           336728279, 966488613, 2022337363, 1281957436, 701807124, 1648609, 1712268428, 1932874974,
-           689155066, 408671759, 1195945229, 1443155027, 192713458, 1671067660, 2133626771, 1561006484,
-           139536873, 1059789835, 1012707329, 16570124, 2105342203, 445968158, 1677654945, 1696253215,
-           366420782, 1121948088, 1759726503, 552812661, 2113690868, 1154349542, 1366405247, 302935500,
-           2120838155, 1241258962, 1584892936, 675161631, 1242907571, 1149677717, 460552958, 1932062638,
-           1558349476, 1656498187, 1227734017, 1751062934, 1180082199, 1213877140, 1164585770, 1319619072,
-           126183327, 29809451, 1336189196, 84041882, 475777610, 866360494, 1780295098, 842198392,
-           1988308582, 1392537953, 1395011053, 1954515802, 399403847, 613932652, 109967654, 372758355,
-           1855191614, 1694860591, 1047919986, 950615538, 697054660, 1508472944, 735194528, 107920488,
-           1017487483, 1962928545, 1858983422, 50086034, 1029322037, 876085544, 1369705107, 1155505365,
-           905894996, 558410655, 1239547247, 1381672606, 1424771149, 872358697, 76387350, 1265596083,
-           117413002, 1471398403, 1072628238, 516816850, 2085331055, 1182595892, 889575205, 1793039021,
-           729972835, 1937495191, 596170911, 1427027495, 1298484488, 1331365439, 1534947983, 168488323,
-           1146810336, 1246447757, 218574358, 28648726, 2122533302, 1588279465, 1184154091, 880944650,
-           2146690120, 276217690, 115133608, 1423977622, 1148576388, 191520958, 542090057, 1265989390,
-           1662919361, 1614718295, 1782806240, 1600766768, 649830540, 524897797, 1246322141, 1379803375,
-           314909341, 1842493053, 659347223, 1613393829, 1026374844, 46811558, 1781882152, 25701533,
-           1293259316, 2000456510, 54350259, 1268308970, 1441252327, 1238504350, 1769972, 1440458800,
-           1514722040, 116903580, 716952774, 515814780, 308424538, 1259042831, 1781804171, 1971343899,
-           726277479, 1417126763, 1424627019, 1376108019, 1942024561, 523465512, 608427746, 109450254,
-           218474917, 1267774969, 1722844083, 1244849762, 1314586528, 1357242587, 1270551295, 460362196,
-           1210215450, 1324901554, 1728671166, 503984129, 415922256, 1730441138, 1944442929, 1930644296,
-           1847344718, 513912055, 298975429, 8285608, 1772954887, 2080779600, 1979629507, 351748718,
-           1350422715, 1256772878, 1727856737, 1144963628, 1780238390, 188800835, 1254413882, 1998713308,
-           1456575805, 829774317, 1096079422, 623678685, 39533257, 219147069, 1084040881, 1249748707,
-           1544048623, 665228399, 1753732836, 1959970879, 248185889, 1550692118, 1743131527, 2095530607,
-           2064604173, 2042106956, 2103816215, 1690075412, 1975402908, 1935962074, 2041824130, 1178341976,
-           1045251304, 1622197219, 175821956, 678006046, 1810998055, 1430235839, 529235706, 1120090212,
-           112526508, 1625315128, 1743768897, 152059765, 1844462197, 680326130, 1401808472, 1241027172,
-           1345554529, 1008057661, 1053514403, 1593740418, 411266131, 649162283, 1541787377, 328386656,
-           543785591, 1498119944, 2018462069, 371704852, 1286598370, 1912802551, 1550046828, 184366026,
-           1387516123, 1725868784, 862372072, 1051030530, 1008620975, 1391607779, 23637094, 1121147484,
-           869439259, 1767405991, 1273207249, 566417809, 300248473, 527532074, 1807444981, 1645803002,
-           1535589735, 713475737, 1092059772, 1946855866, 1362638020, 486363501, 127758874, 1906423611,
-           1984483445, 2146220943, 130644815, 1123598167, 1911539847, 1680691643, 1307964193, 1151572322,
-           1259076780, 22852617, 55119204, 120214107, 1414460396, 78756298, 1241361591, 136416008,
-           1846162289, 367085193, 702833817, 2146410762, 894617267, 362795150, 1644730116, 282723354,
-           1076270887, 589306240, 82095572, 291425259, 1075669741, 209854446, 50365223, 912669538,
-           208591742, 181010038, 2036267705, 2120131589, 1861701682, 1196748250, 1124220263, 973294814,
-           1219600867, 1179339467, 1093508921, 486577616, 1258095765, 187386865, 622993624, 956774406,
-           554472058, 1325827441, 955701520, 1449089325, 1688622591, 452947988, 1731812679, 617409831,
-           1042254228, 1813908251, 908835090, 2117923969, 2023762697, 959200313, 883109859, 84870791,
-           1140210352, 771893916, 57518732, 854428386, 1968642166, 1181738995, 1827723200, 1040759385,
-           213594814, 773748473, 1527337001, 1471690579, 961135338, 2846977, 280981337, 1515607396,
-           1328674418, 1236682857, 817213073, 869813362, 1689630845, 401542104, 1487223193, 584401425,
-           67966707, 248574635, 554841746, 2091729405, 1207774949, 1437951605, 29116548, 200501653,
-           62361873, 86635281, 1054930039, 2031004039, 1268374276, 735169591, 924279777, 1481969091,
-           1508918064, 304133130, 806176022, 322569755, 306980108, 1087157360, 1838177151, 1635654526,
-           176356569, 507906577, 357984240, 1865987415, 909448681, 1845207433, 302905192, 977415389,
-           2093782069, 857746939, 921661146, 1154073370, 148214896, 950777694, 1354575023, 210576770,
-           1037412975, 262021414, 94097161, 158303604, 997191005, 1018376938, 1640272695, 358625421,
-           1322510069, 298965069, 681195176, 1629490177, 1386122429, 371888680, 1117661055, 1562478999,
-           879795257, 1475645296, 1280982766, 1789243938, 1173369081, 1583887958, 619175679, 1119667502,
-           294151249, 1540836825, 126257224, 442366146, 344130872, 1480832247, 652942916, 1381543847,
-           1742853661, 747040077, 1539847451, 592561018, 1765417016, 1032636498, 951186440, 940443437,
-           1331601568, 1632381616, 422449966, 570240349, 2004270296, 1540111021, 2132719348, 736581905,
-           868272669, 1266218466, 378342196, 2041641751, 702622777, 997517875, 1013825605, 996774026,
-           390871053, 1140082830, 1439140172, 735001925, 473431429, 2092083088, 2116545772, 68801443,
-           691639518, 1508909576, 661362461, 309572886, 394062426, 1612548901, 1250016323, 1725663994,
-           1097446870, 1672466289, 148420696, 954233518, 1065093662, 133656396, 1690815424, 1933366332,
-           1399874863, 2069157620, 1827524435, 2102497640, 919191847, 693866392, 951788018, 1310062900,
-           1833949222, 243444543, 2045064825, 159897004, 188043983, 2014126950, 228698447, 879683501,
-           1375552878, 890060908, 1189256387, 1769615304, 355126162, 291789062, 1347795651, 1452573032,
-           1964255351, 1496216347, 259322902, 881865366, 1629872743, 1950138326, 667748050, 882263958,
-           1871812298, 347788837, 837277950, 643520498, 1041655229, 1789065969, 1953583398, 728120804,
-           2032510512, 1851164576, 888017808, 73070847, 1717807878, 1116716255, 952754349, 945877108,
-           2006777163, 2142010736, 568008764, 214419677, 286316151, 1915804415, 1666992709, 103087854,
-           1264537114, 1926315612, 984953220, 746926210, 1728970290, 1652701270, 1629190168, 1453298941,
-           2000490107, 318984471, 2096819439, 894661689, 2108050440, 1902919189, 1622782493, 1993077304,
-           1606600117, 363316653, 2066148151, 1176924347, 1480032908, 871418852, 2122801455, 1339326423,
-           865945941, 543326572, 1553746101, 1152262092, 311647339, 1073255162, 1255349946, 1576184454,
-           852087126, 92819519, 175627016, 433573769, 1745520789, 1804817184, 1886872710, 1598527249,
-           2123801655, 1836208501, 345705290, 2084368447, 1591644042, 1968487783, 1929962103, 1050760512,
-           184320788, 1848626607, 80201211, 1664353696, 572561811, 55519019, 856196471, 1438507752,
-           598845591, 262458924, 443286196, 910492930, 1335714087, 1698636143, 339193736, 40317565,
-           1791455662, 514820752, 473891334, 1389492803, 172154289, 213280396, 840536404, 148472296,
-           2049488897, 1186241694, 85357096, 1493649292, 1007245829, 2015319199, 396926156, 1191566617,
-           1716462158, 477127367, 708436665, 141540322, 532646386, 1564633137, 1580048074, 1131491977,
-           1827092061, 2023334271, 2041984908, 1015322500, 1574486766, 233694996, 1055640066, 1218458780,
-           748515749, 1529531400, 460467935, 920670038, 1742811797, 1301004340, 1069142334, 1644817046,
-           339762386, 1154499430, 990982690, 1347008216, 1022334982, 1387908846, 391091185, 591313492,
-           1865036214, 1099527851, 732853814, 250198952, 516677340, 165418241, 1381690930, 196285753,
-           41268864, 1276192190, 1211608254, 1615755630, 1509887186, 119764672, 686730762, 110919287,
-           1649296072, 1147198697, 1031589325, 1244624221, 300719389, 2100731660, 741957620, 640481776,
-           1107747442, 1732940310, 1987489992, 2130082424, 973365509, 231097529, 573912269, 690918075,
-           1330625380, 1306766083, 941117027, 1847302720, 1472184324, 175324309, 2043588474, 1513453188,
-           1451516499, 1107713080, 981725170, 813920038, 1227477752, 1668455932, 924839325, 729290176,
-           668170982, 1956428651, 1973914398, 968890371, 1909676663, 568388370, 1609372147, 869940457,
-           153845032, 1449378491, 852539234, 1127210541, 1680476021, 1426451503, 1818128616, 863617753,
-           585733938, 611761996, 563436826, 2057918263, 787086305, 459541652, 1423887803, 91119157,
-           1567254732, 258129326, 905039195, 647248836, 1926585258, 1829878520, 1376539012, 447272592,
-           1638823523, 1202969762, 1416162964, 1401016538, 1771358132, 878051463, 123473348, 1925203165,
-           179946307, 976012582, 904930058, 1860422328, 254980437, 575575027, 576556433, 840714375,
-           1187337023, 1139993259, 751148990, 1974423328, 1599534911, 27553146, 2065542485, 1019305995,
-           285682472, 823098032, 1666554831, 64784082, 505492905, 895610196, 512056675, 2144316428,
-           2098579958, 1928219639, 1397849319, 1722454443, 658787454, 1521322667, 1500173960, 838733761,
-           349851601, 257620370, 551672441, 604832038, 833195397, 1128228875, 1445546413, 2020532420,
-           120738486, 49211756, 1847472101, 1720273398, 76764902, 1765530938, 592095745, 362447374,
-           441145323, 111166929, 427231456, 946638228, 1006777125, 939288131, 943471008, 957873435,
-           720024122, 193836679, 532844230, 1378811577, 1715159346, 2033018190, 70061690, 2065010947,
-           143154913, 621734132, 522359337, 976350310, 1749963007, 1967905751, 849399083, 1870701493,
-           2017117507, 549387536, 1443491243, 2093882409, 167434826, 2035586989, 308846135, 608580149,
-           2146753918, 736077591, 1555218377, 1006047395, 1675365723, 351205738, 1963920830, 247906197,
-           545042417, 349281413, 1626717774, 112718116, 234815955, 1696779465, 30245415, 377970868,
-           171029949, 552604753, 1354321179, 1920992956, 373026856, 56236614, 1644210801, 242660715,
-           605624150, 940218397, 189059476, 773058976, 828321738, 497905611, 1381639126, 827592008,
-           1233983202, 789373855, 1833639403, 761865277, 1140579593, 1650076585, 1009771475, 1685622011,
-           1999357998, 489005601, 1798340127, 86690306, 38301418, 1828585542, 464661174, 209331367,
-           233706647, 1818982353, 2130324323, 606733503, 1875218967, 1627051477, 849394218, 333359469,
-           419786226, 1038453694, 1106418446, 1248107964, 1536359305, 340573924, 2075699972, 622858860,
-           1129947779, 1761855727, 1384724137, 123043725, 1264448664, 247011964, 1808665736, 1116323015,
-           736017566, 1459522215, 1203013321, 774318984, 1140624109, 1667674495, 983650352, 1374330757,
-           1339173201, 966491027, 1981064260, 1066908520, 446058856, 682974831, 1400267990, 865845082,
-           1721428525, 359202788, 2113953046, 1110304183, 699776712, 2042169370, 1733163043, 1829724491,
-           1656541449, 970403532, 1952768216, 773506466, 1217415497, 1613950304, 1889829481, 1953433063,
-           925988871, 945359154, 580268399, 2066612981, 465550001, 1563918751, 1293460090, 1804723202,
-           382926131, 1127040702, 724148075, 828984987, 1810015533, 2124416065, 1694830070, 1383960411,
-           336135205, 1661299468, 346780946, 1035911917, 1555985191, 2079943989, 718152760, 1065042992,
-           902863873, 523437329, 1838549458, 2120279370, 2137387633, 1580895291, 1926228785, 915892857,
-           378770797, 359013537, 835022190, 844320799, 1922932288, 2128482280, 501560353, 158374771,
-           1108039334, 1225708428, 987359759, 770571220, 1202640845, 534706181, 7047983, 1538776050,
-           48522001, 353828929, 427204319, 1604507192, 286289270, 1145357080, 522066537, 1189153143,
-           1668794409, 213132347, 1161948866, 1658698394, 1794027639, 940694003, 427107603, 25314788,
-           1299707540, 1262129793, 869635587, 1075156181, 1243128425, 1371195941, 1233530952, 203684112,
-           449420721, 73407063, 974255332, 1652061567, 608113244, 981303315, 1043353969, 656635246,
-           1335132244, 1470558289, 113658790, 1621421514, 468431721, 635725327, 663091009, 2137226130,
-           848857675, 1825039875, 1648440876, 495401666, 618250231, 2075548480, 520716454, 1917957771,
-           1190194625, 1390352042, 845630304, 285839403, 614064335, 2079161257, 489523515, 1063485056,
-           5084672, 1463778847, 568062975, 613197917, 297598514, 1611416945, 1269833163, 1632730758,
-           934491586, 1383491953, 1106668624, 1402923307, 2019217281, 1769759633, 1392665789, 720591308,
-           1447315861, 893623017, 1215992974, 2065566092, 821687849, 1736709428, 1836040215, 2011882475,
-           979577822, 534186872, 150238230, 1593642157, 465864481, 639761745, 509643566, 470949153,
-           2103540592, 1077706541, 1084147070, 253655458, 541639838, 206496585, 1886386216, 1476131424,
-           1589988539, 845571192, 731571083, 1461722172, 467847177, 2124236872, 34829832, 1915163038,
-           870376242, 1250822806, 1833245482, 1692064091, 840048586, 1521802050, 1556462918, 1819626409,
-           2055988922, 1706701148, 1265784918, 374369755, 198979245, 1775428484, 845318908, 155036189,
-           705651378, 1929465979, 408691647, 1247291216, 2135962564, 147594215, 575938993, 1578467455,
-           993165407, 1307510076, 892705979, 1461012585, 1284263301, 927535811, 1228691975, 7155895,
-           30874969, 914453810, 1699219986, 870923556, 288772212, 1108199257, 543066317, 197277486,
-           667416757, 1808851235, 571647241, 866396003, 1436796072, 1416966149, 1021432192, 2142447450,
-           1198948480, 1430123840, 1242255018, 1187427397, 1577718055, 1818194011, 618411204, 423399815,
-           978220440, 1511117184, 1884412400, 115000093, 291169347, 965620727, 122155988, 322044317,
-           1880074537, 1821375974, 1192967873, 21363101, 782091583, 1736034190, 218640587, 1449508341,
-           1397401777, 790287828, 168420696, 686714201, 59770330, 1189852888, 681678003, 1258718810,
-           472493080, 1923933022, 298662559, 2050211136, 1594643385, 917073764, 326127303, 425380177,
-           280707300, 63056055, 540380270, 571876647, 1028676782, 662536258, 893920964, 761267672,
-           336428585, 2086888837, 782630773, 1118520168, 1675439379, 1001271361, 420544861, 925357509,
-           1791559189, 588965557, 1612071710, 1851329519, 1778818446, 146266066, 962564682, 103827878,
-           2070199088, 1261227241, 6555366, 1517358825, 30817357, 332682669, 1942739003, 311524657,
-           395738724, 335635625, 883401305, 1424415507, 998171884, 1777322269, 38199531, 1334600469,
-           1716727459, 820830304, 305636989, 1244683190, 1822101665, 726181851, 22557051, 1466177207,
-           1315147408, 1634628762, 1170023078, 946482206, 1780894828, 2132587760, 1050310085, 1703610268,
-           1246331354, 1056865451, 1073485445, 1277148711, 1389548121, 868740800, 1588673369, 1785286845,
-           1204376426, 324591026, 1062218704, 55064662, 2101913295, 1100418235, 1389665131, 1671157106,
-           1921248540, 1695302120, 768356649, 1595866557, 274000323, 790913700, 914560116, 1589147732,
-           278058814, 2084583195, 388146290, 2058953642, 2069687307, 1438456375, 1615080262, 1168535013,
-           347838179, 541082060, 298200077, 1737386300, 1409822860, 1886873446, 1375189497, 466715638,
-           63980824, 289924554, 521780300, 18410471, 1390342789, 1911445431, 1689567578, 1164107681,
-           1459263904, 310440579, 612490591, 1733264227, 1101354279, 1527050707, 1174928311, 1379413094,
-           1464150254, 1563074602, 1290883088, 1386353914, 854047329, 758479703, 407405279, 1201885508,
-           1299561763, 705605356, 791788160, 561900975, 444995154, 19494010, 1028616614, 508975978,
-           309418564, 1550396914, 527386450, 1699761353, 1314358698, 69470380, 716385387, 626138954,
-           379910959, 1328875978, 211919533, 1481265238, 708443037, 1386847845, 713194684, 25109644,
-           802438799, 2004077773, 1411463558, 1656486128, 615073828, 1818868837, 710887989, 1914635591,
-           376990546, 1502676149, 329052918, 821985700, 1522170159, 1357669532, 1330961679, 1831588723,
-           760582799, 1858348129, 1383866429, 2074941497, 1927818509, 2100251816, 553596803, 160245820,
-           1281644146, 765516336, 1641511058, 1990087183, 4880533, 207222095, 2015196827, 807319332,
-           63816220, 1279176737, 316321813, 678890048, 950561927, 1027209802, 446041991, 1327552473,
-           382402303, 775094909, 2054525, 1904572463, 2132764442, 1333016204, 1588677538, 745863593,
-           1043880685, 825060319, 673321442, 824215546, 777828487, 1226918245, 984461366, 2059472633,
-           1992434581, 478488777, 1902076169, 1997315115, 685710872, 1769789348, 657150799, 749527092,
-           901482438, 973472612, 1428417140, 1852044365, 2000682414, 1874459131, 1032113190, 235601070,
-           502070392, 1034167715, 2140173533, 487351186, 219700272, 1581367423, 1233214779, 1263580957,
-           258944095, 1906536221, 2087796504, 1036772582, 985970818, 924774222, 948761568, 830921752,
-           1403262999, 703354089, 680753219, 2088973871, 325659789, 1337904018, 691017315, 1227142227,
-           163892983, 2119434455, 931702944, 17091749, 1846409938, 1963816134, 252692819, 200996683,
-           850500202, 245382704, 688347869, 1070200474, 1826750128, 1921562649, 186297783, 2085694223,
-           1680615222, 126610639, 974983157, 519102393, 1051384862, 1923744725, 1350024145, 307164213,
-           479615166, 2030777364, 248654437, 805274956, 1221197734, 939671752, 2032417183, 1385090717,
-           911622560, 816636480, 1402182467, 610548850, 632968966, 1654875286, 811545533, 1483469168,
-           1900257991, 1499893403, 406185994, 1579524471, 1273972404, 592483778, 1517735046, 807103978,
-           719094417, 345234555, 1326206371, 1770479279, 121495633, 528746868, 2077643493, 601110799,
-           412040584, 178814282, 1406385755, 1633238319, 1118486034, 1291319291, 870845388, 2030108594,
-           2107955771, 125544207, 493173797, 593441089, 1780419494, 1304719330, 2076910258, 1533193837,
-           657129085, 335612604, 965234660, 1931101489, 928096382, 335486058, 590721820, 1647190800,
-           680720613, 1916928191, 1270186431, 802216246, 298191412, 1200346276, 1403327046, 710231996,
-           1379160558, 662229153, 195986667, 350162945, 1953548444, 1066832056, 232787891, 1914020567,
-           1192376263, 725961688, 359978009, 825312109, 2030681019, 289404619, 211022298, 540326456,
-           625017223, 1176256958, 323944298, 1553113606, 1511743016, 914666118, 1052820758, 44979982,
-           684110661, 175523541, 847196228, 982302073, 1375869818, 103039626, 1692534070, 607546728,
-           765268780, 1888520737, 957709673, 571333576, 807869145, 1190497565, 337870496, 2000245409,
-           1916459253, 697848505, 678073870, 1799656624, 987253124, 889096169, 192499433, 1612270347,
-           2065353127, 516443731, 1017900305, 1429612496, 1431109849, 2070721063, 1474592478, 2115220510,
-           98760957, 174305058, 950038936, 1474630775, 277344685, 495089358, 2082177503, 1042613465,
-           236126447, 892403529, 1613947041, 1043995593, 2082901094, 1951817537, 896757354, 1851876699,
-           502182394, 1574831224, 1504049676, 1489435518, 316443745, 1696549109, 954222218, 234313225,
-           65509192, 1972122523, 1663925721, 1496619041, 1895359939, 991034551, 1464355903, 1994120896,
-           1165339609, 266911191, 1321268023, 1442684294, 762000549, 1255961878, 337814111, 998126997,
-           881759, 1951761153, 2042122590, 2083782853, 1756095042, 791396296, 1788175905, 110793789,
-           218743872, 1144741933, 1600229307, 535187618, 693807394, 406967877, 769500843, 759316586,
-           231606753, 285942916, 108451979, 2126966692, 1276977467, 1572807882, 1973603940, 294833428,
-           1839719074, 1147388315, 1737517723, 454235975, 255866545, 2075331834, 1452362972, 256748305,
-           1879609339, 1347001914, 193047510, 1488220734, 2138398210, 1981223415, 1599014523, 209658435,
-           978481700, 1051760182, 744846053, 1672289094, 1458728060, 1514346896, 284122032, 1690334813,
-           1800289812, 392574011, 1669817857, 929783631, 1965381894, 1495938149, 1224617059, 1657617320,
-           495842816, 814651134, 2111853295, 751709361, 742499321, 1416732620, 1008457666, 474625012,
-           616250886, 1201505177, 1962845746, 607165449, 1035244944, 1414376621, 816823884, 2013726645,
-           318653156, 1561669937, 1538532091, 1777381216, 928533185, 1822654124, 1320232381, 581339349,
-           67744487, 842566590, 1511122980, 2033126381, 191021091, 588256391, 1543260053, 686863907,
-           1402907526, 1507629701, 1438573268, 2145406847, 776878673, 299547287, 472548211, 1393129559,
-           1501052464, 287910310, 2000295008, 388813760, 1702286931, 669635244, 255056757, 2020940087,
-           83821533, 1793588849, 1650837655, 1012354718, 1468759325, 823586388, 1593694067, 1536503812,
-           1666152978, 957333399, 1422146546, 1857174069, 1545589791, 817922951, 396554328, 801013669,
-           178069004, 1835127597, 798936868, 954947677, 2134674884, 1271485079, 200593589, 1488243700,
-           1559395389, 53404949, 1877057460, 1114198673, 723040194, 2132114218, 987655112, 806861727,
-           1778219419, 491009120, 1819216446, 1099495096, 1314595508, 1265426865, 488515260, 833264839,
-           75276617, 1910661806, 542955260, 1620866408, 581101110, 939509589, 274396429, 759170114,
-           627153538, 1073333297, 1714117792, 614344774, 197334728, 1914711381, 2102588474, 1756730118,
-           1968116330, 1832162286, 723445143, 543672876, 1816792856, 1711100255, 1350534604, 1447528627,
-           54625727, 1022267402, 399540075, 1369221236, 140210619, 888055336, 55002427, 215487236,
-           651233494, 597957687, 1836353644, 1232334604, 1537467276, 2110750073, 1991504719, 17137166,
-           1036599722, 1558138863, 631481940, 1233934451, 1325366596, 586586766, 843180921, 1145999278,
-           271265405, 1566626064, 1689672155, 2088058261, 1130242671, 892723111, 1388103241, 1184868399,
-           1914990513, 1787643316, 406605987, 2055201132, 528215004, 461608414, 123204721, 1179448499,
-           1059566101, 1959558365, 264299455, 449549730, 1922824791, 108320526, 466686896, 811940865,
-           1666459389, 1098168837, 2045875316, 844342337, 1684755603, 741572589, 1990341616, 1956021008,
-           160715005, 1532530123, 1896595622, 1290957677, 277769586, 1137215215, 328342428, 45276451,
-           777374883, 734948415, 2100477583, 1305589888, 1196556829, 76198656, 337554739, 108639282,
-           2035757022, 601854194, 558189012, 1811098165, 710174721, 1024875909, 475555382, 229150462,
-           2123044746, 373947051, 1073492800, 1660316701, 1115519640, 916350768, 1468854062, 1276234646,
-           301397243, 1217966036, 419708675, 579166829, 207697603, 748051103, 624443280, 985072486,
-           1482999518, 577437215, 143178726, 532072699, 653635872, 480733465, 640711981, 541909246,
-           1082587660, 1198900994, 205523763, 1792762381, 76293255, 681079145, 2021912843, 51854353,
-           1055026196, 947921995, 1712171054, 23062189, 1864272763, 1033541468, 1299296835, 18186358,
-           104023856, 1719005510, 597353187, 311721459, 319572965, 1221796467, 1296793946, 1802572483,
-           1799233683, 1439972672, 187161534, 305385907, 1920706138, 827873515, 847295153, 855810150,
-           2026774509, 1052818916, 501088883, 2103067764, 1733898061, 375518078, 7438469, 641440610,
-           1323440074, 1719609524, 664502799, 1040229189, 605667344, 1963799634, 1058415548, 709691201,
-           1535321496, 1655768735, 1021412660, 1854894461, 730081555, 170722958, 1509983296, 381831590,
-           1610695631, 1697144830, 687217497, 1383918121, 377534697, 1534512650, 92244623, 256825559,
-           439847918, 593333506, 212409675, 26262331, 968851584, 219848145, 667702941, 144808010,
-           1939457669, 1332205740, 1185037200, 397641365, 1148521726, 95969100, 1107332566, 536359574,
-           1751737835, 2128745227, 243770387, 334335742, 151984537, 1753753683, 716167332, 1762680168,
-           1303414865, 1403384829, 999114641, 1680949563, 790413831, 1091359264, 1937775122, 1230261749,
-           1684692770, 2701149, 1256524081, 506060707, 222549294, 1924227022, 650868717, 14523315,
-           1108949115, 1835905917, 412164681, 109987193, 1931875017, 1519497247, 646346768, 1536129205,
-           1500758826, 890117155, 1870464947, 1652743364, 496387191, 439148632, 1267939884, 1799802056,
-           1842533461, 119570878, 1333267971, 485463645, 1210930142, 1123559445, 1715725394, 748139265,
-           1126260595, 824765827, 1254199972, 1348809889, 601509202, 1905068689, 1363333205, 1710458317,
-           1593490959, 1775497886, 1820445510, 1377882328, 1147511485, 319308630, 766527885, 500786664,
-           1209425786, 489509185, 6046380, 1705812977, 928657817, 1273986264, 1358131385, 623707630,
-           1393557142, 543915709, 1109171275, 457003637, 1667475154, 677413022, 1205142902, 646252101,
-           1502178849, 311859226, 1995061991, 2103688051, 69444267, 1210911548, 1666662720, 1662935226,
-           838925786, 1339624583]
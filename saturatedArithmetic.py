@@ -0,0 +1,140 @@
+import math
+
+# | Arithmetic on saturated numbers. Each function takes operands which
+# | are within the saturated range and returns the result clamped to
+# | it, detecting overflow early so that no operation ever has to
+# | build an integer larger than the range itself.
+
+# | The number of values product() multiplies at once before checking whether the result's saturated.
+PRODUCT_CHUNK = 64
+
+# | saturate()
+# |-------------------------------------------------------
+# | Returns the value clamped to the saturated range.
+# |-----------------------------------------------
+def saturate(value, saturation):
+    if value > saturation:
+        return saturation
+    elif value < -saturation - 1:
+        return -saturation - 1
+    else:
+        return value
+
+# | add()
+# |--------------------------------------
+# | Returns the saturated sum of a and b.
+# |----------------------------------
+def add(a, b, saturation):
+    return saturate(a + b, saturation)
+
+# | subtract()
+# |---------------------------------------------
+# | Returns the saturated result of a minus b.
+# |-----------------------------------------
+def subtract(a, b, saturation):
+    return saturate(a - b, saturation)
+
+# | multiply()
+# |---------------------------------------------------------------
+# | Returns the saturated product of a and b, checking whether the
+# | product would overflow before multiplying.
+# |--------------------------------------
+def multiply(a, b, saturation):
+    if a == 0 or b == 0:
+        return 0
+
+    negative = (a < 0) != (b < 0)
+
+    # | A negative product may reach one further than a positive one.
+    if negative:
+        if abs(a) > (saturation + 1) // abs(b):
+            return -saturation - 1
+    elif abs(a) > saturation // abs(b):
+        return saturation
+
+    return a * b
+
+# | divide()
+# |-----------------------------------------------------------------
+# | Returns the saturated result of a divided by (non-zero) b,
+# | truncated towards 0 as integer division is in C.
+# |-------------------------------------------
+def divide(a, b, saturation):
+    result = abs(a) // abs(b)
+
+    if (a < 0) != (b < 0):
+        result = -result
+
+    return saturate(result, saturation)
+
+# | mod()
+# |---------------------------------------------------------------
+# | Returns a mod b, which is always within the saturated range.
+# | b mustn't be 0, which the caller reports as an error.
+# |------------------------------------------------------
+def mod(a, b, saturation):
+    return a % b
+
+# | power()
+# |-----------------------------------------------------------------------
+# | Raises the base to the (non-negative) exponent using exponentiation
+# | by squaring, stopping as soon as the result is known to saturate.
+# |--------------------------------------------------------------
+def power(base, exponent, saturation):
+    if base in (0, 1) or exponent == 0:
+        return base ** exponent
+
+    if base == -1:
+        return -1 if exponent % 2 else 1
+
+    # | With a base of magnitude 2 or more, the magnitude only grows. Once it's beyond the saturated
+    # | range, the result saturates in the direction of its sign.
+    negative = base < 0 and exponent % 2 == 1
+    limit = saturation + 1
+
+    result = 1
+    square = abs(base)
+
+    while True:
+        if exponent & 1:
+            result *= square
+
+            if result > limit:
+                break
+
+        exponent >>= 1
+
+        if exponent == 0:
+            return saturate(-result if negative else result, saturation)
+
+        square *= square
+
+        if square > limit:
+            break
+
+    return -saturation - 1 if negative else saturation
+
+# | product()
+# |---------------------------------------------------------------------
+# | Returns the saturated product of a sequence of values. The values
+# | are multiplied a chunk at a time, stopping once the result is
+# | beyond the saturated range, as with no zeros among them its
+# | magnitude can then only grow.
+# |-------------------------------------------
+def product(values, saturation):
+    if 0 in values:
+        return 0
+
+    # | The sign of the result is known up front from the number of negative values.
+    negative = sum(map((0).__gt__, values)) % 2 == 1
+    limit = saturation + 1
+
+    result = 1
+
+    for start in range(0, len(values), PRODUCT_CHUNK):
+        result *= math.prod(values[start:start + PRODUCT_CHUNK])
+
+        if abs(result) > limit:
+            return -saturation - 1 if negative else saturation
+
+    return saturate(result, saturation)
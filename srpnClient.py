@@ -0,0 +1,89 @@
+import os
+import socket
+import sys
+import threading
+
+# | The size of the chunks input is sent in, and output's read in.
+BUFFER_SIZE = 1 << 16
+
+# | srpnClient.py
+# | A thin client for a warm SRPNServer listening on a Unix domain socket, started with
+# | "python SRPNServer.py --unix". It imports nothing of the calculator, so starts far faster
+# | than main.py, and runs stdin through a session on the server as main.py would run it.
+# | If the server isn't running, stdin's a terminal or any arguments are given, main.py is
+# | run in its place, so the client can always stand in for it.
+# | Run with: python srpnClient.py < script
+
+# | defaultSocketPath()
+# |-----------------------------------------------------------------
+# | Returns the path of the socket in SRPN_SOCKET, or else one in the
+# | temporary directory which is the user's own.
+# |-------------------------------------------
+def defaultSocketPath():
+    path = os.environ.get("SRPN_SOCKET")
+
+    if path:
+        return path
+
+    return os.path.join(os.environ.get("TMPDIR", "/tmp"), "srpn-" + str(os.getuid()) + ".sock")
+
+# | sendInput()
+# |----------------------------------------------------------------------
+# | Sends everything on stdin to the server, then shuts down the sending
+# | side so the server sees the input end. The server may close the
+# | connection first, on a '£', in which case the rest is dropped.
+# |-------------------------------------------------------
+def sendInput(connection):
+    try:
+        for chunk in iter(lambda: os.read(0, BUFFER_SIZE), b""):
+            connection.sendall(chunk)
+
+        connection.shutdown(socket.SHUT_WR)
+
+    except OSError:
+        pass
+
+# | runRemote()
+# |----------------------------------------------------------------------
+# | Runs stdin through a session on the server, copying its output to
+# | stdout. Input's sent from another thread, as the server won't read
+# | more of it than it's sent output for. Returns the exit code.
+# |-----------------------------------------------------
+def runRemote(connection):
+    sender = threading.Thread(target=sendInput, args=(connection,), daemon=True)
+    sender.start()
+
+    for chunk in iter(lambda: connection.recv(BUFFER_SIZE), b""):
+        os.write(1, chunk)
+
+    return 0
+
+# | runLocal()
+# |-------------------------------------------------------------
+# | Replaces this process with main.py, given the same arguments.
+# |---------------------------------------------------------
+def runLocal(arguments):
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "main.py")
+    os.execv(sys.executable, [sys.executable, script] + arguments)
+
+# | main()
+# |-----------------------------------------------------------------
+# | Runs stdin on the server if it can, otherwise runs main.py.
+# |-----------------------------------------------------------
+def main(arguments):
+    if arguments or os.isatty(0):
+        runLocal(arguments)
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        connection.connect(defaultSocketPath())
+    except OSError:
+        connection.close()
+        runLocal(arguments)
+
+    with connection:
+        return runRemote(connection)
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))